@@ -0,0 +1,71 @@
+import operator
+from itertools import chain
+
+from liable import (annotator,
+                    formatting,
+                    generation,
+                    namespaces,
+                    parameters,
+                    strategies,
+                    strings)
+
+from .utils import (DIMENSIONS,
+                    SIZES,
+                    Package)
+
+
+class HotPaths:
+    """Measures functions which dominate generation separately."""
+    params = [DIMENSIONS, SIZES]
+    param_names = ['dimension', 'size']
+
+    def setup(self, dimension: str, size: int) -> None:
+        self.package = Package(dimension, size)
+        modules_paths = self.package.modules_paths
+        modules_namespaces = list(
+                generation.modules_paths_to_namespaces(modules_paths))
+        self.namespace = namespaces.merge(namespaces.built_ins(),
+                                          *modules_namespaces)
+        self.objects = list(chain.from_iterable(
+                namespace.values() for namespace in modules_namespaces))
+        modules_functions = list(chain.from_iterable(
+                map(namespaces.inner_functions, modules_namespaces)))
+        self.raw_annotations = list(chain.from_iterable(
+                function.__annotations__.values()
+                for function in modules_functions))
+        self.parameters = list(parameters.from_functions(modules_functions))
+        self.names = list(map(operator.attrgetter('name'), self.parameters))
+        self.sources = []
+        for module_path in modules_paths:
+            with open(module_path) as module_file:
+                self.sources.append(module_file.read())
+
+    def teardown(self, dimension: str, size: int) -> None:
+        self.package.remove()
+
+    def time_search_path(self, dimension: str, size: int) -> None:
+        for object_ in self.objects:
+            namespaces.search_path(object_,
+                                   namespace=self.namespace)
+
+    def time_to_annotation(self, dimension: str, size: int) -> None:
+        annotator.utils.interned.clear()
+        for raw_annotation in self.raw_annotations:
+            annotator.utils.to_annotation(raw_annotation)
+
+    def time_to_template(self, dimension: str, size: int) -> None:
+        strategies.clear_templates_cache()
+        for parameter in self.parameters:
+            strategies.to_template(parameter.annotation)
+
+    def time_to_plurals(self, dimension: str, size: int) -> None:
+        strings.to_plurals.cache_clear()
+        strings.to_plural.cache_clear()
+        for name in self.names:
+            strings.to_plurals(name,
+                               target_case=strings.Case.snake)
+
+    def time_fix_code(self, dimension: str, size: int) -> None:
+        formatting.cache.clear()
+        for source in self.sources:
+            formatting.fix_code(source)
@@ -0,0 +1,73 @@
+from click.testing import CliRunner
+
+from liable.liable import main
+
+from .utils import (DIMENSIONS,
+                    SIZES,
+                    Package,
+                    reset_caches,
+                    to_arguments)
+
+
+class Pipeline:
+    """Runs ``liable`` commands end to end on synthetic packages."""
+    params = [DIMENSIONS, SIZES]
+    param_names = ['dimension', 'size']
+    timeout = 600
+
+    def setup(self, dimension: str, size: int) -> None:
+        self.package = Package(dimension, size)
+        self.utilities_directory = self.package.make_directory()
+        self.tests_directory = self.package.make_directory()
+        self.all_directory = self.package.make_directory()
+        self.runner = CliRunner()
+
+    def teardown(self, dimension: str, size: int) -> None:
+        self.package.remove()
+
+    def run(self, *arguments: str) -> None:
+        reset_caches()
+        self.runner.invoke(main, arguments,
+                           catch_exceptions=False)
+
+    def search_modules(self) -> None:
+        self.run('modules', '-r', self.package.package_directory)
+
+    def generate_utilities(self) -> None:
+        self.run('utilities',
+                 *to_arguments(self.package.modules_paths,
+                               target_directory=self.utilities_directory))
+
+    def generate_tests(self) -> None:
+        self.run('tests',
+                 *to_arguments(self.package.modules_paths,
+                               target_directory=self.tests_directory))
+
+    def generate_all(self) -> None:
+        self.run('all',
+                 *to_arguments(self.package.modules_paths,
+                               target_directory=self.all_directory))
+
+    def time_search_modules(self, dimension: str, size: int) -> None:
+        self.search_modules()
+
+    def time_generate_utilities(self, dimension: str, size: int) -> None:
+        self.generate_utilities()
+
+    def time_generate_tests(self, dimension: str, size: int) -> None:
+        self.generate_tests()
+
+    def time_generate_all(self, dimension: str, size: int) -> None:
+        self.generate_all()
+
+    def peakmem_search_modules(self, dimension: str, size: int) -> None:
+        self.search_modules()
+
+    def peakmem_generate_utilities(self, dimension: str, size: int) -> None:
+        self.generate_utilities()
+
+    def peakmem_generate_tests(self, dimension: str, size: int) -> None:
+        self.generate_tests()
+
+    def peakmem_generate_all(self, dimension: str, size: int) -> None:
+        self.generate_all()
@@ -0,0 +1,113 @@
+import os
+from typing import (Iterator,
+                    List)
+
+PACKAGE_NAME = 'synthetic'
+MODULE_NAME_TEMPLATE = 'module_{index}'
+CLASS_NAME_TEMPLATE = 'Model{index}'
+FUNCTION_NAME_TEMPLATE = 'function_{index}'
+# alternating containers annotations are nested with
+CONTAINERS_TEMPLATES = ['List[{annotation}]',
+                        'Dict[str, {annotation}]']
+
+
+def generate(directory: str,
+             *,
+             modules_count: int,
+             functions_count: int,
+             nesting_depth: int,
+             imports_count: int) -> List[str]:
+    """
+    Writes package with given number of modules
+    each of which defines a class
+    & functions annotated with classes of ``imports_count`` previous modules
+    nested in containers ``nesting_depth`` times.
+
+    Returns paths of package modules.
+    """
+    package_directory = os.path.join(directory, PACKAGE_NAME)
+    os.makedirs(package_directory,
+                exist_ok=True)
+    init_module_path = os.path.join(package_directory, '__init__.py')
+    open(init_module_path, mode='w').close()
+    result = [init_module_path]
+    for index in range(modules_count):
+        source = module_source(index,
+                               functions_count=functions_count,
+                               nesting_depth=nesting_depth,
+                               imports_count=imports_count)
+        module_path = os.path.join(package_directory,
+                                   MODULE_NAME_TEMPLATE.format(index=index)
+                                   + '.py')
+        with open(module_path, mode='w') as module_file:
+            module_file.write(source)
+        result.append(module_path)
+    return result
+
+
+def module_source(index: int,
+                  *,
+                  functions_count: int,
+                  nesting_depth: int,
+                  imports_count: int) -> str:
+    imported_indices = list(range(max(index - imports_count, 0), index))
+    return ''.join(module_lines(index,
+                                imported_indices=imported_indices,
+                                functions_count=functions_count,
+                                nesting_depth=nesting_depth))
+
+
+def module_lines(index: int,
+                 *,
+                 imported_indices: List[int],
+                 functions_count: int,
+                 nesting_depth: int) -> Iterator[str]:
+    yield 'from typing import (Dict,\n'
+    yield '                    List)\n'
+    for imported_index in imported_indices:
+        yield ('from {package}.{module} import {cls}\n'
+               .format(package=PACKAGE_NAME,
+                       module=MODULE_NAME_TEMPLATE.format(
+                               index=imported_index),
+                       cls=CLASS_NAME_TEMPLATE.format(index=imported_index)))
+    class_name = CLASS_NAME_TEMPLATE.format(index=index)
+    model_parameter = 'model_{index}: {cls}'.format(index=index,
+                                                    cls=class_name)
+    initializer_parameters = ['value: int', 'name: str']
+    initializer_parameters.extend(
+            'model_{index}: {cls}'.format(
+                    index=imported_index,
+                    cls=CLASS_NAME_TEMPLATE.format(index=imported_index))
+            for imported_index in imported_indices)
+    yield '\n\n'
+    yield 'class {cls}:\n'.format(cls=class_name)
+    yield ('    def __init__(self, {parameters}) -> None:\n'
+           .format(parameters=', '.join(initializer_parameters)))
+    yield '        self.value = value\n'
+    for function_index in range(functions_count):
+        parameters = [model_parameter, 'value: int']
+        if imported_indices:
+            imported_index = imported_indices[function_index
+                                              % len(imported_indices)]
+            parameters.append(nested_parameter(imported_index,
+                                               nesting_depth=nesting_depth))
+        yield '\n\n'
+        yield ('def {function}({parameters}) -> {cls}:\n'
+               .format(function=FUNCTION_NAME_TEMPLATE.format(
+                               index=function_index),
+                       parameters=', '.join(parameters),
+                       cls=class_name))
+        yield '    return model_{index}\n'.format(index=index)
+
+
+def nested_parameter(index: int,
+                     *,
+                     nesting_depth: int) -> str:
+    # parameters with the same name should have the same annotation
+    name = 'models_{index}_{depth}'.format(index=index,
+                                           depth=nesting_depth)
+    annotation = CLASS_NAME_TEMPLATE.format(index=index)
+    for depth in range(nesting_depth):
+        template = CONTAINERS_TEMPLATES[depth % len(CONTAINERS_TEMPLATES)]
+        annotation = template.format(annotation=annotation)
+    return name + ': ' + annotation
@@ -0,0 +1,86 @@
+import os
+import shutil
+import sys
+import tempfile
+from typing import List
+
+from liable import (annotator,
+                    arboretum,
+                    catalog,
+                    file_system,
+                    formatting,
+                    functions,
+                    modules,
+                    namespaces,
+                    strategies,
+                    strings,
+                    utils)
+
+from . import synthetic
+
+SIZES = [1, 4, 16, 64]
+DIMENSIONS = ['modules_count', 'functions_count',
+              'nesting_depth', 'imports_count']
+DEFAULT_SIZES = {'modules_count': 8,
+                 'functions_count': 4,
+                 'nesting_depth': 2,
+                 'imports_count': 2}
+
+
+class Package:
+    """Synthetic package scaled by given dimension."""
+
+    def __init__(self, dimension: str, size: int) -> None:
+        sizes = dict(DEFAULT_SIZES)
+        sizes[dimension] = size
+        self.directory = tempfile.mkdtemp()
+        self.modules_paths = synthetic.generate(self.directory,
+                                                **sizes)
+        sys.path.insert(0, self.directory)
+
+    @property
+    def package_directory(self) -> str:
+        return os.path.dirname(self.modules_paths[0])
+
+    def make_directory(self) -> str:
+        return tempfile.mkdtemp(dir=self.directory)
+
+    def remove(self) -> None:
+        unload_package()
+        sys.path.remove(self.directory)
+        shutil.rmtree(self.directory)
+
+
+def unload_package() -> None:
+    modules_names = [name
+                     for name in sys.modules
+                     if name == synthetic.PACKAGE_NAME
+                     or name.startswith(synthetic.PACKAGE_NAME + '.')]
+    for name in modules_names:
+        del sys.modules[name]
+
+
+def reset_caches() -> None:
+    """Makes next run start from scratch like a new process does."""
+    unload_package()
+    annotator.utils.interned.clear()
+    arboretum.from_file.cache_clear()
+    catalog.interned_paths.clear()
+    catalog.name_to_module_path.cache_clear()
+    catalog.path_to_module_path.cache_clear()
+    file_system.system_paths_roots_index = None
+    formatting.cache.clear()
+    functions.clear_signatures_cache()
+    modules.clear_objects_checks()
+    namespaces.module_namespace.cache_clear()
+    strategies.clear_templates_cache()
+    strings.to_plurals.cache_clear()
+    strings.to_plural.cache_clear()
+    utils.is_python_file.cache_clear()
+
+
+def to_arguments(modules_paths: List[str],
+                 *,
+                 target_directory: str) -> List[str]:
+    return ['-t', target_directory,
+            '--overwrite', '--no-cache'] + modules_paths
@@ -17,11 +17,13 @@ ELLIPSIS_STRING = '...'
 
 
 class Raw(Annotation):
+    __slots__ = ()
+
     def __init__(self,
                  origin: Type):
         super().__init__(origin)
 
-    def to_string(self, namespace: NamespaceType) -> str:
+    def render(self, namespace: NamespaceType) -> str:
         return namespaces.search_name(self.origin,
                                       namespace=namespace)
 
@@ -31,11 +33,13 @@ class Raw(Annotation):
 
 
 class PlainAnnotation(Annotation):
+    __slots__ = ()
+
     def __init__(self,
                  origin: TypingMeta):
         super().__init__(origin)
 
-    def to_string(self, namespace: NamespaceType) -> str:
+    def render(self, namespace: NamespaceType) -> str:
         return namespaces.search_name(self.origin,
                                       namespace=namespace)
 
@@ -45,10 +49,12 @@ class PlainAnnotation(Annotation):
 
 
 class Any(Annotation):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(AnyType)
 
-    def to_string(self, namespace: NamespaceType) -> str:
+    def render(self, namespace: NamespaceType) -> str:
         return namespaces.search_name(self.origin,
                                       namespace=namespace)
 
@@ -58,13 +64,15 @@ class Any(Annotation):
 
 
 class Union(Annotation):
+    __slots__ = ('arguments',)
+
     def __init__(self,
                  origin: TypingMeta,
                  arguments: Collection[Annotation]):
         super().__init__(origin)
-        self.arguments = arguments
+        self.arguments = tuple(arguments)
 
-    def to_string(self, namespace: NamespaceType) -> str:
+    def render(self, namespace: NamespaceType) -> str:
         origin = self.origin
 
         if namespaces.is_object_relative(origin,
@@ -90,13 +98,15 @@ class Union(Annotation):
 
 
 class Optional(Annotation):
+    __slots__ = ('arguments',)
+
     def __init__(self,
                  origin: TypingMeta,
                  arguments: Collection[Annotation]):
         super().__init__(origin)
-        self.arguments = arguments
+        self.arguments = tuple(arguments)
 
-    def to_string(self, namespace: NamespaceType) -> str:
+    def render(self, namespace: NamespaceType) -> str:
         origin = self.origin
 
         if namespaces.is_object_relative(origin,
@@ -129,15 +139,17 @@ class Optional(Annotation):
 
 
 class Callable(Annotation):
+    __slots__ = ('parameters', 'return_type')
+
     def __init__(self,
                  origin: TypingMeta,
                  parameters: Collection[Annotation],
                  return_type: Annotation):
         super().__init__(origin)
-        self.parameters = parameters
+        self.parameters = tuple(parameters)
         self.return_type = return_type
 
-    def to_string(self, namespace: NamespaceType) -> str:
+    def render(self, namespace: NamespaceType) -> str:
         origin = self.origin
 
         if namespaces.is_object_relative(origin,
@@ -169,11 +181,13 @@ class Callable(Annotation):
 
 
 class PlainGeneric(Annotation):
+    __slots__ = ()
+
     def __init__(self,
                  origin: TypingMeta):
         super().__init__(origin)
 
-    def to_string(self, namespace: NamespaceType) -> str:
+    def render(self, namespace: NamespaceType) -> str:
         return namespaces.search_name(self.origin,
                                       namespace=namespace)
 
@@ -183,13 +197,15 @@ class PlainGeneric(Annotation):
 
 
 class Generic(Annotation):
+    __slots__ = ('arguments',)
+
     def __init__(self,
                  origin: TypingMeta,
                  arguments: Collection[Annotation]):
         super().__init__(origin)
-        self.arguments = arguments
+        self.arguments = tuple(arguments)
 
-    def to_string(self, namespace: NamespaceType) -> str:
+    def render(self, namespace: NamespaceType) -> str:
         origin = self.origin
 
         if namespaces.is_object_relative(origin,
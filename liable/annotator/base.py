@@ -1,19 +1,63 @@
-from abc import (ABC,
+from abc import (ABCMeta,
                  abstractmethod)
+from collections import OrderedDict
 from typing import (TypingMeta,
+                    Any,
                     Union,
                     Type,
                     Tuple)
 
+from liable import namespaces
 from liable.types import NamespaceType
 
+RENDERED_CACHE_SIZE = 8
+
+
+class Annotation(metaclass=ABCMeta):
+    """
+    Immutable annotation of some type.
+
+    Instances are interned by ``annotator.to_annotation``
+    and cache their strings for recently used namespaces.
+    """
+    __slots__ = ('origin', '_rendered')
 
-class Annotation(ABC):
     def __init__(self, origin: Union[Type, TypingMeta]):
         self.origin = origin
+        self._rendered = OrderedDict()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, name):
+            err_msg = ('Annotation attributes are read-only, '
+                       'but tried to set "{name}".'
+                       .format(name=name))
+            raise AttributeError(err_msg)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        err_msg = ('Annotation attributes are read-only, '
+                   'but tried to delete "{name}".'
+                   .format(name=name))
+        raise AttributeError(err_msg)
 
-    @abstractmethod
     def to_string(self, namespace: NamespaceType) -> str:
+        if not isinstance(namespace, namespaces.Namespace):
+            # plain mappings have no versions to track their changes
+            return self.render(namespace)
+        rendered = self._rendered
+        version = namespace.version
+        try:
+            result = rendered[version]
+        except KeyError:
+            result = rendered[version] = self.render(namespace)
+            if len(rendered) > RENDERED_CACHE_SIZE:
+                rendered.popitem(last=False)
+        else:
+            rendered.move_to_end(version)
+        return result
+
+    @abstractmethod
+    def render(self, namespace: NamespaceType) -> str:
         raise NotImplemented
 
     @property
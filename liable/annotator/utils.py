@@ -1,4 +1,5 @@
 import inspect
+from contextlib import suppress
 from functools import partial
 from itertools import (filterfalse,
                        chain)
@@ -8,6 +9,7 @@ from typing import (TypingMeta,
                     Type,
                     Iterator)
 
+from liable import namespaces
 from liable.types import NamespaceType
 from liable.utils import to_name
 from . import annotations
@@ -21,6 +23,10 @@ NoneType = type(None)
 
 ANNOTATIONS_REPLACEMENTS = {inspect._empty: Any}
 
+# pairs of objects & their annotations by objects identifiers,
+# objects are stored to keep their identifiers from being reused
+interned = {}
+
 
 def normalize(type_: Type) -> Annotation:
     return to_annotation(ANNOTATIONS_REPLACEMENTS.get(type_,
@@ -28,6 +34,17 @@ def normalize(type_: Type) -> Annotation:
 
 
 def to_annotation(object_: Any) -> Annotation:
+    """Returns the same annotation for the same object."""
+    object_id = id(object_)
+    with suppress(KeyError):
+        _, result = interned[object_id]
+        return result
+    result = create_annotation(object_)
+    interned[object_id] = object_, result
+    return result
+
+
+def create_annotation(object_: Any) -> Annotation:
     if not is_typing(object_):
         return annotations.Raw(object_)
 
@@ -76,7 +93,8 @@ def walk(annotation: Annotation,
          *,
          namespace: NamespaceType) -> Iterator[Union[Type, TypingMeta]]:
     origin = annotation.origin
-    if origin in namespace.values():
+    if namespaces.is_object_relative(origin,
+                                     namespace=namespace):
         yield origin
         return
 
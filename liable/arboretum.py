@@ -2,7 +2,10 @@ import ast
 import inspect
 import operator
 import os
-from functools import partial
+import tokenize
+from functools import (lru_cache,
+                       partial)
+from importlib.machinery import SOURCE_SUFFIXES
 from itertools import (repeat,
                        starmap,
                        filterfalse)
@@ -22,6 +25,10 @@ ImportType = Union[ast.Import, ast.ImportFrom]
 ALL_OBJECTS_WILDCARD = '*'
 
 DYNAMIC_MODULES_EXTENSIONS = ('.so', '.dylib', '.dll')
+SOURCE_EXTENSIONS = tuple(SOURCE_SUFFIXES)
+# syntax trees of large modules take megabytes,
+# so only recently parsed ones are kept
+TREES_CACHE_SIZE = 128
 
 
 def from_source(source: str,
@@ -31,10 +38,43 @@ def from_source(source: str,
     return compile(source, file_name, mode, ast.PyCF_ONLY_AST)
 
 
+def from_path(path: str) -> ast.AST:
+    """
+    Returns syntax tree of given source file
+    cached for its absolute path & stat signature
+    (up to ``TREES_CACHE_SIZE`` recently used trees
+    until ``from_file.cache_clear`` call).
+
+    Resulting tree is shared between callers
+    and should not be modified.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return from_file(path,
+                     modification_time=stat.st_mtime_ns,
+                     size=stat.st_size)
+
+
+@lru_cache(maxsize=TREES_CACHE_SIZE)
+def from_file(path: str,
+              *,
+              modification_time: int,
+              size: int) -> ast.AST:
+    # stat signature is a part of the key,
+    # so changed files get re-parsed
+    with tokenize.open(path) as source_file:
+        source = source_file.read()
+    return from_source(source,
+                       file_name=path)
+
+
 def from_module(module: ModuleType) -> ast.AST:
+    module_path = module.__file__
+    if module_path.endswith(SOURCE_EXTENSIONS):
+        return from_path(module_path)
     source = to_source(module)
     return from_source(source,
-                       file_name=module.__file__)
+                       file_name=module_path)
 
 
 def to_source(module: ModuleType,
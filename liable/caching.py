@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from contextlib import suppress
+from importlib.machinery import SOURCE_SUFFIXES
+from types import ModuleType
+from typing import (Any,
+                    Optional,
+                    Iterable,
+                    Dict,
+                    Tuple,
+                    List)
+
+from . import (__version__,
+               catalog,
+               file_system,
+               stubs)
+from .catalog import ObjectPathType
+
+DEFAULT_DIRECTORY = os.path.join(
+        os.environ.get('XDG_CACHE_HOME',
+                       os.path.join(os.path.expanduser('~'), '.cache')),
+        'liable')
+ENTRY_EXTENSION = '.json'
+SOURCE_EXTENSIONS = tuple(SOURCE_SUFFIXES)
+INTERPRETER = sys.version
+# stubs lack objects which only executed module has,
+# so namespaces of imported & stubbed modules are cached separately
+IMPORT_MODE = 'import'
+STATIC_MODE = 'static'
+
+directory = None
+
+
+def set_directory(path: Optional[str]) -> None:
+    """
+    Sets directory of persistent modules namespaces cache,
+    ``None`` disables caching.
+    """
+    global directory
+    directory = path
+
+
+def is_cacheable(module: ModuleType) -> bool:
+    module_path = getattr(module, '__file__', None)
+    return (module_path is not None
+            and module_path.endswith(SOURCE_EXTENSIONS))
+
+
+def load(module: ModuleType
+         ) -> Optional[Tuple[List[ObjectPathType], List[ObjectPathType]]]:
+    """
+    Returns paths of dependent & inner objects of given module
+    recorded on previous runs
+    if module source has not changed since then,
+    ``None`` otherwise.
+
+    Fingerprint of a module consists of
+    its absolute path, modification time, size & content hash
+    along with system paths containing it (which determine objects paths),
+    analysis mode, interpreter & ``liable`` versions.
+    """
+    if directory is None or not is_cacheable(module):
+        return None
+    module_path = os.path.abspath(module.__file__)
+    mode = to_mode(module)
+    roots = file_system.to_roots(module_path)
+    entry_path = to_entry_path(module_path,
+                               mode=mode,
+                               roots=roots)
+    try:
+        with open(entry_path) as entry_file:
+            entry = json.load(entry_file)
+    except (OSError, ValueError):
+        return None
+    try:
+        stat = os.stat(module_path)
+    except OSError:
+        return None
+    if (entry.get('path') != module_path
+            or entry.get('mode') != mode
+            or entry.get('roots') != roots
+            or entry.get('interpreter') != INTERPRETER
+            or entry.get('version') != __version__):
+        return None
+    if (entry.get('mtime_ns') != stat.st_mtime_ns
+            or entry.get('size') != stat.st_size):
+        if entry.get('hash') != to_hash(module_path):
+            return None
+        entry.update(to_stat_fingerprint(stat))
+        write_entry(entry,
+                    path=entry_path)
+    return (list(map(catalog.from_plain,
+                     entry['dependent_objects_paths'])),
+            list(map(catalog.from_plain,
+                     entry['inner_objects_paths'])))
+
+
+def save(module: ModuleType,
+         *,
+         dependent_objects_paths: Iterable[ObjectPathType],
+         inner_objects_paths: Iterable[ObjectPathType]) -> None:
+    if directory is None or not is_cacheable(module):
+        return
+    module_path = os.path.abspath(module.__file__)
+    mode = to_mode(module)
+    roots = file_system.to_roots(module_path)
+    try:
+        stat = os.stat(module_path)
+        content_hash = to_hash(module_path)
+    except OSError:
+        return
+    entry = {'path': module_path,
+             'mode': mode,
+             'roots': roots,
+             'interpreter': INTERPRETER,
+             'version': __version__,
+             'hash': content_hash,
+             'dependent_objects_paths': list(map(catalog.to_plain,
+                                                 dependent_objects_paths)),
+             'inner_objects_paths': list(map(catalog.to_plain,
+                                             inner_objects_paths))}
+    entry.update(to_stat_fingerprint(stat))
+    write_entry(entry,
+                path=to_entry_path(module_path,
+                                   mode=mode,
+                                   roots=roots))
+
+
+def to_mode(module: ModuleType) -> str:
+    return STATIC_MODE if stubs.is_stub(module) else IMPORT_MODE
+
+
+def to_entry_path(module_path: str,
+                  *,
+                  mode: str,
+                  roots: List[str]) -> str:
+    key = hashlib.sha256('\n'.join([module_path, mode, *roots,
+                                    INTERPRETER, __version__])
+                         .encode()).hexdigest()
+    return os.path.join(directory, key + ENTRY_EXTENSION)
+
+
+def to_stat_fingerprint(stat: os.stat_result) -> Dict[str, int]:
+    return {'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size}
+
+
+def to_hash(path: str) -> str:
+    with open(path, mode='rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def write_entry(entry: Dict[str, Any],
+                *,
+                path: str) -> None:
+    # cache is an optimization, so failing to write it is not an error
+    entry_directory = os.path.dirname(path)
+    try:
+        os.makedirs(entry_directory,
+                    exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=entry_directory,
+                suffix=ENTRY_EXTENSION)
+    except OSError:
+        return
+    try:
+        with os.fdopen(file_descriptor, mode='w') as entry_file:
+            json.dump(entry, entry_file)
+        os.replace(temporary_path, path)
+    except OSError:
+        with suppress(OSError):
+            os.remove(temporary_path)
@@ -3,7 +3,9 @@ import enum
 import inspect
 import operator
 import os
+import weakref
 from collections import defaultdict
+from functools import lru_cache
 from itertools import filterfalse
 from typing import (Any,
                     Union,
@@ -11,14 +13,16 @@ from typing import (Any,
                     Type,
                     Iterable,
                     Iterator,
-                    NamedTuple,
                     Dict,
-                    Set)
+                    Set,
+                    Tuple,
+                    List)
 
 from . import (file_system,
                strings)
 
 SEPARATOR = '.'
+MODULES_PATHS_CACHE_SIZE = 1024
 
 
 class PathType(enum.Enum):
@@ -31,28 +35,113 @@ IMPORTS_TEMPLATES = {PathType.absolute: 'import {module}\n',
                      PathType.relative: 'from {module} import {objects}\n'}
 
 
-class ModulePath(NamedTuple):
-    module: Union[str, 'ModulePath']
-    object: Optional[str] = None
-    type: PathType = PathType.absolute
-
-    def __str__(self):
-        module_full_name = str(self.module)
-        if self.object is None:
-            return module_full_name
-        else:
-            return module_full_name + SEPARATOR + self.object
-
-
-class ContentPath(NamedTuple):
-    module: ModulePath
-    object: str
-    type: PathType
-
-    def __str__(self):
-        module_full_name = str(self.module)
-        return module_full_name + SEPARATOR + self.object
-
+class ObjectPath:
+    """
+    Base of immutable objects paths.
+
+    Paths are interned while they are referenced:
+    constructing path equal to existing one
+    returns the same instance,
+    so their full names & hashes are computed once.
+    """
+    __slots__ = ('module', 'object', 'type', 'parts', '_string', '_hash',
+                 '__weakref__')
+    _fields = ('module', 'object', 'type')
+
+    def __new__(cls,
+                module: Union[str, 'ModulePath'],
+                object: Optional[str],
+                type: PathType) -> 'ObjectPath':
+        key = cls, module, object, type
+        try:
+            return interned_paths[key]
+        except KeyError:
+            result = interned_paths[key] = super().__new__(cls)
+            result._initialize(module, object, type)
+            return result
+
+    def _initialize(self,
+                    module: Union[str, 'ModulePath'],
+                    object_: Optional[str],
+                    type_: PathType) -> None:
+        set_attribute = super().__setattr__
+        set_attribute('module', module)
+        set_attribute('object', object_)
+        set_attribute('type', type_)
+        parts = (module,) if isinstance(module, str) else module.parts
+        if object_ is not None:
+            parts += (object_,)
+        set_attribute('parts', parts)
+        set_attribute('_string', SEPARATOR.join(parts))
+        # same as of named tuple with these fields
+        set_attribute('_hash', hash((module, object_, type_)))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('Object paths are immutable.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('Object paths are immutable.')
+
+    def __iter__(self) -> Iterator[Any]:
+        yield self.module
+        yield self.object
+        yield self.type
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, ObjectPath):
+            return NotImplemented
+        return (type(self) is type(other)
+                and self._hash == other._hash
+                and tuple(self) == tuple(other))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __str__(self) -> str:
+        return self._string
+
+    def __repr__(self) -> str:
+        return ('{cls}(module={module!r}, object={object!r}, type={type!r})'
+                .format(cls=type(self).__name__,
+                        module=self.module,
+                        object=self.object,
+                        type=self.type))
+
+    def __reduce__(self) -> Tuple[Type['ObjectPath'], Tuple[Any, ...]]:
+        # unpickled paths get interned too
+        return type(self), tuple(self)
+
+    def _replace(self, **changes: Any) -> 'ObjectPath':
+        fields = dict(zip(self._fields, self))
+        fields.update(changes)
+        return type(self)(**fields)
+
+
+class ModulePath(ObjectPath):
+    __slots__ = ()
+
+    def __new__(cls,
+                module: Union[str, 'ModulePath'],
+                object: Optional[str] = None,
+                type: PathType = PathType.absolute) -> 'ModulePath':
+        return super().__new__(cls, module, object, type)
+
+
+class ContentPath(ObjectPath):
+    __slots__ = ()
+
+    def __new__(cls,
+                module: ModulePath,
+                object: str,
+                type: PathType) -> 'ContentPath':
+        return super().__new__(cls, module, object, type)
+
+
+# paths are dropped once nothing refers to them,
+# so long-living processes do not accumulate them
+interned_paths = weakref.WeakValueDictionary()
 
 BUILT_INS_MODULE_PATH = ModulePath(builtins.__name__)
 
@@ -67,6 +156,7 @@ def is_built_in(object_path: ObjectPathType) -> bool:
     return object_path.module == BUILT_INS_MODULE_PATH
 
 
+@lru_cache(maxsize=MODULES_PATHS_CACHE_SIZE)
 def path_to_module_path(path: str) -> ModulePath:
     package_name, file_name = os.path.split(path)
     module_name = to_module_name(file_name)
@@ -79,6 +169,7 @@ def path_to_module_path(path: str) -> ModulePath:
                       type=PathType.absolute)
 
 
+@lru_cache(maxsize=MODULES_PATHS_CACHE_SIZE)
 def name_to_module_path(full_name: str) -> ModulePath:
     try:
         package_name, full_name = full_name.rsplit(SEPARATOR, 1)
@@ -154,3 +245,30 @@ def guess_type(object_: Any) -> Type[ObjectPathType]:
     if inspect.ismodule(object_):
         return ModulePath
     return ContentPath
+
+
+PLAIN_KINDS = {ModulePath: 'module',
+               ContentPath: 'content'}
+PLAIN_KINDS_CLASSES = dict(zip(PLAIN_KINDS.values(), PLAIN_KINDS.keys()))
+
+
+def to_plain(object_path: ObjectPathType) -> List[Any]:
+    """Converts object path into JSON-serializable form."""
+    module = object_path.module
+    if not isinstance(module, str):
+        module = to_plain(module)
+    return [PLAIN_KINDS[type(object_path)],
+            module,
+            object_path.object,
+            object_path.type.value]
+
+
+def from_plain(raw_object_path: List[Any]) -> ObjectPathType:
+    """Restores object path from its JSON-serializable form."""
+    kind, module, object_, path_type = raw_object_path
+    if not isinstance(module, str):
+        module = from_plain(module)
+    cls = PLAIN_KINDS_CLASSES[kind]
+    return cls(module=module,
+               object=object_,
+               type=PathType(path_type))
@@ -0,0 +1,317 @@
+import importlib
+import json
+import os
+import socket
+import stat
+import sys
+from collections import (OrderedDict,
+                         defaultdict)
+from contextlib import closing
+from typing import (Any,
+                    Callable,
+                    Optional,
+                    Iterable,
+                    Dict,
+                    Set,
+                    Tuple,
+                    List)
+
+from . import (annotator,
+               caching,
+               file_system,
+               manifests,
+               namespaces,
+               stubs)
+
+DEFAULT_SOCKET_PATH = '.liable.sock'
+POLLING_INTERVAL = 1.
+ENCODING = 'utf-8'
+SERVED_COMMANDS = ('all', 'tests', 'utilities')
+# same as of usage errors
+INVALID_REQUEST_STATUS = 2
+
+RequestType = Dict[str, Any]
+ResponseType = Dict[str, Any]
+FileStateType = Tuple[float, int]
+
+
+def serve(socket_path: str,
+          *,
+          handle: Callable[[RequestType], ResponseType],
+          report: Callable[[ResponseType], None],
+          watched_directory: Optional[str] = None,
+          interval: float = POLLING_INTERVAL) -> None:
+    """
+    Handles requests received on Unix socket one by one
+    in current process,
+    so imported modules & caches are reused between them.
+
+    Malformed requests get answered with error response,
+    connections closed by clients get dropped.
+
+    Modules changed since previous request get reloaded
+    along with modules which import them.
+
+    Stubs of statically analysed modules are removed after each request
+    with caches which refer to them.
+
+    If watched directory is specified it gets polled for changes
+    on which last request of each command is handled again
+    and its response is reported.
+    """
+    reloader = Reloader()
+    last_requests = OrderedDict()
+    tree_state = (None
+                  if watched_directory is None
+                  else to_tree_state(watched_directory))
+    remove_socket(socket_path)
+    with closing(socket.socket(socket.AF_UNIX,
+                               socket.SOCK_STREAM)) as server:
+        server.bind(socket_path)
+        try:
+            server.listen()
+            if watched_directory is not None:
+                server.settimeout(interval)
+            while True:
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    previous_tree_state = tree_state
+                    tree_state = to_tree_state(watched_directory)
+                    if tree_state == previous_tree_state:
+                        continue
+                    reloader.reload_changed()
+                    for request in last_requests.values():
+                        report(handle_isolated(request, handle))
+                    reloader.track()
+                    continue
+                with closing(connection):
+                    try:
+                        serve_connection(connection,
+                                         handle=handle,
+                                         reloader=reloader,
+                                         last_requests=last_requests)
+                    except OSError:
+                        # client has gone before receiving response
+                        continue
+        finally:
+            remove_socket(socket_path)
+
+
+def serve_connection(connection: socket.socket,
+                     *,
+                     handle: Callable[[RequestType], ResponseType],
+                     reloader: 'Reloader',
+                     last_requests: Dict[str, RequestType]) -> None:
+    connection.settimeout(None)
+    try:
+        request = receive(connection)
+        validate_request(request)
+    except ValueError as err:
+        send(connection, {'status': INVALID_REQUEST_STATUS,
+                          'output': 'Invalid request: {reason}\n'
+                                    .format(reason=err)})
+        return
+    reloader.reload_changed()
+    response = handle_isolated(request, handle)
+    reloader.track()
+    if response['status'] == 0:
+        last_requests[request['arguments'][0]] = request
+    send(connection, response)
+
+
+def validate_request(request: Any) -> None:
+    if not isinstance(request, dict):
+        err_msg = 'should be an object.'
+        raise ValueError(err_msg)
+    arguments = request.get('arguments')
+    if (not isinstance(arguments, list)
+            or not all(isinstance(argument, str)
+                       for argument in arguments)):
+        err_msg = '"arguments" should be a list of strings.'
+        raise ValueError(err_msg)
+    if not isinstance(request.get('directory'), str):
+        err_msg = '"directory" should be a string.'
+        raise ValueError(err_msg)
+
+
+def handle_isolated(request: RequestType,
+                    handle: Callable[[RequestType], ResponseType]
+                    ) -> ResponseType:
+    purges_count = stubs.purges_count
+    try:
+        return handle(request)
+    finally:
+        if stubs.purges_count != purges_count:
+            # caches refer to stubs which were removed from ``sys.modules``
+            clear_caches()
+
+
+def request(socket_path: str, payload: RequestType) -> ResponseType:
+    with closing(socket.socket(socket.AF_UNIX,
+                               socket.SOCK_STREAM)) as client:
+        client.connect(socket_path)
+        send(client, payload)
+        return receive(client)
+
+
+def send(connection: socket.socket, message: Dict[str, Any]) -> None:
+    connection.sendall((json.dumps(message) + '\n').encode(ENCODING))
+
+
+def receive(connection: socket.socket) -> Dict[str, Any]:
+    with connection.makefile(mode='r',
+                             encoding=ENCODING) as stream:
+        return json.loads(stream.readline())
+
+
+def remove_socket(path: str) -> None:
+    try:
+        is_socket = stat.S_ISSOCK(os.stat(path).st_mode)
+    except OSError:
+        return
+    if is_socket:
+        os.remove(path)
+
+
+def to_tree_state(directory: str) -> Dict[str, FileStateType]:
+    result = {}
+    for path in file_system.find_files(directory,
+                                       recursive=True):
+        if not path.endswith(caching.SOURCE_EXTENSIONS):
+            continue
+        try:
+            result[path] = to_file_state(path)
+        except OSError:
+            continue
+    return result
+
+
+def to_file_state(path: str) -> FileStateType:
+    status = os.stat(path)
+    return status.st_mtime, status.st_size
+
+
+def is_project_path(path: str) -> bool:
+    return (path.endswith(caching.SOURCE_EXTENSIONS)
+            and not file_system.is_installed_path(path))
+
+
+class Reloader:
+    """Keeps track of imported project modules source files states."""
+
+    def __init__(self) -> None:
+        self._paths = {}
+        self._states = {}
+        self.track()
+
+    def track(self) -> None:
+        """Starts tracking newly imported modules."""
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, '__file__', None)
+            if (name in self._paths
+                    or path is None
+                    or not is_project_path(path)):
+                continue
+            try:
+                self._states[name] = to_file_state(path)
+            except OSError:
+                continue
+            self._paths[name] = path
+
+    def reload_changed(self) -> List[str]:
+        """
+        Reloads modules changed since they were tracked
+        with modules which (transitively) import them
+        dependencies first.
+
+        Returns names of reloaded modules.
+        """
+        changed_modules_names = {name
+                                 for name, path in self._paths.items()
+                                 if self._is_changed(name, path)}
+        if not changed_modules_names:
+            return []
+        dependencies = self._dependencies()
+        dependants = defaultdict(set)
+        for name, modules_names in dependencies.items():
+            for dependency_name in modules_names:
+                dependants[dependency_name].add(name)
+        stale_modules_names = set()
+        queue = list(changed_modules_names)
+        while queue:
+            name = queue.pop()
+            if name in stale_modules_names:
+                continue
+            stale_modules_names.add(name)
+            queue.extend(dependants[name] - stale_modules_names)
+        result = []
+        for name in to_dependencies_order(stale_modules_names,
+                                          dependencies=dependencies):
+            module = sys.modules.get(name)
+            path = self._paths.pop(name)
+            del self._states[name]
+            if module is None:
+                continue
+            try:
+                importlib.reload(module)
+            except Exception:
+                # gets imported again (with error reported) on demand
+                del sys.modules[name]
+                continue
+            self._paths[name] = path
+            self._states[name] = to_file_state(path)
+            result.append(name)
+        clear_caches()
+        return result
+
+    def _is_changed(self, name: str, path: str) -> bool:
+        try:
+            return to_file_state(path) != self._states[name]
+        except OSError:
+            return True
+
+    def _dependencies(self) -> Dict[str, Set[str]]:
+        result = {}
+        for name, path in self._paths.items():
+            try:
+                imported_names = set(manifests.imported_modules_names(path))
+            except (OSError, SyntaxError, ValueError):
+                imported_names = set()
+            result[name] = imported_names & self._paths.keys()
+        return result
+
+
+def clear_caches() -> None:
+    """Clears caches which refer to objects of reloaded or stubbed modules."""
+    # loaded on demand since it imports test frameworks
+    from . import strategies
+
+    namespaces.module_namespace.cache_clear()
+    annotator.utils.interned.clear()
+    strategies.clear_templates_cache()
+
+
+def to_dependencies_order(modules_names: Iterable[str],
+                          *,
+                          dependencies: Dict[str, Set[str]]) -> List[str]:
+    """
+    Sorts modules names topologically by their imports,
+    modules from import cycles go in arbitrary order.
+    """
+    modules_names = set(modules_names)
+    result = []
+    visited = set()
+
+    def visit(name: str) -> None:
+        if name in visited:
+            return
+        visited.add(name)
+        for dependency_name in sorted(dependencies.get(name, set())
+                                      & modules_names):
+            visit(dependency_name)
+        result.append(name)
+
+    for name in sorted(modules_names):
+        visit(name)
+    return result
@@ -1,36 +1,80 @@
 import os
 import sys
-from functools import partial
+import sysconfig
 from importlib._bootstrap_external import SOURCE_SUFFIXES
-from typing import (Iterable,
-                    Iterator)
+from pathlib import PurePath
+from typing import (Callable,
+                    Optional,
+                    Iterable,
+                    Iterator,
+                    Tuple,
+                    List)
 
 from . import strings
 
 SOURCE_EXTENSION = SOURCE_SUFFIXES[0]
 INIT_MODULE_NAME = '__init__'
 INIT_MODULE_FILE_NAME = INIT_MODULE_NAME + SOURCE_EXTENSION
+# modules from these directories are not expected to change
+INSTALLED_PATHS = tuple({os.path.normcase(sysconfig.get_path(name))
+                         for name in ('stdlib', 'platstdlib',
+                                      'purelib', 'platlib')})
 
 
 def find_files(path: str,
                *,
-               recursive: bool) -> Iterator[str]:
+               recursive: bool,
+               is_ignored: Optional[Callable[[str], bool]] = None
+               ) -> Iterator[str]:
+    """
+    Lazily yields files paths
+    skipping ones for which ``is_ignored`` predicate holds.
+
+    Directories get checked by the same predicate
+    (with trailing separator like in ".gitignore" patterns)
+    and are not walked through if ignored.
+    """
+    if is_ignored is None:
+        is_ignored = is_never_ignored
     if os.path.isdir(path):
         yield from directory_files(path,
-                                   recursive=recursive)
-    else:
+                                   recursive=recursive,
+                                   is_ignored=is_ignored)
+    elif not is_ignored(path):
         yield path
 
 
 def directory_files(path: str,
                     *,
-                    recursive: bool) -> Iterator[str]:
-    if recursive:
-        for root, _, files_names in os.walk(path):
-            yield from map(partial(os.path.join, root), files_names)
-    else:
-        yield from filter(os.path.isfile,
-                          map(partial(os.path.join, path), os.listdir(path)))
+                    recursive: bool,
+                    is_ignored: Optional[Callable[[str], bool]] = None
+                    ) -> Iterator[str]:
+    if is_ignored is None:
+        is_ignored = is_never_ignored
+    sub_directories_paths = []
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        # unreadable directories are skipped like in ``os.walk``
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir():
+                # symbolic links are not followed like in ``os.walk``
+                if (recursive
+                        and not entry.is_symlink()
+                        and not is_ignored(entry.path + os.sep)):
+                    sub_directories_paths.append(entry.path)
+            elif entry.is_file() and not is_ignored(entry.path):
+                yield entry.path
+    for sub_directory_path in sub_directories_paths:
+        yield from directory_files(sub_directory_path,
+                                   recursive=recursive,
+                                   is_ignored=is_ignored)
+
+
+def is_never_ignored(path: str) -> bool:
+    return False
 
 
 def make_packages(directory: str,
@@ -51,15 +95,162 @@ def make_init_module(directory: str,
 
 def to_relative(path: str,
                 *,
-                system_paths: Iterable[str] = sys.path) -> str:
-    try:
-        root_path = max((system_path
-                         for system_path in system_paths
-                         if path.startswith(system_path)),
-                        key=len)
-    except ValueError as err:
-        err_msg = ('Invalid module path: "{path}". '
-                   'No root path found in `Python` system paths.'
-                   .format(path=path))
-        raise ModuleNotFoundError(err_msg) from err
-    return os.path.normpath(os.path.relpath(path, root_path))
+                system_paths: Optional[Iterable[str]] = None) -> str:
+    """
+    Returns path relative to the deepest system path containing it.
+
+    Unless ``system_paths`` are specified ``sys.path`` is used.
+    """
+    if system_paths is None:
+        index = system_paths_index()
+    else:
+        index = RootsIndex(system_paths)
+    return index.to_relative(path)
+
+
+def to_roots(path: str,
+             *,
+             system_paths: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Returns normalized system paths containing given path
+    from the shallowest to the deepest one.
+
+    Unless ``system_paths`` are specified ``sys.path`` is used.
+    """
+    if system_paths is None:
+        index = system_paths_index()
+    else:
+        index = RootsIndex(system_paths)
+    return index.to_roots(path)
+
+
+class RootsIndex:
+    """
+    Component-wise prefix tree of normalized roots paths
+    with paths of looked up directories relative to their deepest roots
+    memoized.
+    """
+    # key of tree nodes which correspond to roots
+    ROOT_KEY = None
+
+    def __init__(self, roots: Iterable[str]) -> None:
+        self.roots = list(roots)
+        # relative roots depend on current working directory
+        self.directory = (os.getcwd()
+                          if not all(map(os.path.isabs, self.roots))
+                          else None)
+        self._tree = {}
+        self._roots_paths = set()
+        self._relative_directories = {}
+        for root in self.roots:
+            node = self._tree
+            for component in to_components(root):
+                node = node.setdefault(os.path.normcase(component), {})
+            node[self.ROOT_KEY] = True
+            self._roots_paths.add(os.path.normcase(os.path.abspath(root)))
+
+    def is_actual(self, roots: Iterable[str]) -> bool:
+        return (self.roots == roots
+                and (self.directory is None
+                     or self.directory == os.getcwd()))
+
+    def to_relative(self, path: str) -> str:
+        path = os.path.abspath(path)
+        if os.path.normcase(path) in self._roots_paths:
+            return os.curdir
+        directory, name = os.path.split(path)
+        try:
+            relative_directory = self._relative_directories[directory]
+        except KeyError:
+            relative_directory = self._relative_directories[directory] = (
+                self._to_relative_directory(directory))
+        if relative_directory is None:
+            err_msg = ('Invalid module path: "{path}". '
+                       'No root path found in `Python` system paths.'
+                       .format(path=path))
+            raise ModuleNotFoundError(err_msg)
+        if relative_directory == os.curdir:
+            return name
+        return os.path.join(relative_directory, name)
+
+    def to_roots(self, path: str) -> List[str]:
+        components = to_components(path)
+        result = []
+        node = self._tree
+        for index, component in enumerate(components, start=1):
+            try:
+                node = node[os.path.normcase(component)]
+            except KeyError:
+                break
+            if self.ROOT_KEY in node:
+                result.append(os.path.normcase(
+                        os.path.join(*components[:index])))
+        return result
+
+    def _to_relative_directory(self, directory: str) -> Optional[str]:
+        components = to_components(directory)
+        depth = None
+        node = self._tree
+        for index, component in enumerate(components, start=1):
+            try:
+                node = node[os.path.normcase(component)]
+            except KeyError:
+                break
+            if self.ROOT_KEY in node:
+                depth = index
+        if depth is None:
+            return None
+        relative_components = components[depth:]
+        if not relative_components:
+            return os.curdir
+        return os.path.join(*relative_components)
+
+
+def to_components(path: str) -> Tuple[str, ...]:
+    return PurePath(os.path.abspath(path)).parts
+
+
+def is_installed_path(path: str) -> bool:
+    return os.path.normcase(path).startswith(INSTALLED_PATHS)
+
+
+def find_module_file(module_full_name: str,
+                     *,
+                     system_paths: Optional[Iterable[str]] = None
+                     ) -> Optional[str]:
+    """
+    Returns path of source file of given module
+    found like import system does but without importing its packages,
+    ``None`` if it is not found.
+
+    Unless ``system_paths`` are specified ``sys.path`` is used.
+    """
+    if system_paths is None:
+        system_paths = sys.path
+    *packages_names, module_name = module_full_name.split('.')
+    for root in map(os.path.abspath, system_paths):
+        if packages_names and not os.path.isfile(
+                os.path.join(root, packages_names[0],
+                             INIT_MODULE_FILE_NAME)):
+            continue
+        directory = os.path.join(root, *packages_names)
+        module_path = os.path.join(directory, module_name + SOURCE_EXTENSION)
+        if os.path.isfile(module_path):
+            return module_path
+        package_path = os.path.join(directory, module_name,
+                                    INIT_MODULE_FILE_NAME)
+        if os.path.isfile(package_path):
+            return package_path
+    return None
+
+
+system_paths_roots_index = None
+
+
+def system_paths_index() -> RootsIndex:
+    """Returns index of ``sys.path`` rebuilding it on its change."""
+    global system_paths_roots_index
+    if (system_paths_roots_index is None
+            or not system_paths_roots_index.is_actual(sys.path)):
+        system_paths_roots_index = RootsIndex(sys.path)
+    return system_paths_roots_index
@@ -8,12 +8,13 @@ from typing import Iterable
 import pytest
 
 from . import (annotator,
+               formatting,
                namespaces,
+               phases,
                catalog,
                strategies)
 from .types import NamespaceType
-from .utils import (fix_code,
-                    to_name)
+from .utils import to_name
 
 DEFINITION_TEMPLATE = ('@{pytest}.{fixture}(scope=\'function\')\n'
                        .format(pytest=to_name(pytest),
@@ -22,6 +23,7 @@ DEFINITION_TEMPLATE = ('@{pytest}.{fixture}(scope=\'function\')\n'
 RETURN_TEMPLATE = 'return {strategies}.{strategy}.example()\n'
 
 
+@phases.measures(phases.RENDERING)
 def from_parameters(parameters: Iterable[inspect.Parameter],
                     *,
                     namespace: NamespaceType,
@@ -31,9 +33,8 @@ def from_parameters(parameters: Iterable[inspect.Parameter],
     annotations = chain.from_iterable(annotator.walk(parameter.annotation,
                                                      namespace=namespace)
                                       for parameter in parameters)
-    object_path_seeker = partial(namespaces.search_path,
-                                 namespace=namespace)
-    annotations_paths = map(object_path_seeker, annotations)
+    annotations_paths = namespaces.search_objects_paths(annotations,
+                                                        namespace=namespace)
     additional_objects_paths = [
         catalog.ModulePath(to_name(pytest)),
         catalog.ModulePath(module=catalog.ModulePath(tests_module_name),
@@ -55,7 +56,7 @@ def from_parameters(parameters: Iterable[inspect.Parameter],
     fixtures = map(fixture_factory, parameters)
     code_blocks = chain(imports,
                         fixtures)
-    return fix_code(''.join(code_blocks))
+    return formatting.fix_code(''.join(code_blocks))
 
 
 def from_parameter(parameter: inspect.Parameter,
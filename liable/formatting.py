@@ -0,0 +1,233 @@
+import hashlib
+import os
+from contextlib import suppress
+from typing import (Optional,
+                    Tuple,
+                    List)
+
+from . import (__version__,
+               caching,
+               phases)
+
+AUTOPEP8 = 'autopep8'
+NONE = 'none'
+WRAP = 'wrap'
+
+MAX_LINE_LENGTH = 79
+CACHE_DIRECTORY_NAME = 'formatted'
+CACHE_ENTRY_EXTENSION = '.py'
+# every change of generated module leaves stale entry behind,
+# so least recently used entries get removed above this count
+CACHE_MAX_ENTRIES_COUNT = 1024
+DEFINITIONS_PREFIXES = ('def ', 'class ', '@')
+BRACKETS = {'(': ')', '[': ']', '{': '}'}
+QUOTES = {'\'', '"'}
+FROM_IMPORT_SEPARATOR = ' import '
+
+backend = AUTOPEP8
+
+# formatted sources by their keys
+cache = {}
+
+
+def set_backend(name: str) -> None:
+    global backend
+    if name not in BACKENDS:
+        err_msg = ('Unknown formatting backend: "{name}".'
+                   .format(name=name))
+        raise ValueError(err_msg)
+    backend = name
+
+
+@phases.measures(phases.FORMATTING)
+def fix_code(source: str) -> str:
+    """
+    Formats given source with current backend.
+
+    Results are memoized by source content hash
+    in memory & in persistent cache directory (if any).
+    """
+    key = to_key(source)
+    with suppress(KeyError):
+        return cache[key]
+    result = load(key)
+    if result is None:
+        result = BACKENDS[backend](source)
+        save(key, result)
+    cache[key] = result
+    return result
+
+
+def to_key(source: str) -> str:
+    versions = [backend, __version__]
+    if backend == AUTOPEP8:
+        import autopep8
+        versions.append(autopep8.__version__)
+    return hashlib.sha256('\n'.join(versions + [source])
+                          .encode()).hexdigest()
+
+
+def load(key: str) -> Optional[str]:
+    entry_path = to_entry_path(key)
+    if entry_path is None:
+        return None
+    try:
+        with open(entry_path) as entry_file:
+            result = entry_file.read()
+    except OSError:
+        return None
+    # marking entry as recently used
+    with suppress(OSError):
+        os.utime(entry_path)
+    return result
+
+
+def save(key: str, source: str) -> None:
+    entry_path = to_entry_path(key)
+    if entry_path is None:
+        return
+    # cache is an optimization, so failing to write it is not an error
+    with suppress(OSError):
+        os.makedirs(os.path.dirname(entry_path),
+                    exist_ok=True)
+        temporary_path = entry_path + '.' + str(os.getpid())
+        with open(temporary_path, mode='w') as entry_file:
+            entry_file.write(source)
+        os.replace(temporary_path, entry_path)
+        prune(os.path.dirname(entry_path))
+
+
+def prune(directory: str,
+          *,
+          max_entries_count: int = CACHE_MAX_ENTRIES_COUNT) -> None:
+    """Removes least recently used entries exceeding given count."""
+    with os.scandir(directory) as entries:
+        entries = [(entry.stat().st_mtime, entry.path)
+                   for entry in entries
+                   if entry.name.endswith(CACHE_ENTRY_EXTENSION)]
+    if len(entries) <= max_entries_count:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries_count]:
+        with suppress(OSError):
+            os.remove(path)
+
+
+def to_entry_path(key: str) -> Optional[str]:
+    if caching.directory is None:
+        return None
+    return os.path.join(caching.directory, CACHE_DIRECTORY_NAME,
+                        key + CACHE_ENTRY_EXTENSION)
+
+
+def fix_code_with_autopep8(source: str) -> str:
+    # loaded on demand since importing is slow
+    import autopep8
+    return autopep8.fix_code(source,
+                             options={'aggressive': True,
+                                      'max_line_length': MAX_LINE_LENGTH})
+
+
+def keep_code(source: str) -> str:
+    return source
+
+
+def wrap_code(source: str,
+              *,
+              max_line_length: int = MAX_LINE_LENGTH) -> str:
+    """
+    Formats sources generated by ``liable``:
+    separates top-level definitions with two blank lines
+    and wraps long lines on commas with visual indentation.
+    """
+    lines = []
+    inside_definition = False
+    for line in source.splitlines():
+        line = line.rstrip()
+        if not line:
+            if lines and lines[-1]:
+                lines.append(line)
+            continue
+        if line[0].isspace():
+            lines.extend(wrap_line(line,
+                                   max_line_length=max_line_length))
+            continue
+        is_definition = line.startswith(DEFINITIONS_PREFIXES)
+        if ((is_definition or inside_definition)
+                and lines
+                and not lines[-1].startswith('@')):
+            while lines and not lines[-1]:
+                lines.pop()
+            if lines:
+                lines.extend(['', ''])
+        inside_definition = is_definition
+        lines.extend(wrap_line(line,
+                               max_line_length=max_line_length))
+    while lines and not lines[-1]:
+        lines.pop()
+    return ''.join(line + '\n' for line in lines)
+
+
+def wrap_line(line: str,
+              *,
+              max_line_length: int) -> List[str]:
+    if len(line) <= max_line_length:
+        return [line]
+    if line.startswith('from ') and FROM_IMPORT_SEPARATOR in line:
+        prefix, names = line.split(FROM_IMPORT_SEPARATOR, 1)
+        if not names.startswith('('):
+            line = prefix + FROM_IMPORT_SEPARATOR + '(' + names + ')'
+    split = to_split(line)
+    if split is None:
+        return [line]
+    bracket_index, commas_indices = split
+    indent = ' ' * (bracket_index + 1)
+    starts = [0] + [comma_index + 1 for comma_index in commas_indices]
+    stops = commas_indices + [len(line) - 1]
+    parts = [line[start:stop + 1] for start, stop in zip(starts, stops)]
+    result = wrap_line(parts[0],
+                       max_line_length=max_line_length)
+    for part in parts[1:]:
+        result.extend(wrap_line(indent + part.lstrip(),
+                                max_line_length=max_line_length))
+    return result
+
+
+def to_split(line: str) -> Optional[Tuple[int, List[int]]]:
+    """
+    Returns index of the first opening bracket
+    which encloses commas (except trailing one)
+    along with indices of these commas.
+    """
+    brackets_commas = {}
+    opened = []
+    quote = None
+    escaped = False
+    last_index = len(line.rstrip()) - 1
+    for index, character in enumerate(line):
+        if quote is not None:
+            if escaped:
+                escaped = False
+            elif character == '\\':
+                escaped = True
+            elif character == quote:
+                quote = None
+        elif character in QUOTES:
+            quote = character
+        elif character in BRACKETS:
+            opened.append(index)
+            brackets_commas[index] = []
+        elif character in BRACKETS.values():
+            if opened:
+                opened.pop()
+        elif character == ',' and opened and index != last_index:
+            brackets_commas[opened[-1]].append(index)
+    for bracket_index, commas_indices in sorted(brackets_commas.items()):
+        if commas_indices:
+            return bracket_index, commas_indices
+    return None
+
+
+BACKENDS = {AUTOPEP8: fix_code_with_autopep8,
+            NONE: keep_code,
+            WRAP: wrap_code}
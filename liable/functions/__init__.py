@@ -1,6 +1,10 @@
 from .utils import (ARGUMENTS_TEMPLATES,
                     FunctionCall,
                     Argument,
+                    Lambda,
+                    Name,
                     signature,
+                    signatures_cache_info,
+                    clear_signatures_cache,
                     dependants_paths,
                     walk)
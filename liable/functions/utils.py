@@ -1,20 +1,24 @@
 import inspect
 import operator
+import weakref
 from contextlib import suppress
 from functools import partial
 from itertools import (chain,
                        filterfalse)
 from types import FunctionType
 from typing import (Any,
+                    Optional,
                     Iterable,
                     Iterator,
                     NamedTuple,
                     Dict,
                     Tuple,
+                    Union,
                     List)
 
 from liable import (annotator,
                     namespaces,
+                    phases,
                     catalog,
                     strings)
 from liable.catalog import ObjectPathType
@@ -30,9 +34,48 @@ ARGUMENTS_TEMPLATES = {
     inspect._VAR_KEYWORD: '**{argument}'}
 
 
-class Signature(NamedTuple):
-    parameters: List[inspect.Parameter]
-    return_type: annotator.Annotation
+class Signature:
+    """
+    Signature with annotations normalized on first access.
+
+    Instances are shared between callers
+    and should not be modified.
+    """
+
+    def __init__(self, raw_signature: inspect.Signature) -> None:
+        self._raw_signature = raw_signature
+        self._parameters = None
+        self._return_type = None
+
+    @property
+    def parameters(self) -> List[inspect.Parameter]:
+        if self._parameters is None:
+            parameters = self._raw_signature.parameters.values()
+            with phases.measured(phases.SIGNATURES):
+                self._parameters = list(map(normalize_annotation,
+                                            parameters))
+        return self._parameters
+
+    @property
+    def return_type(self) -> annotator.Annotation:
+        if self._return_type is None:
+            with phases.measured(phases.SIGNATURES):
+                self._return_type = annotator.normalize(
+                        self._raw_signature.return_annotation)
+        return self._return_type
+
+
+class SignaturesCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+signatures = weakref.WeakKeyDictionary()
+# for objects which cannot be weakly referenced (e.g. slot wrappers)
+signatures_of_unreferenceable = {}
+signatures_cache_hits = 0
+signatures_cache_misses = 0
 
 
 class Argument:
@@ -79,6 +122,26 @@ class FunctionCall:
                         arguments=arguments_str))
 
 
+class Name:
+    """Name defined by generated code itself."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def to_string(self, namespace: NamespaceType) -> str:
+        return self.name
+
+
+class Lambda:
+    """Function without parameters evaluating given call or name."""
+
+    def __init__(self, body: Union[FunctionCall, Name]):
+        self.body = body
+
+    def to_string(self, namespace: NamespaceType) -> str:
+        return 'lambda: ' + self.body.to_string(namespace)
+
+
 def walk(object_: Any) -> Iterator[Any]:
     def is_function_call(object_: Any) -> bool:
         return isinstance(object_, FunctionCall)
@@ -89,6 +152,9 @@ def walk(object_: Any) -> Iterator[Any]:
             return
         elif is_function_call(value):
             yield from walk_function_call(value)
+        elif isinstance(value, Lambda):
+            if is_function_call(value.body):
+                yield from walk_function_call(value.body)
         else:
             yield value
 
@@ -116,10 +182,8 @@ def dependants_paths(functions: Iterable[FunctionType],
                                     namespace=namespace)
     signatures_dependants = chain.from_iterable(map(dependencies_detector,
                                                     functions))
-    object_path_seeker = partial(namespaces.search_path,
-                                 namespace=namespace)
-    result = set(chain(map(object_path_seeker,
-                           signatures_dependants)))
+    result = set(namespaces.search_objects_paths(signatures_dependants,
+                                                 namespace=namespace))
     yield from filterfalse(catalog.is_built_in, result)
 
 
@@ -138,12 +202,51 @@ def dependencies(function: FunctionType,
 
 
 def signature(function: FunctionType) -> Signature:
-    raw_signature = inspect.signature(function)
-    parameters = raw_signature.parameters.values()
-    parameters = list(map(normalize_annotation, parameters))
-    return_type = annotator.normalize(raw_signature.return_annotation)
-    return Signature(parameters=parameters,
-                     return_type=return_type)
+    """
+    Returns signature of given function
+    computed once per function
+    (until ``clear_signatures_cache`` call).
+    """
+    global signatures_cache_hits, signatures_cache_misses
+    cache = to_signatures_cache(function)
+    if cache is not None:
+        with suppress(KeyError):
+            result = cache[function]
+            signatures_cache_hits += 1
+            return result
+    signatures_cache_misses += 1
+    with phases.measured(phases.SIGNATURES):
+        result = Signature(inspect.signature(function))
+    if cache is not None:
+        cache[function] = result
+    return result
+
+
+def to_signatures_cache(function: FunctionType
+                        ) -> Optional[Dict[FunctionType, Signature]]:
+    try:
+        weakref.ref(function)
+    except TypeError:
+        try:
+            hash(function)
+        except TypeError:
+            return None
+        return signatures_of_unreferenceable
+    return signatures
+
+
+def signatures_cache_info() -> SignaturesCacheInfo:
+    return SignaturesCacheInfo(
+            hits=signatures_cache_hits,
+            misses=signatures_cache_misses,
+            size=len(signatures) + len(signatures_of_unreferenceable))
+
+
+def clear_signatures_cache() -> None:
+    global signatures_cache_hits, signatures_cache_misses
+    signatures.clear()
+    signatures_of_unreferenceable.clear()
+    signatures_cache_hits = signatures_cache_misses = 0
 
 
 def normalize_annotation(parameter: inspect.Parameter) -> inspect.Parameter:
@@ -0,0 +1,439 @@
+import collections
+import inspect
+import os
+from functools import partial
+from itertools import (chain,
+                       starmap)
+from typing import (Any,
+                    Callable,
+                    ContextManager,
+                    Optional,
+                    Iterable,
+                    Iterator,
+                    NamedTuple,
+                    Dict,
+                    Tuple,
+                    List)
+
+from . import (annotator,
+               arboretum,
+               catalog,
+               file_system,
+               fixtures,
+               formatting,
+               functions,
+               manifests,
+               modules,
+               namespaces,
+               parallel,
+               parameters,
+               phases,
+               strategies,
+               test_cases)
+from .types import NamespaceType
+
+utilities = {
+    catalog.ModulePath(collections.__name__): collections,
+    catalog.ContentPath(module=catalog.ModulePath(Any.__module__),
+                        object='Any',
+                        type=catalog.PathType.relative): Any,
+    catalog.ContentPath(module=catalog.ModulePath(Optional.__module__),
+                        object='Optional',
+                        type=catalog.PathType.relative): Optional,
+    catalog.ContentPath(module=catalog.ModulePath(Tuple.__module__),
+                        object='Tuple',
+                        type=catalog.PathType.relative): Tuple,
+    catalog.ContentPath(module=catalog.ModulePath(Dict.__module__),
+                        object='Dict',
+                        type=catalog.PathType.relative): Dict,
+}
+
+
+def write_utilities(modules_paths: List[str],
+                    *,
+                    target_directory: str,
+                    spaces_count: int,
+                    strategies_module_name: str,
+                    fixtures_module_name: str,
+                    tests_module_name: str,
+                    overwrite: bool,
+                    jobs: int = 1,
+                    streaming: bool = False) -> None:
+    if streaming:
+        modules_namespace, modules_parameters = streamed_parameters(
+                modules_paths)
+    else:
+        modules_namespace, modules_parameters = loaded_parameters(
+                modules_paths,
+                jobs=jobs)
+    write_parameters_utilities(modules_parameters,
+                               namespace=modules_namespace,
+                               target_directory=target_directory,
+                               spaces_count=spaces_count,
+                               strategies_module_name=strategies_module_name,
+                               fixtures_module_name=fixtures_module_name,
+                               tests_module_name=tests_module_name,
+                               overwrite=overwrite,
+                               jobs=jobs,
+                               streaming=streaming)
+
+
+def write_parameters_utilities(modules_parameters: List[inspect.Parameter],
+                               *,
+                               namespace: NamespaceType,
+                               target_directory: str,
+                               spaces_count: int,
+                               strategies_module_name: str,
+                               fixtures_module_name: str,
+                               tests_module_name: str,
+                               overwrite: bool,
+                               jobs: int = 1,
+                               streaming: bool = False) -> None:
+    modules_parameters = parameters.combine(modules_parameters,
+                                            namespace=namespace)
+    strategies_directory = os.path.join(target_directory,
+                                        strategies_module_name)
+    fixtures_directory = os.path.join(target_directory, fixtures_module_name)
+    file_system.make_packages(strategies_directory)
+    file_system.make_packages(fixtures_directory)
+    fixtures_factory = partial(fixtures.from_parameters,
+                               spaces_count=spaces_count,
+                               tests_module_name=tests_module_name,
+                               strategies_module_name=strategies_module_name)
+    sources_factory = partial(utilities_sources,
+                              namespace=namespace,
+                              fixtures_factory=fixtures_factory,
+                              streaming=streaming)
+    # namespace objects are not guaranteed to be picklable,
+    # so rendering workers inherit them instead
+    modules_sources = parallel.imap_inherited(sources_factory,
+                                              modules_parameters.items(),
+                                              jobs=jobs)
+    for module_path, (strategies_source,
+                      fixtures_source) in zip(modules_parameters.keys(),
+                                              modules_sources):
+        module_full_name = str(module_path)
+        with phases.processing(module_full_name):
+            write_source(strategies_source,
+                         top_directory=strategies_directory,
+                         module_full_name=module_full_name,
+                         overwrite=overwrite)
+            write_source(fixtures_source,
+                         top_directory=fixtures_directory,
+                         module_full_name=module_full_name,
+                         overwrite=overwrite)
+    init_module_path = os.path.join(strategies_directory,
+                                    file_system.INIT_MODULE_FILE_NAME)
+    # TODO: merge related or duplicated imports
+    mode = 'w' if overwrite else 'a'
+    with open(init_module_path,
+              mode=mode) as init_module_file:
+        init_module_file.write(strategies.init_module(modules_parameters))
+
+
+def write_all(modules_paths: List[str],
+              *,
+              target_directory: str,
+              spaces_count: int,
+              strategies_module_name: str,
+              fixtures_module_name: str,
+              tests_module_name: str,
+              overwrite: bool,
+              jobs: int = 1,
+              tests_modules_paths: Optional[List[str]] = None) -> None:
+    """
+    Writes utilities & test cases for given modules
+    from single analysis of them.
+
+    If ``tests_modules_paths`` are specified
+    test cases are written only for these modules.
+    """
+    analysis = analyze(modules_paths,
+                       jobs=jobs)
+    write_parameters_utilities(analysis.parameters,
+                               namespace=analysis.namespace,
+                               target_directory=target_directory,
+                               spaces_count=spaces_count,
+                               strategies_module_name=strategies_module_name,
+                               fixtures_module_name=fixtures_module_name,
+                               tests_module_name=tests_module_name,
+                               overwrite=overwrite,
+                               jobs=jobs)
+    if tests_modules_paths is None:
+        tests_modules_paths = modules_paths
+    sources_factory = partial(namespace_test_cases_source,
+                              built_ins=analysis.built_ins,
+                              spaces_count=spaces_count)
+    modules_items = [(module_path, analysis.modules_namespaces[module_path])
+                     for module_path in tests_modules_paths]
+    # namespace objects are not guaranteed to be picklable,
+    # so rendering workers inherit them instead
+    modules_sources = parallel.imap_inherited(sources_factory, modules_items,
+                                              jobs=jobs)
+    write_test_cases_sources(tests_modules_paths, modules_sources,
+                             target_directory=target_directory,
+                             overwrite=overwrite)
+
+
+class Analysis(NamedTuple):
+    # namespaces of modules by their paths
+    modules_namespaces: Dict[str, NamespaceType]
+    built_ins: NamespaceType
+    # modules namespaces merged with built-ins
+    namespace: NamespaceType
+    # parameters of modules functions
+    parameters: List[inspect.Parameter]
+
+
+def analyze(modules_paths: List[str],
+            *,
+            jobs: int = 1) -> Analysis:
+    modules_namespaces = list(modules_paths_to_namespaces(modules_paths,
+                                                          jobs=jobs))
+    modules_functions = chain.from_iterable(map(namespaces.inner_functions,
+                                                modules_namespaces))
+    modules_parameters = list(parameters.from_functions(modules_functions))
+    built_ins = namespaces.built_ins()
+    return Analysis(modules_namespaces=dict(zip(modules_paths,
+                                                modules_namespaces)),
+                    built_ins=built_ins,
+                    namespace=namespaces.merge(built_ins,
+                                               *modules_namespaces),
+                    parameters=modules_parameters)
+
+
+def loaded_parameters(modules_paths: List[str],
+                      *,
+                      jobs: int
+                      ) -> Tuple[NamespaceType, List[inspect.Parameter]]:
+    analysis = analyze(modules_paths,
+                       jobs=jobs)
+    return analysis.namespace, analysis.parameters
+
+
+def streamed_parameters(modules_paths: List[str]
+                        ) -> Tuple[NamespaceType, List[inspect.Parameter]]:
+    """
+    Returns parameters of given modules functions
+    with namespace which has only objects they refer to (and modules).
+
+    Modules namespaces are built one at a time
+    (twice: to collect parameters & to index objects)
+    and released right after that.
+    """
+    modules_functions = chain.from_iterable(
+            map(namespaces.inner_functions,
+                streamed_namespaces(modules_paths)))
+    modules_parameters = list(parameters.from_functions(modules_functions))
+    referenced_objects_ids = set(map(id, chain.from_iterable(
+            map(referenced_objects, modules_parameters))))
+
+    def is_referenced(object_: Any) -> bool:
+        return (id(object_) in referenced_objects_ids
+                or inspect.ismodule(object_))
+
+    modules_namespace = namespaces.merge(namespaces.built_ins(), utilities)
+    for namespace in streamed_namespaces(modules_paths):
+        modules_namespace.update((path, object_)
+                                 for path, object_ in namespace.items()
+                                 if is_referenced(object_))
+    return modules_namespace, modules_parameters
+
+
+def streamed_namespaces(modules_paths: Iterable[str]
+                        ) -> Iterator[NamespaceType]:
+    for module_path in modules_paths:
+        with processing_module(module_path):
+            module = modules.from_path(module_path)
+            # bypassing cache to not keep namespace after use
+            namespace = namespaces.merge(utilities,
+                                         namespaces.from_module(module))
+        yield namespace
+        release_modules_caches()
+
+
+def referenced_objects(parameter: inspect.Parameter) -> Iterator[Any]:
+    """
+    Yields objects which utilities for given parameter could refer to.
+    """
+    annotation = parameter.annotation
+    yield from annotation.bases
+    # without namespace annotation is walked through completely
+    yield from annotator.walk(annotation,
+                              namespace=namespaces.Namespace())
+    yield from strategies.dependant_types(annotation)
+
+
+def processing_module(module_path: str) -> ContextManager[None]:
+    """
+    Attributes phases measured in the block to module with given path
+    by its full name like utilities do.
+    """
+    return phases.processing(manifests.to_module_full_name(module_path))
+
+
+def release_modules_caches() -> None:
+    namespaces.module_namespace.cache_clear()
+    arboretum.from_file.cache_clear()
+    formatting.cache.clear()
+    # interned annotations & expanded templates keep modules objects alive
+    annotator.utils.interned.clear()
+    functions.clear_signatures_cache()
+    strategies.clear_templates_cache()
+
+
+def utilities_sources(module_item: Tuple[catalog.ModulePath,
+                                         List[inspect.Parameter]],
+                      *,
+                      namespace: NamespaceType,
+                      fixtures_factory: Callable[..., str],
+                      streaming: bool = False) -> Tuple[str, str]:
+    module_path, module_parameters = module_item
+    with phases.processing(str(module_path)):
+        result = (strategies.from_parameters(module_parameters,
+                                             namespace=namespace),
+                  fixtures_factory(module_parameters,
+                                   namespace=namespace))
+    if streaming:
+        release_modules_caches()
+    return result
+
+
+def write_test_cases(modules_paths: List[str],
+                     *,
+                     target_directory: str,
+                     spaces_count: int,
+                     overwrite: bool,
+                     jobs: int = 1,
+                     streaming: bool = False) -> None:
+    sources_factory = partial(test_cases_source,
+                              built_ins=namespaces.built_ins(),
+                              spaces_count=spaces_count,
+                              streaming=streaming)
+    # built-ins namespace is built once
+    # & is not guaranteed to be picklable,
+    # so workers inherit it instead
+    modules_sources = parallel.imap_inherited(sources_factory, modules_paths,
+                                              jobs=jobs)
+    write_test_cases_sources(modules_paths, modules_sources,
+                             target_directory=target_directory,
+                             overwrite=overwrite)
+
+
+def write_test_cases_sources(modules_paths: List[str],
+                             modules_sources: Iterable[Optional[str]],
+                             *,
+                             target_directory: str,
+                             overwrite: bool) -> None:
+    for path, source in zip(modules_paths, modules_sources):
+        if source is None:
+            continue
+        module_full_name = str(catalog.path_to_module_path(
+                test_cases.normalize_path(path)))
+        with processing_module(path):
+            write_source(source,
+                         top_directory=target_directory,
+                         module_full_name=module_full_name,
+                         overwrite=overwrite)
+
+
+def test_cases_source(module_path: str,
+                      *,
+                      spaces_count: int,
+                      built_ins: Optional[NamespaceType] = None,
+                      streaming: bool = False) -> Optional[str]:
+    """
+    Returns test cases source for given module if it has functions.
+
+    In streaming mode caches built for the module are released after that.
+    """
+    try:
+        with processing_module(module_path):
+            namespace, = modules_paths_to_namespaces([module_path])
+            return namespace_test_cases_source((module_path, namespace),
+                                               spaces_count=spaces_count,
+                                               built_ins=built_ins)
+    finally:
+        if streaming:
+            release_modules_caches()
+
+
+def namespace_test_cases_source(module_item: Tuple[str, NamespaceType],
+                                *,
+                                spaces_count: int,
+                                built_ins: Optional[NamespaceType] = None
+                                ) -> Optional[str]:
+    module_path, namespace = module_item
+    with processing_module(module_path):
+        module_functions = list(namespaces.inner_functions(namespace))
+        if not module_functions:
+            return None
+        if built_ins is None:
+            built_ins = namespaces.built_ins()
+        namespace = namespaces.merge(built_ins, namespace)
+        return test_cases.from_functions(module_functions,
+                                         namespace=namespace,
+                                         spaces_count=spaces_count)
+
+
+def modules_paths_to_namespaces(modules_paths: Iterable[str],
+                                *,
+                                jobs: int = 1
+                                ) -> Iterator[NamespaceType]:
+    add_utilities = partial(namespaces.merge, utilities)
+    if jobs == 1:
+        modules_namespaces = map(module_path_to_namespace, modules_paths)
+    else:
+        # namespaces get built by workers
+        # and passed back as their keys
+        # since objects are not guaranteed to be picklable
+        modules_paths = list(modules_paths)
+        modules_objects_paths = parallel.imap(module_objects_paths,
+                                              modules_paths,
+                                              jobs=jobs)
+        modules_namespaces = starmap(objects_paths_to_namespace,
+                                     zip(modules_paths,
+                                         modules_objects_paths))
+    yield from map(add_utilities, modules_namespaces)
+
+
+def module_path_to_namespace(module_path: str) -> NamespaceType:
+    with processing_module(module_path):
+        module = modules.from_path(module_path)
+        return namespaces.module_namespace(module)
+
+
+def objects_paths_to_namespace(module_path: str,
+                               objects_paths: List[catalog.ObjectPathType]
+                               ) -> NamespaceType:
+    with processing_module(module_path):
+        return namespaces.from_objects_paths(
+                objects_paths,
+                module=modules.from_path(module_path))
+
+
+def module_objects_paths(module_path: str) -> List[catalog.ObjectPathType]:
+    with processing_module(module_path):
+        module = modules.from_path(module_path)
+        return list(namespaces.module_namespace(module).keys())
+
+
+@phases.measures(phases.WRITING)
+def write_source(source: str,
+                 *,
+                 top_directory: str,
+                 module_full_name: str,
+                 source_extension: str = file_system.SOURCE_EXTENSION,
+                 overwrite: bool) -> None:
+    *sub_directories, module_name = module_full_name.split(catalog.SEPARATOR)
+    file_system.make_packages(top_directory, *sub_directories)
+    module_directory = os.path.join(top_directory,
+                                    *sub_directories)
+    os.makedirs(module_directory,
+                exist_ok=True)
+    module_path = os.path.join(module_directory,
+                               module_name + source_extension)
+    mode = 'w' if overwrite else 'a'
+    with open(module_path,
+              mode=mode) as module_file:
+        module_file.write(source)
@@ -0,0 +1,132 @@
+import mmap
+import os
+from functools import lru_cache
+from typing import (Iterable,
+                    Optional,
+                    Tuple,
+                    List)
+
+DIRECTORY = os.path.join(os.path.dirname(__file__), 'data')
+NOUNS_FILE_NAME = 'nouns.txt'
+NOUNS_EXCEPTIONS_FILE_NAME = 'nouns_exceptions.txt'
+ENCODING = 'utf-8'
+LINES_SEPARATOR = b'\n'
+FIELDS_SEPARATOR = b' '
+
+# same as WordNet's rules of detaching nouns inflectional endings
+NOUNS_SUBSTITUTIONS = [('s', ''),
+                       ('ses', 's'),
+                       ('ves', 'f'),
+                       ('xes', 'x'),
+                       ('zes', 'z'),
+                       ('ches', 'ch'),
+                       ('shes', 'sh'),
+                       ('men', 'man'),
+                       ('ies', 'y')]
+
+
+class Table:
+    """
+    Memory-mapped file with lines of space-separated fields
+    sorted by the first one
+    which is used as a key for binary search.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, mode='rb') as file:
+            if os.fstat(file.fileno()).st_size:
+                self._content = mmap.mmap(file.fileno(), 0,
+                                          access=mmap.ACCESS_READ)
+            else:
+                self._content = b''
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """Returns fields following given key if it is present."""
+        content = self._content
+        target = key.encode(ENCODING)
+        low, high = 0, len(content)
+        while low < high:
+            middle = (low + high) // 2
+            start = content.rfind(LINES_SEPARATOR, 0, middle) + 1
+            stop = content.find(LINES_SEPARATOR, start)
+            if stop == -1:
+                stop = len(content)
+            line_key, *fields = content[start:stop].split(FIELDS_SEPARATOR)
+            if line_key == target:
+                return [field.decode(ENCODING) for field in fields]
+            elif line_key < target:
+                low = stop + 1
+            else:
+                high = start
+        return None
+
+
+@lru_cache(maxsize=None)
+def nouns_tables(directory: str = DIRECTORY
+                 ) -> Optional[Tuple[Table, Table]]:
+    """
+    Returns tables of nouns lemmas & their exceptional inflected forms
+    if lexicon was built.
+    """
+    try:
+        return (Table(os.path.join(directory, NOUNS_FILE_NAME)),
+                Table(os.path.join(directory, NOUNS_EXCEPTIONS_FILE_NAME)))
+    except OSError:
+        return None
+
+
+def is_noun(word: str,
+            *,
+            tables: Tuple[Table, Table]) -> bool:
+    """
+    Checks if given word is a form of some noun
+    the same way as ``wordnet.synsets`` resolves lemmas.
+    """
+    nouns, exceptions = tables
+    word = word.lower()
+    bases = exceptions.get(word)
+    if bases is None:
+        bases = [word[:-len(old)] + new
+                 for old, new in NOUNS_SUBSTITUTIONS
+                 if word.endswith(old)]
+    return any(form in nouns for form in [word] + bases)
+
+
+def build(directory: str = DIRECTORY) -> None:
+    """Builds nouns lexicon from WordNet corpus (requires its data)."""
+    from nltk.corpus import wordnet
+
+    nouns = sorted_by_keys(lemma
+                           for lemma in wordnet.all_lemma_names(wordnet.NOUN)
+                           if is_key(lemma))
+    exceptions = sorted_by_keys(
+            ' '.join([form] + bases)
+            for form, bases in wordnet._exception_map[wordnet.NOUN].items()
+            if is_key(form))
+    os.makedirs(directory,
+                exist_ok=True)
+    write_lines(nouns,
+                path=os.path.join(directory, NOUNS_FILE_NAME))
+    write_lines(exceptions,
+                path=os.path.join(directory, NOUNS_EXCEPTIONS_FILE_NAME))
+
+
+def is_key(string: str) -> bool:
+    # lookups are done for alphanumeric words only
+    return FIELDS_SEPARATOR.decode(ENCODING) not in string
+
+
+def sorted_by_keys(lines: Iterable[str]) -> List[bytes]:
+    encoded_lines = (line.encode(ENCODING) for line in lines)
+    return sorted(set(encoded_lines),
+                  key=lambda line: line.split(FIELDS_SEPARATOR, 1)[0])
+
+
+def write_lines(lines: List[bytes],
+                *,
+                path: str) -> None:
+    with open(path, mode='wb') as file:
+        file.write(LINES_SEPARATOR.join(lines))
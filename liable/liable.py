@@ -1,37 +1,56 @@
 #!/usr/bin/env python3
 import collections
-import operator
+import io
+import json
 import os
+import socket
+import time
+import tracemalloc
+import traceback
+from contextlib import (ExitStack,
+                        redirect_stderr,
+                        redirect_stdout)
 from functools import partial
-from itertools import (filterfalse,
-                       chain)
+from itertools import (chain,
+                       repeat)
 from typing import (Any,
+                    Callable,
+                    ContextManager,
                     Optional,
-                    Iterable,
-                    Iterator,
                     Dict,
                     Tuple,
                     List)
 
 import click
-from pathspec import (PathSpec,
-                      patterns)
 
-from liable import (modules,
-                    namespaces,
+from liable import (caching,
+                    daemon,
                     file_system,
-                    catalog,
-                    parameters,
-                    strategies,
-                    fixtures,
-                    test_cases)
-from liable.types import NamespaceType
-from liable.utils import (is_python_module,
-                          merge_mappings)
+                    formatting,
+                    functions,
+                    manifests,
+                    modules,
+                    parallel,
+                    phases,
+                    strings,
+                    stubs)
+from liable.utils import is_python_module
 from liable.validators import (validate_paths,
                                validate_modules_paths)
 
-__version__ = '0.0.3'
+MODULES_CHECKS_CHUNK_SIZE = 64
+TIMINGS_MODULES_COUNT = 10
+# caches counters which are reported as is instead of their changes
+CACHES_GAUGES = {'size'}
+MODULES_INCREMENTAL_HELP = ('Regenerates only modules '
+                            'changed since previous run '
+                            'along with modules which import them '
+                            '(requires "--overwrite" flag).')
+ALL_INCREMENTAL_HELP = ('Regenerates utilities & test cases '
+                        'if modules changed since previous run '
+                        '(test cases only for changed modules '
+                        'along with modules which import them, '
+                        'requires "--overwrite" flag).')
 
 
 @click.group()
@@ -47,10 +66,25 @@ def main() -> None:
               help='Path to file with patterns of paths names to ignore '
                    '(based on ".gitignore" syntax, '
                    'more at https://git-scm.com/docs/gitignore).')
+@click.option('--null', '-0', 'null_separated',
+              is_flag=True,
+              help='Separates paths with null characters '
+                   '(e.g. for "xargs -0") instead of spaces.')
+@click.option('--strict',
+              is_flag=True,
+              help='Checks that whole modules compile '
+                   'instead of their extensions, shebangs & heads only.')
+@click.option('--jobs', '-j',
+              type=click.IntRange(1),
+              default=1,
+              help='Number of worker processes for strict checks.')
 @click.argument('paths',
                 nargs=-1)
 def search_modules(recursive: bool,
                    ignore_patterns_path: str,
+                   null_separated: bool,
+                   strict: bool,
+                   jobs: int,
                    paths: List[str]) -> None:
     """Searches Python modules in paths."""
     if not paths:
@@ -64,62 +98,149 @@ def search_modules(recursive: bool,
     except OSError as err:
         raise click.BadParameter(err) from err
 
-    files_paths_seeker = partial(file_system.find_files,
-                                 recursive=recursive)
-    files_paths = chain.from_iterable(map(files_paths_seeker, paths))
-    modules_paths = filter(is_python_module, files_paths)
-
+    is_ignored = None
     if ignore_patterns_path:
+        from pathspec import (PathSpec,
+                              patterns)
+
         with open(ignore_patterns_path) as ignore_patterns_file:
             path_spec = PathSpec.from_lines(patterns.GitWildMatchPattern,
                                             ignore_patterns_file)
-        modules_paths = list(modules_paths)
-        ignored_paths = list(path_spec.match_files(modules_paths))
-        modules_paths = filterfalse(partial(operator.contains,
-                                            ignored_paths),
-                                    modules_paths)
-    click.echo(' '.join(modules_paths))
-
-
-utilities = {
-    catalog.ModulePath(collections.__name__): collections,
-    catalog.ContentPath(module=catalog.ModulePath(Any.__module__),
-                        object='Any',
-                        type=catalog.PathType.relative): Any,
-    catalog.ContentPath(module=catalog.ModulePath(Optional.__module__),
-                        object='Optional',
-                        type=catalog.PathType.relative): Optional,
-    catalog.ContentPath(module=catalog.ModulePath(Tuple.__module__),
-                        object='Tuple',
-                        type=catalog.PathType.relative): Tuple,
-    catalog.ContentPath(module=catalog.ModulePath(Dict.__module__),
-                        object='Dict',
-                        type=catalog.PathType.relative): Dict,
-}
+        is_ignored = path_spec.match_file
+
+    files_paths_seeker = partial(file_system.find_files,
+                                 recursive=recursive,
+                                 is_ignored=is_ignored)
+    files_paths = chain.from_iterable(map(files_paths_seeker, paths))
+    # non-strict checks are I/O-bound, so there is no need for workers
+    modules_paths_or_nones = parallel.imap(
+            partial(to_module_path,
+                    strict=strict),
+            files_paths,
+            jobs=jobs if strict else 1,
+            chunk_size=MODULES_CHECKS_CHUNK_SIZE)
+    modules_paths = filter(None, modules_paths_or_nones)
+
+    # paths are printed as soon as they are found
+    if null_separated:
+        for module_path in modules_paths:
+            click.echo(module_path + '\0',
+                       nl=False)
+        return
+    separators = chain([''], repeat(' '))
+    for separator, module_path in zip(separators, modules_paths):
+        click.echo(separator + module_path,
+                   nl=False)
+    click.echo()
+
+
+def to_module_path(path: str,
+                   *,
+                   strict: bool) -> Optional[str]:
+    if is_python_module(path,
+                        strict=strict):
+        return path
+    return None
+
+
+def generation_options(*,
+                       utilities: bool,
+                       streaming: bool,
+                       incremental_help: str
+                       ) -> Callable[[Callable[..., None]],
+                                     Callable[..., None]]:
+    """Returns decorator which adds options of generation commands."""
+    options = [click.option('--target-directory', '-t',
+                            type=click.Path(exists=True),
+                            required=True,
+                            help='Target directory.'),
+               click.option('--spaces-count', '-s',
+                            type=click.IntRange(1),
+                            default=4,
+                            help='Number of spaces used for indentation.')]
+    if utilities:
+        options += [click.option('--strategies-module-name',
+                                 default='strategies',
+                                 help='Strategies module name.'),
+                    click.option('--fixtures-module-name',
+                                 default='fixtures',
+                                 help='Fixtures module name.'),
+                    click.option('--tests-module-name',
+                                 default='tests',
+                                 help='Tests module name.')]
+    options += [
+        click.option('--overwrite',
+                     is_flag=True,
+                     help='Overwrites source file '
+                          'if it\'s already exists.'),
+        click.option('--cache-dir',
+                     type=click.Path(file_okay=False),
+                     default=caching.DEFAULT_DIRECTORY,
+                     show_default=True,
+                     help='Directory for persistent '
+                          'modules namespaces cache.'),
+        click.option('--no-cache',
+                     is_flag=True,
+                     help='Disables persistent modules namespaces cache.'),
+        click.option('--static',
+                     is_flag=True,
+                     help='Analyses stubs of modules '
+                          'instead of executing them: '
+                          'only imports, conditions, '
+                          'classes & functions definitions are executed '
+                          '(standard library modules are imported as usual).'),
+        click.option('--jobs', '-j',
+                     type=click.IntRange(1),
+                     default=1,
+                     help='Number of worker processes.')]
+    if streaming:
+        options.append(click.option(
+                '--streaming',
+                is_flag=True,
+                help='Processes modules one at a time '
+                     'keeping only data needed across them '
+                     'to bound memory usage '
+                     '(incompatible with "--jobs" greater than 1).'))
+    options += [
+        click.option('--incremental',
+                     is_flag=True,
+                     help=incremental_help),
+        click.option('--formatter',
+                     type=click.Choice(sorted(formatting.BACKENDS)),
+                     default=formatting.AUTOPEP8,
+                     show_default=True,
+                     help='Generated code formatting backend.'),
+        click.option('--timings',
+                     type=click.Path(dir_okay=False,
+                                     writable=True),
+                     help='Path to write JSON report '
+                          'with wall time & calls count of phases to.'),
+        click.option('--timings-modules-count',
+                     type=click.IntRange(0),
+                     default=TIMINGS_MODULES_COUNT,
+                     show_default=True,
+                     help='Number of the slowest modules '
+                          'to break down in timings report.'),
+        click.option('--memory-report',
+                     type=click.Path(dir_okay=False,
+                                     writable=True),
+                     help='Path to write JSON report '
+                          'with memory usage on phases boundaries to '
+                          '(measured by "tracemalloc" in current process).')]
+
+    def decorate(command: Callable[..., None]) -> Callable[..., None]:
+        # options are listed in order of decorators application
+        for option in reversed(options):
+            command = option(command)
+        return command
+
+    return decorate
 
 
 @main.command(name='utilities')
-@click.option('--target-directory', '-t',
-              type=click.Path(exists=True),
-              required=True,
-              help='Target directory.')
-@click.option('--spaces-count', '-s',
-              type=click.IntRange(1),
-              default=4,
-              help='Number of spaces used for indentation.')
-@click.option('--strategies-module-name',
-              default='strategies',
-              help='Strategies module name.')
-@click.option('--fixtures-module-name',
-              default='fixtures',
-              help='Fixtures module name.')
-@click.option('--tests-module-name',
-              default='tests',
-              help='Tests module name.')
-@click.option('--overwrite',
-              is_flag=True,
-              help='Overwrites source file '
-                   'if it\'s already exists.')
+@generation_options(utilities=True,
+                    streaming=True,
+                    incremental_help=MODULES_INCREMENTAL_HELP)
 @click.argument('modules_paths',
                 nargs=-1)
 def generate_utilities(target_directory: Optional[str],
@@ -128,138 +249,532 @@ def generate_utilities(target_directory: Optional[str],
                        fixtures_module_name: str,
                        tests_module_name: str,
                        overwrite: bool,
+                       cache_dir: str,
+                       no_cache: bool,
+                       static: bool,
+                       jobs: int,
+                       streaming: bool,
+                       incremental: bool,
+                       formatter: str,
+                       timings: Optional[str],
+                       timings_modules_count: int,
+                       memory_report: Optional[str],
                        modules_paths: List[str]) -> None:
     """Generates strategies & fixtures skeletons."""
     if not modules_paths:
         err_msg = 'No paths specified.'
         raise click.BadParameter(err_msg)
 
+    validate_incremental(incremental,
+                         overwrite=overwrite)
+    validate_streaming(streaming,
+                       jobs=jobs)
+
+    caching.set_directory(None if no_cache else cache_dir)
+    formatting.set_backend(formatter)
+    if timings is not None:
+        start_timings(timings,
+                      modules_count=timings_modules_count)
+    if memory_report is not None:
+        start_memory_report(memory_report)
+
     modules_paths = list(map(os.path.abspath, modules_paths))
 
     try:
-        validate_paths(modules_paths)
-        validate_modules_paths(modules_paths)
+        with phases.measured(phases.DISCOVERY):
+            validate_paths(modules_paths)
+            validate_modules_paths(modules_paths)
     except OSError as err:
         raise click.BadParameter(err) from err
 
-    modules_namespaces = list(modules_paths_to_namespaces(modules_paths))
-    modules_functions = chain.from_iterable(map(namespaces.inner_functions,
-                                                modules_namespaces))
-    modules_namespace = merge_mappings(*modules_namespaces)
-    modules_parameters = parameters.from_functions(modules_functions)
-    built_ins = namespaces.built_ins()
-    modules_namespace = merge_mappings(built_ins, modules_namespace)
-    modules_parameters = parameters.combine(modules_parameters,
-                                            namespace=modules_namespace)
-    strategies_directory = os.path.join(target_directory,
-                                        strategies_module_name)
-    fixtures_directory = os.path.join(target_directory, fixtures_module_name)
-    file_system.make_packages(strategies_directory)
-    file_system.make_packages(fixtures_directory)
-    fixtures_factory = partial(fixtures.from_parameters,
-                               spaces_count=spaces_count,
-                               tests_module_name=tests_module_name,
-                               strategies_module_name=strategies_module_name)
-    for module_path, module_parameters in modules_parameters.items():
-        module_full_name = str(module_path)
-        write_source(strategies.from_parameters(module_parameters,
-                                                namespace=modules_namespace),
-                     top_directory=strategies_directory,
-                     module_full_name=module_full_name,
-                     overwrite=overwrite)
-        write_source(fixtures_factory(module_parameters,
-                                      namespace=modules_namespace),
-                     top_directory=fixtures_directory,
-                     module_full_name=module_full_name,
-                     overwrite=overwrite)
-    init_module_path = os.path.join(strategies_directory,
-                                    file_system.INIT_MODULE_FILE_NAME)
-    # TODO: merge related or duplicated imports
-    with open(init_module_path, mode='a') as init_module_file:
-        init_module_file.write(strategies.init_module(modules_parameters))
+    options = {'spaces_count': spaces_count,
+               'strategies_module_name': strategies_module_name,
+               'fixtures_module_name': fixtures_module_name,
+               'tests_module_name': tests_module_name,
+               'static': static,
+               'formatter': formatter}
+    if incremental:
+        recorded_entries = manifests.load(target_directory,
+                                          command='utilities',
+                                          options=options)
+        entries = manifests.to_entries(modules_paths,
+                                       recorded=recorded_entries)
+        # parameters are combined across all modules,
+        # so any change (including removal of module) leads
+        # to full regeneration
+        if not (manifests.stale_modules_paths(entries,
+                                              recorded=recorded_entries)
+                or manifests.modules_set_changed(entries,
+                                                 recorded=recorded_entries)):
+            return
+
+    # loaded on demand since it imports test frameworks
+    from liable.generation import write_utilities
+
+    with loading(static):
+        write_utilities(modules_paths,
+                        target_directory=target_directory,
+                        spaces_count=spaces_count,
+                        strategies_module_name=strategies_module_name,
+                        fixtures_module_name=fixtures_module_name,
+                        tests_module_name=tests_module_name,
+                        overwrite=overwrite,
+                        jobs=jobs,
+                        streaming=streaming)
+    if static:
+        report_unresolved_statements()
+    if incremental:
+        manifests.save(target_directory,
+                       command='utilities',
+                       options=options,
+                       entries=entries)
 
 
 @main.command(name='tests')
-@click.option('--target-directory', '-t',
-              type=click.Path(exists=True),
-              required=True,
-              help='Target directory.')
-@click.option('--spaces-count', '-s',
-              type=click.IntRange(1),
-              default=4,
-              help='Number of spaces used for indentation.')
-@click.option('--overwrite',
-              is_flag=True,
-              help='Overwrites source file '
-                   'if it\'s already exists.')
+@generation_options(utilities=False,
+                    streaming=True,
+                    incremental_help=MODULES_INCREMENTAL_HELP)
 @click.argument('modules_paths',
                 nargs=-1)
 def generate_tests(target_directory: Optional[str],
                    spaces_count: int,
                    overwrite: bool,
+                   cache_dir: str,
+                   no_cache: bool,
+                   static: bool,
+                   jobs: int,
+                   streaming: bool,
+                   incremental: bool,
+                   formatter: str,
+                   timings: Optional[str],
+                   timings_modules_count: int,
+                   memory_report: Optional[str],
                    modules_paths: List[str]) -> None:
     """Generates test cases skeletons."""
     if not modules_paths:
         err_msg = 'No paths specified.'
         raise click.BadParameter(err_msg)
 
+    validate_incremental(incremental,
+                         overwrite=overwrite)
+    validate_streaming(streaming,
+                       jobs=jobs)
+
+    caching.set_directory(None if no_cache else cache_dir)
+    formatting.set_backend(formatter)
+    if timings is not None:
+        start_timings(timings,
+                      modules_count=timings_modules_count)
+    if memory_report is not None:
+        start_memory_report(memory_report)
+
     modules_paths = list(map(os.path.abspath, modules_paths))
 
     try:
-        validate_paths(modules_paths)
-        validate_modules_paths(modules_paths)
+        with phases.measured(phases.DISCOVERY):
+            validate_paths(modules_paths)
+            validate_modules_paths(modules_paths)
     except OSError as err:
         raise click.BadParameter(err) from err
 
-    built_ins = namespaces.built_ins()
-    test_cases_generator = partial(test_cases.from_functions,
-                                   spaces_count=spaces_count)
-    for path, namespace in zip(modules_paths,
-                               modules_paths_to_namespaces(modules_paths)):
-        module_functions = list(namespaces.inner_functions(namespace))
-        if not module_functions:
-            continue
-        namespace = merge_mappings(built_ins, namespace)
+    options = {'spaces_count': spaces_count,
+               'static': static,
+               'formatter': formatter}
+    if incremental:
+        recorded_entries = manifests.load(target_directory,
+                                          command='tests',
+                                          options=options)
+        entries = manifests.to_entries(modules_paths,
+                                       recorded=recorded_entries)
+        stale_modules_paths = manifests.stale_modules_paths(
+                entries,
+                recorded=recorded_entries)
+        modules_paths = [module_path
+                         for module_path in modules_paths
+                         if module_path in stale_modules_paths]
+
+    # loaded on demand since it imports test frameworks
+    from liable.generation import write_test_cases
+
+    with loading(static):
         try:
-            source = test_cases_generator(module_functions,
-                                          namespace=namespace)
+            write_test_cases(modules_paths,
+                             target_directory=target_directory,
+                             spaces_count=spaces_count,
+                             overwrite=overwrite,
+                             jobs=jobs,
+                             streaming=streaming)
         except ImportError as err:
             raise click.BadParameter(err) from err
-        else:
-            path = test_cases.normalize_path(path)
-            module_full_name = str(catalog.path_to_module_path(path))
-            write_source(source,
-                         top_directory=target_directory,
-                         module_full_name=module_full_name,
+    if static:
+        report_unresolved_statements()
+    if incremental:
+        manifests.save(target_directory,
+                       command='tests',
+                       options=options,
+                       entries=entries)
+
+
+@main.command(name='all')
+@generation_options(utilities=True,
+                    streaming=False,
+                    incremental_help=ALL_INCREMENTAL_HELP)
+@click.argument('modules_paths',
+                nargs=-1)
+def generate_all(target_directory: Optional[str],
+                 spaces_count: int,
+                 strategies_module_name: str,
+                 fixtures_module_name: str,
+                 tests_module_name: str,
+                 overwrite: bool,
+                 cache_dir: str,
+                 no_cache: bool,
+                 static: bool,
+                 jobs: int,
+                 incremental: bool,
+                 formatter: str,
+                 timings: Optional[str],
+                 timings_modules_count: int,
+                 memory_report: Optional[str],
+                 modules_paths: List[str]) -> None:
+    """
+    Generates strategies, fixtures & test cases skeletons
+    analysing modules once.
+    """
+    if not modules_paths:
+        err_msg = 'No paths specified.'
+        raise click.BadParameter(err_msg)
+
+    validate_incremental(incremental,
                          overwrite=overwrite)
 
+    caching.set_directory(None if no_cache else cache_dir)
+    formatting.set_backend(formatter)
+    if timings is not None:
+        start_timings(timings,
+                      modules_count=timings_modules_count)
+    if memory_report is not None:
+        start_memory_report(memory_report)
+
+    modules_paths = list(map(os.path.abspath, modules_paths))
+
+    try:
+        with phases.measured(phases.DISCOVERY):
+            validate_paths(modules_paths)
+            validate_modules_paths(modules_paths)
+    except OSError as err:
+        raise click.BadParameter(err) from err
+
+    options = {'spaces_count': spaces_count,
+               'strategies_module_name': strategies_module_name,
+               'fixtures_module_name': fixtures_module_name,
+               'tests_module_name': tests_module_name,
+               'static': static,
+               'formatter': formatter}
+    tests_modules_paths = modules_paths
+    if incremental:
+        recorded_entries = manifests.load(target_directory,
+                                          command='all',
+                                          options=options)
+        entries = manifests.to_entries(modules_paths,
+                                       recorded=recorded_entries)
+        stale_modules_paths = manifests.stale_modules_paths(
+                entries,
+                recorded=recorded_entries)
+        # parameters are combined across all modules,
+        # so any change (including removal of module) leads
+        # to full regeneration of utilities
+        if not (stale_modules_paths
+                or manifests.modules_set_changed(entries,
+                                                 recorded=recorded_entries)):
+            return
+        tests_modules_paths = [module_path
+                               for module_path in modules_paths
+                               if module_path in stale_modules_paths]
+
+    # loaded on demand since it imports test frameworks
+    from liable.generation import write_all
+
+    with loading(static):
+        try:
+            write_all(modules_paths,
+                      target_directory=target_directory,
+                      spaces_count=spaces_count,
+                      strategies_module_name=strategies_module_name,
+                      fixtures_module_name=fixtures_module_name,
+                      tests_module_name=tests_module_name,
+                      overwrite=overwrite,
+                      jobs=jobs,
+                      tests_modules_paths=tests_modules_paths)
+        except ImportError as err:
+            raise click.BadParameter(err) from err
+    if static:
+        report_unresolved_statements()
+    if incremental:
+        manifests.save(target_directory,
+                       command='all',
+                       options=options,
+                       entries=entries)
+
+
+def validate_streaming(streaming: bool,
+                       *,
+                       jobs: int) -> None:
+    if streaming and jobs > 1:
+        # modules are processed one at a time in current process
+        err_msg = ('Streaming mode '
+                   'does not support "--jobs" greater than 1.')
+        raise click.BadParameter(err_msg)
+
+
+def validate_incremental(incremental: bool,
+                         *,
+                         overwrite: bool) -> None:
+    if incremental and not overwrite:
+        # appending to existing modules would duplicate their content
+        err_msg = ('Incremental regeneration '
+                   'requires "--overwrite" flag.')
+        raise click.BadParameter(err_msg)
+
+
+def start_timings(report_path: str,
+                  *,
+                  modules_count: int) -> None:
+    """
+    Starts measuring phases of current command
+    and writes their timings report on its completion.
+    """
+    timings = phases.Timings()
+    phases.register(timings)
+    start = time.perf_counter()
+    start_counters = caches_counters()
+
+    def write_report() -> None:
+        phases.unregister(timings)
+        report = timings.to_report(total=time.perf_counter() - start,
+                                   slowest_modules_count=modules_count)
+        report['caches'] = caches_report(start_counters, caches_counters())
+        with open(report_path, mode='w') as report_file:
+            json.dump(report, report_file,
+                      indent=2)
+
+    click.get_current_context().call_on_close(write_report)
+
+
+def caches_counters() -> Dict[str, Tuple[int, ...]]:
+    """Returns counters of caches accumulated by current process."""
+    # loaded on demand since it imports test frameworks
+    from liable import strategies
+
+    return {'objects_checks': modules.objects_checks_info(),
+            'signatures': functions.signatures_cache_info(),
+            'templates': strategies.templates_cache_info()}
+
+
+def caches_report(start: Dict[str, Tuple[int, ...]],
+                  end: Dict[str, Tuple[int, ...]]) -> Dict[str, Any]:
+    """
+    Returns counters of caches changed between given states
+    (daemon accumulates them across requests)
+    with hit rates of caches which have hits & misses.
+    """
+    result = {}
+    for name, counters in end.items():
+        start_counters = start[name]
+        statistics = {field: (value
+                              if field in CACHES_GAUGES
+                              else value - getattr(start_counters, field))
+                      for field, value in counters._asdict().items()}
+        if 'hits' in statistics and 'misses' in statistics:
+            lookups = statistics['hits'] + statistics['misses']
+            statistics['hit_rate'] = (statistics['hits'] / lookups
+                                      if lookups
+                                      else None)
+        result[name] = statistics
+    return result
+
+
+def start_memory_report(report_path: str) -> None:
+    """
+    Starts tracing memory allocations of current command
+    and writes memory report on its completion.
+    """
+    # loaded on demand since it imports test frameworks
+    from liable import memory
+
+    report = memory.MemoryReport()
+    phases.register(report)
+    phases.register_entering(report.enter)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+
+    def write_report() -> None:
+        phases.unregister(report)
+        phases.unregister_entering(report.enter)
+        if not was_tracing:
+            tracemalloc.stop()
+        with open(report_path, mode='w') as report_file:
+            json.dump(report.to_report(), report_file,
+                      indent=2)
+
+    click.get_current_context().call_on_close(write_report)
+
+
+def loading(static: bool) -> ContextManager[None]:
+    if static:
+        del stubs.unresolved[:]
+        return stubs.enabled()
+    return ExitStack()
+
+
+def report_unresolved_statements() -> None:
+    if not stubs.unresolved:
+        return
+    # statements of modules imported both by workers and parent process
+    # get recorded more than once
+    unresolved_statements = collections.OrderedDict.fromkeys(
+            stubs.unresolved)
+    unresolved_statements_str = strings.join(map(str, unresolved_statements),
+                                             sep='\n')
+    click.echo('Next statements could not be resolved statically:\n'
+               '{statements}'
+               .format(statements=unresolved_statements_str),
+               err=True)
+
+
+@main.command(name='serve')
+@click.option('--socket', 'socket_path',
+              type=click.Path(dir_okay=False),
+              default=daemon.DEFAULT_SOCKET_PATH,
+              show_default=True,
+              help='Unix socket path to listen on.')
+@click.option('--watch', 'watched_directory',
+              type=click.Path(exists=True,
+                              file_okay=False),
+              default=None,
+              help='Directory to poll for modules changes '
+                   'on which last successful generation requests '
+                   'get handled again.')
+@click.option('--interval',
+              type=click.FloatRange(0.1),
+              default=daemon.POLLING_INTERVAL,
+              show_default=True,
+              help='Seconds between polls of watched directory.')
+def serve(socket_path: str,
+          watched_directory: Optional[str],
+          interval: float) -> None:
+    """
+    Serves generation commands in long-living process
+    which keeps imported modules & caches between requests.
+    """
+    validate_unix_sockets()
+    if watched_directory is not None:
+        watched_directory = os.path.abspath(watched_directory)
+    click.echo('Listening on {path}.'.format(path=socket_path),
+               err=True)
+    try:
+        daemon.serve(socket_path,
+                     handle=handle_request,
+                     report=report_response,
+                     watched_directory=watched_directory,
+                     interval=interval)
+    except KeyboardInterrupt:
+        return
+
+
+@main.command(name='request',
+              context_settings={'ignore_unknown_options': True,
+                                'allow_interspersed_args': False})
+@click.option('--socket', 'socket_path',
+              type=click.Path(dir_okay=False),
+              default=daemon.DEFAULT_SOCKET_PATH,
+              show_default=True,
+              help='Unix socket path daemon listens on.')
+@click.argument('arguments',
+                nargs=-1,
+                type=click.UNPROCESSED)
+def send_request(socket_path: str,
+                 arguments: List[str]) -> None:
+    """
+    Sends generation command with its options & arguments
+    to daemon started with "serve" command.
+    """
+    validate_unix_sockets()
+    if not arguments or arguments[0] not in daemon.SERVED_COMMANDS:
+        err_msg = ('Command should be one of: {commands}.'
+                   .format(commands=', '.join(daemon.SERVED_COMMANDS)))
+        raise click.BadParameter(err_msg)
+    try:
+        response = daemon.request(socket_path,
+                                  {'arguments': list(arguments),
+                                   'directory': os.getcwd()})
+    except OSError as err:
+        err_msg = ('Could not connect to daemon on {path}: {reason}.'
+                   .format(path=socket_path,
+                           reason=err))
+        raise click.ClickException(err_msg) from err
+    click.echo(response['output'],
+               nl=False)
+    click.get_current_context().exit(response['status'])
+
+
+def validate_unix_sockets() -> None:
+    if not hasattr(socket, 'AF_UNIX'):
+        err_msg = 'Unix sockets are not supported on this platform.'
+        raise click.UsageError(err_msg)
+
+
+def handle_request(request: daemon.RequestType) -> daemon.ResponseType:
+    """Runs requested command in current process capturing its output."""
+    arguments = request['arguments']
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        if not arguments or arguments[0] not in daemon.SERVED_COMMANDS:
+            click.echo('Unsupported command: {arguments}.'
+                       .format(arguments=' '.join(arguments)),
+                       err=True)
+            status = 2
+        else:
+            status = run_command(arguments,
+                                 directory=request['directory'])
+    return {'status': status,
+            'output': output.getvalue()}
+
+
+def run_command(arguments: List[str],
+                *,
+                directory: str) -> int:
+    previous_directory = os.getcwd()
+    os.chdir(directory)
+    try:
+        main.main(args=arguments,
+                  prog_name='liable',
+                  standalone_mode=False)
+    except click.exceptions.Exit as err:
+        return err.exit_code
+    except click.ClickException as err:
+        err.show()
+        return err.exit_code
+    except click.Abort:
+        click.echo('Aborted!',
+                   err=True)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        os.chdir(previous_directory)
+    return 0
+
 
-def modules_paths_to_namespaces(modules_paths: Iterable[str]
-                                ) -> Iterator[NamespaceType]:
-    add_utilities = partial(merge_mappings, utilities)
-    modules_namespaces = map(namespaces.from_module,
-                             map(modules.from_path, modules_paths))
-    yield from map(add_utilities, modules_namespaces)
-
-
-def write_source(source: str,
-                 *,
-                 top_directory: str,
-                 module_full_name: str,
-                 source_extension: str = file_system.SOURCE_EXTENSION,
-                 overwrite: bool) -> None:
-    *sub_directories, module_name = module_full_name.split(catalog.SEPARATOR)
-    file_system.make_packages(top_directory, *sub_directories)
-    module_directory = os.path.join(top_directory,
-                                    *sub_directories)
-    os.makedirs(module_directory,
-                exist_ok=True)
-    module_path = os.path.join(module_directory,
-                               module_name + source_extension)
-    mode = 'w' if overwrite else 'a'
-    with open(module_path,
-              mode=mode) as module_file:
-        module_file.write(source)
+def report_response(response: daemon.ResponseType) -> None:
+    click.echo(response['output'],
+               nl=False)
+    if response['status']:
+        click.echo('Regeneration failed with status {status}.'
+                   .format(status=response['status']),
+                   err=True)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,228 @@
+import ast
+import json
+import os
+from collections import defaultdict
+from typing import (Any,
+                    Iterable,
+                    Iterator,
+                    Optional,
+                    Dict,
+                    Set,
+                    Tuple,
+                    List)
+
+from . import (__version__,
+               arboretum,
+               caching,
+               catalog,
+               file_system,
+               phases)
+
+FILE_NAME_TEMPLATE = '.liable-{command}.json'
+
+EntryType = Dict[str, Any]
+# path, content hash & imported modules names of module
+DependencyType = Tuple[str, str, List[str]]
+
+
+def load(target_directory: str,
+         *,
+         command: str,
+         options: Dict[str, Any]) -> Dict[str, EntryType]:
+    """
+    Returns modules entries recorded by previous run of given command
+    with the same options & ``liable`` version,
+    empty dictionary otherwise.
+    """
+    path = to_path(target_directory,
+                   command=command)
+    try:
+        with open(path) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+    if (manifest.get('version') != __version__
+            or manifest.get('interpreter') != caching.INTERPRETER
+            or manifest.get('options') != options):
+        return {}
+    return manifest.get('modules', {})
+
+
+def save(target_directory: str,
+         *,
+         command: str,
+         options: Dict[str, Any],
+         entries: Dict[str, EntryType]) -> None:
+    manifest = {'version': __version__,
+                'interpreter': caching.INTERPRETER,
+                'options': options,
+                'modules': entries}
+    caching.write_entry(manifest,
+                        path=to_path(target_directory,
+                                     command=command))
+
+
+def to_path(target_directory: str,
+            *,
+            command: str) -> str:
+    return os.path.join(target_directory,
+                        FILE_NAME_TEMPLATE.format(command=command))
+
+
+@phases.measures(phases.DISCOVERY)
+def to_entries(modules_paths: Iterable[str],
+               *,
+               recorded: Dict[str, EntryType]) -> Dict[str, EntryType]:
+    """
+    Returns entries with content hash, imported modules names
+    & content hashes of project modules
+    which are (transitively) imported but not given
+    for given modules,
+    imports are re-parsed only for modules which content has changed.
+    """
+    modules_paths = list(modules_paths)
+    excluded_paths = set(map(os.path.normcase, modules_paths))
+    dependencies_cache = {}
+    result = {}
+    for module_path in modules_paths:
+        content_hash = caching.to_hash(module_path)
+        recorded_entry = recorded.get(module_path, {})
+        if recorded_entry.get('hash') == content_hash:
+            imports = recorded_entry['imports']
+        else:
+            imports = sorted(set(imported_modules_names(module_path)))
+        dependencies = dependencies_hashes(imports,
+                                           excluded_paths=excluded_paths,
+                                           cache=dependencies_cache)
+        result[module_path] = {'hash': content_hash,
+                               'imports': imports,
+                               'dependencies': dependencies}
+    return result
+
+
+def dependencies_hashes(modules_names: Iterable[str],
+                        *,
+                        excluded_paths: Set[str],
+                        cache: Dict[str, DependencyType]) -> Dict[str, str]:
+    """
+    Returns content hashes of not installed modules by their paths
+    which given modules (transitively) refer to
+    except of modules with excluded paths
+    (they are tracked by their own entries).
+    """
+    result = {}
+    visited_names = set()
+    queue = list(modules_names)
+    while queue:
+        module_name = queue.pop()
+        if module_name in visited_names:
+            continue
+        visited_names.add(module_name)
+        try:
+            dependency = cache[module_name]
+        except KeyError:
+            dependency = cache[module_name] = to_dependency(
+                    module_name,
+                    excluded_paths=excluded_paths)
+        if dependency is None:
+            continue
+        module_path, content_hash, imports = dependency
+        result[module_path] = content_hash
+        queue.extend(imports)
+    return result
+
+
+def to_dependency(module_name: str,
+                  *,
+                  excluded_paths: Set[str]) -> Optional[DependencyType]:
+    module_path = file_system.find_module_file(module_name)
+    if (module_path is None
+            or file_system.is_installed_path(module_path)
+            or os.path.normcase(module_path) in excluded_paths):
+        return None
+    try:
+        content_hash = caching.to_hash(module_path)
+        imports = sorted(set(imported_modules_names(module_path)))
+    except (OSError, SyntaxError, ValueError):
+        return None
+    return module_path, content_hash, imports
+
+
+@phases.measures(phases.DISCOVERY)
+def stale_modules_paths(entries: Dict[str, EntryType],
+                        *,
+                        recorded: Dict[str, EntryType]) -> Set[str]:
+    """
+    Returns paths of modules which content
+    or content of their not given dependencies has changed
+    along with modules which (transitively) import them.
+    """
+    modules_paths_by_names = {to_module_full_name(module_path): module_path
+                              for module_path in entries}
+    dependants = defaultdict(set)
+    for module_path, entry in entries.items():
+        for module_name in entry['imports']:
+            try:
+                dependency_path = modules_paths_by_names[module_name]
+            except KeyError:
+                continue
+            dependants[dependency_path].add(module_path)
+    result = set()
+    queue = [module_path
+             for module_path, entry in entries.items()
+             if is_entry_changed(entry,
+                                 recorded=recorded.get(module_path, {}))]
+    while queue:
+        module_path = queue.pop()
+        if module_path in result:
+            continue
+        result.add(module_path)
+        queue.extend(dependants[module_path] - result)
+    return result
+
+
+def is_entry_changed(entry: EntryType,
+                     *,
+                     recorded: EntryType) -> bool:
+    return (recorded.get('hash') != entry['hash']
+            or recorded.get('dependencies') != entry['dependencies'])
+
+
+def modules_set_changed(entries: Dict[str, EntryType],
+                        *,
+                        recorded: Dict[str, EntryType]) -> bool:
+    """Checks if modules were added or removed since recorded run."""
+    return entries.keys() != recorded.keys()
+
+
+def imported_modules_names(module_path: str) -> Iterator[str]:
+    """
+    Yields full names of modules (with their packages)
+    which could be imported by given module.
+    """
+    tree = arboretum.from_path(module_path)
+    to_absolute = arboretum.import_absolutizer(module_path)
+    for node in ast.walk(tree):
+        if not arboretum.is_import_statement(node):
+            continue
+        statement = to_absolute(node)
+        if isinstance(statement, ast.Import):
+            names = [alias.name for alias in statement.names]
+        else:
+            # imported objects may be sub-modules
+            names = [statement.module]
+            names.extend(statement.module + catalog.SEPARATOR + alias.name
+                         for alias in statement.names)
+        for name in names:
+            yield from packages_names(name)
+
+
+def packages_names(module_full_name: str) -> List[str]:
+    parts = module_full_name.split(catalog.SEPARATOR)
+    return [catalog.SEPARATOR.join(parts[:index])
+            for index in range(1, len(parts) + 1)]
+
+
+def to_module_full_name(module_path: str) -> str:
+    return str(catalog.path_to_module_path(
+            file_system.to_relative(module_path)))
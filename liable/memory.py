@@ -0,0 +1,109 @@
+import gc
+import tracemalloc
+from typing import (Any,
+                    Dict,
+                    List)
+
+from . import (annotator,
+               functions,
+               namespaces,
+               phases,
+               strategies)
+
+TOP_ALLOCATIONS_COUNT = 10
+# snapshots are expensive,
+# so they are taken only on considerable growth of traced memory
+SNAPSHOT_GROWTH = 1.5
+# allocations made by tracing & importing machinery itself
+IGNORED_FILES_NAMES = [tracemalloc.__file__,
+                       '<frozen importlib._bootstrap>',
+                       '<frozen importlib._bootstrap_external>',
+                       '<unknown>']
+
+
+class MemoryReport:
+    """
+    Hook which records memory traced by ``tracemalloc``
+    on phases boundaries.
+
+    Global traced memory peak is never reset,
+    so for each phase only its rise during the phase is reported
+    (phase which stays below earlier peak has zero peak growth).
+
+    Along with top allocation sites & sizes of main data structures
+    taken at the boundary with the largest traced memory.
+    """
+
+    def __init__(self,
+                 *,
+                 top_allocations_count: int = TOP_ALLOCATIONS_COUNT) -> None:
+        self.top_allocations_count = top_allocations_count
+        self.phases = {}
+        self.peak = 0
+        self.snapshot = None
+        self.snapshot_phase = None
+        self.snapshot_size = 0
+        self.structures = {}
+        # phases being measured with traced memory & peak at their starts
+        self.entries = []
+
+    def enter(self, phase: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self.entries.append((phase, current, peak))
+
+    def __call__(self, record: phases.Record) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        statistics = self.phases.setdefault(record.phase,
+                                            {'current': 0,
+                                             'growth': 0,
+                                             'peak_growth': 0,
+                                             'boundaries': 0})
+        statistics['current'] = max(statistics['current'], current)
+        # records replayed from workers have no entries
+        if (len(self.entries) > len(phases.frames)
+                and self.entries[-1][0] == record.phase):
+            _, start_current, start_peak = self.entries.pop()
+            statistics['growth'] = max(statistics['growth'],
+                                       current - start_current)
+            statistics['peak_growth'] = max(statistics['peak_growth'],
+                                            peak - start_peak)
+        statistics['boundaries'] += 1
+        if current > self.snapshot_size * SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_phase = record.phase
+            self.snapshot_size = current
+            self.structures = structures_sizes()
+
+    def to_report(self) -> Dict[str, Any]:
+        return {'peak': self.peak,
+                'phases': self.phases,
+                'largest': {'phase': self.snapshot_phase,
+                            'current': self.snapshot_size,
+                            'top_allocations': self.top_allocations(),
+                            'structures': self.structures}}
+
+    def top_allocations(self) -> List[Dict[str, Any]]:
+        if self.snapshot is None:
+            return []
+        snapshot = self.snapshot.filter_traces(
+                [tracemalloc.Filter(False, file_name)
+                 for file_name in IGNORED_FILES_NAMES])
+        statistics = snapshot.statistics('lineno')
+        return [{'location': str(statistic.traceback),
+                 'size': statistic.size,
+                 'count': statistic.count}
+                for statistic in statistics[:self.top_allocations_count]]
+
+
+def structures_sizes() -> Dict[str, int]:
+    live_namespaces = [object_
+                       for object_ in gc.get_objects()
+                       if isinstance(object_, namespaces.Namespace)]
+    templates = strategies.expanded_templates.values()
+    return {'namespaces': len(live_namespaces),
+            'namespaces_entries': sum(map(len, live_namespaces)),
+            'annotations': len(annotator.utils.interned),
+            'templates': len(templates),
+            'templates_nodes': sum(len(list(functions.walk(template)))
+                                   for template in templates)}
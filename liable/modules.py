@@ -1,14 +1,24 @@
 import importlib.util
 import inspect
-from types import ModuleType
+import sys
+from collections import Counter
+from types import (CodeType,
+                   FrameType,
+                   FunctionType,
+                   MethodType,
+                   ModuleType,
+                   TracebackType)
 from typing import (Any,
+                    NamedTuple,
                     Dict)
 
 from . import (catalog,
-               file_system)
+               file_system,
+               phases)
 from .catalog import ObjectPathType
 
 
+@phases.measures(phases.IMPORT)
 def from_module_path(module_path: catalog.ModulePath) -> ModuleType:
     if module_path.type == catalog.PathType.relative:
         sup_module_full_name = str(module_path.module)
@@ -40,7 +50,69 @@ def is_built_in(module: ModuleType) -> bool:
     return not hasattr(module, '__file__')
 
 
+# ways of checking if object is from module
+MODULE_CHECK = 'module'
+OWN_CHECK = 'own'
+FOREIGN_CHECK = 'foreign'
+PLAIN_CHECK = 'plain'
+FALLBACK_CHECK = 'fallback'
+
+# types of objects supported by ``inspect.getfile``
+SOURCE_FILES_TYPES = (type, MethodType, FunctionType,
+                      TracebackType, FrameType, CodeType)
+MISSING = object()
+
+objects_checks = Counter()
+
+
+class ObjectsChecksInfo(NamedTuple):
+    # objects which are modules themselves
+    modules: int
+    # objects with ``__module__`` equal to module name
+    own: int
+    # objects with ``__module__`` not equal to module name
+    foreign: int
+    # objects without ``__module__`` which have no source file
+    plain: int
+    # objects without ``__module__`` checked by ``inspect.getmodule``
+    fallbacks: int
+
+
 def is_object_from_module(object_: Any,
                           *,
                           module: ModuleType) -> bool:
-    return inspect.getmodule(object_) is module and object_ is not module
+    """
+    Checks if object is defined in given module
+    (same as ``inspect.getmodule(object_) is module`` for non-module objects)
+    resorting to ``inspect.getmodule`` only for objects without ``__module__``
+    which it can find source file of,
+    since it scans all loaded modules on a miss.
+    """
+    if isinstance(object_, ModuleType):
+        objects_checks[MODULE_CHECK] += 1
+        return False
+    object_module_name = getattr(object_, '__module__', MISSING)
+    if object_module_name is MISSING:
+        if not isinstance(object_, SOURCE_FILES_TYPES):
+            objects_checks[PLAIN_CHECK] += 1
+            return False
+        objects_checks[FALLBACK_CHECK] += 1
+        return inspect.getmodule(object_) is module
+    if object_module_name == module.__name__:
+        objects_checks[OWN_CHECK] += 1
+    else:
+        objects_checks[FOREIGN_CHECK] += 1
+    # module can be registered under other name as well
+    return sys.modules.get(object_module_name) is module
+
+
+def objects_checks_info() -> ObjectsChecksInfo:
+    return ObjectsChecksInfo(modules=objects_checks[MODULE_CHECK],
+                             own=objects_checks[OWN_CHECK],
+                             foreign=objects_checks[FOREIGN_CHECK],
+                             plain=objects_checks[PLAIN_CHECK],
+                             fallbacks=objects_checks[FALLBACK_CHECK])
+
+
+def clear_objects_checks() -> None:
+    objects_checks.clear()
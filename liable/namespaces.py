@@ -1,42 +1,232 @@
 import builtins
 import inspect
-from functools import partial
-from itertools import chain
+from bisect import bisect
+from collections import deque
+from functools import (lru_cache,
+                       partial)
+from itertools import (chain,
+                       count)
 from types import (FunctionType,
                    ModuleType)
 from typing import (Any,
+                    Optional,
                     Iterable,
                     Iterator,
-                    Tuple)
+                    Tuple,
+                    List)
 
-from . import (catalog,
+from . import (caching,
+               catalog,
                modules,
+               phases,
                arboretum)
 from .catalog import ObjectPathType
 from .types import NamespaceType
-from .utils import (to_name,
-                    merge_mappings)
+from .utils import to_name
 
+MAX_SEARCH_DEPTH = None
 
-def from_module(module: ModuleType) -> NamespaceType:
-    return merge_mappings(dependent_objects(module),
-                          inner_objects(module))
+# shared between namespaces, so versions identify their states globally
+versions = count()
 
 
-def built_ins(module: ModuleType = builtins) -> NamespaceType:
+class Namespace(dict):
+    """
+    Mapping from objects paths to objects
+    which keeps index of paths by objects identifiers.
+
+    Paths of the same object are listed
+    in the order of their keys in the mapping.
+
+    ``version`` changes on every modification
+    and is unique among all namespaces.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        self.version = next(versions)
+        self._paths_by_ids = {}
+        self._positions = {}
+        self._modules_paths = set()
+        self._positions_counter = count()
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        return type(self), (list(self.items()),)
+
+    def __setitem__(self, path: ObjectPathType, object_: Any) -> None:
+        try:
+            previous_object = self[path]
+        except KeyError:
+            self._positions[path] = next(self._positions_counter)
+        else:
+            if previous_object is object_:
+                return
+            self._unregister(path, previous_object)
+        super().__setitem__(path, object_)
+        self._register(path, object_)
+        self.version = next(versions)
+
+    def __delitem__(self, path: ObjectPathType) -> None:
+        object_ = self[path]
+        super().__delitem__(path)
+        self._unregister(path, object_)
+        del self._positions[path]
+        self.version = next(versions)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for mapping in chain(args, [kwargs]):
+            try:
+                items = mapping.items()
+            except AttributeError:
+                items = mapping
+            for path, object_ in items:
+                self[path] = object_
+
+    def setdefault(self, path: ObjectPathType, default: Any = None) -> Any:
+        try:
+            return self[path]
+        except KeyError:
+            self[path] = default
+            return default
+
+    def pop(self, path: ObjectPathType, *default: Any) -> Any:
+        try:
+            object_ = self[path]
+        except KeyError:
+            if default:
+                default, = default
+                return default
+            raise
+        del self[path]
+        return object_
+
+    def popitem(self) -> Tuple[ObjectPathType, Any]:
+        try:
+            path = list(self.keys())[-1]
+        except IndexError as err:
+            raise KeyError('Namespace is empty.') from err
+        return path, self.pop(path)
+
+    def clear(self) -> None:
+        super().clear()
+        self._paths_by_ids.clear()
+        self._positions.clear()
+        self._modules_paths.clear()
+        self.version = next(versions)
+
+    def copy(self) -> 'Namespace':
+        return type(self)(self)
+
+    def contains_object(self, object_: Any) -> bool:
+        return id(object_) in self._paths_by_ids
+
+    def paths(self, object_: Any) -> List[ObjectPathType]:
+        return list(self._paths_by_ids.get(id(object_), []))
+
+    def modules(self) -> List[Tuple[ObjectPathType, ModuleType]]:
+        modules_paths = sorted(self._modules_paths,
+                               key=self._positions.__getitem__)
+        return [(path, self[path]) for path in modules_paths]
+
+    def _register(self, path: ObjectPathType, object_: Any) -> None:
+        if inspect.ismodule(object_):
+            self._modules_paths.add(path)
+        paths = self._paths_by_ids.setdefault(id(object_), [])
+        positions = [self._positions[other_path] for other_path in paths]
+        paths.insert(bisect(positions, self._positions[path]), path)
+
+    def _unregister(self, path: ObjectPathType, object_: Any) -> None:
+        self._modules_paths.discard(path)
+        object_id = id(object_)
+        paths = self._paths_by_ids[object_id]
+        paths.remove(path)
+        if not paths:
+            del self._paths_by_ids[object_id]
+
+
+def to_namespace(mapping: NamespaceType) -> Namespace:
+    if isinstance(mapping, Namespace):
+        return mapping
+    return Namespace(mapping)
+
+
+def merge(*namespaces: NamespaceType) -> Namespace:
+    result = Namespace()
+    for namespace in namespaces:
+        result.update(namespace)
+    return result
+
+
+@phases.measures(phases.NAMESPACE)
+def from_module(module: ModuleType) -> Namespace:
+    cached_objects_paths = caching.load(module)
+    if cached_objects_paths is not None:
+        dependent_objects_paths, inner_objects_paths = cached_objects_paths
+        try:
+            return merge(load_dependent_objects(dependent_objects_paths),
+                         load_inner_objects(inner_objects_paths,
+                                            module=module))
+        except (ImportError, AttributeError):
+            # cached paths are outdated due to changes in other modules
+            pass
+    module_dependent_objects = dependent_objects(module)
+    module_inner_objects = inner_objects(module)
+    caching.save(module,
+                 dependent_objects_paths=module_dependent_objects.keys(),
+                 inner_objects_paths=module_inner_objects.keys())
+    return merge(module_dependent_objects,
+                 module_inner_objects)
+
+
+@phases.measures(phases.NAMESPACE)
+def from_objects_paths(objects_paths: Iterable[ObjectPathType],
+                       *,
+                       module: ModuleType) -> Namespace:
+    """
+    Rebuilds namespace of given module from its keys
+    (e.g. received from other process).
+    """
+    objects_paths = list(objects_paths)
+    inner_objects_paths = [object_path
+                           for object_path in objects_paths
+                           if object_path.type == catalog.PathType.inner]
+    dependent_objects_paths = [object_path
+                               for object_path in objects_paths
+                               if object_path.type != catalog.PathType.inner]
+    return merge(load_dependent_objects(dependent_objects_paths),
+                 load_inner_objects(inner_objects_paths,
+                                    module=module))
+
+
+@lru_cache(maxsize=None)
+def module_namespace(module: ModuleType) -> Namespace:
+    """
+    Returns namespace of given module
+    built once per run (until ``module_namespace.cache_clear`` call).
+
+    Resulting namespace is shared between callers
+    and should not be modified.
+    """
+    return from_module(module)
+
+
+def built_ins(module: ModuleType = builtins) -> Namespace:
     raw_namespace = dict(vars(module))
     raw_namespace['...'] = raw_namespace.pop('Ellipsis')
-    return {catalog.guess_type(content)(module=catalog.BUILT_INS_MODULE_PATH,
-                                        object=name,
-                                        type=catalog.PathType.inner): content
-            for name, content in raw_namespace.items()}
+    return Namespace(
+            (catalog.guess_type(content)(module=catalog.BUILT_INS_MODULE_PATH,
+                                         object=name,
+                                         type=catalog.PathType.inner),
+             content)
+            for name, content in raw_namespace.items())
 
 
-def dependent_objects(module: ModuleType) -> NamespaceType:
+def dependent_objects(module: ModuleType) -> Namespace:
     if modules.is_built_in(module):
-        return {}
+        return Namespace()
     objects_paths = dependent_objects_paths(module)
-    return dict(load_dependent_objects(objects_paths))
+    return Namespace(load_dependent_objects(objects_paths))
 
 
 def dependent_objects_paths(module: ModuleType) -> Iterator[ObjectPathType]:
@@ -61,16 +251,26 @@ def load_dependent_objects(objects_paths: Iterable[ObjectPathType]
                    map(objects_seeker, objects_paths))
 
 
-def inner_objects(module: ModuleType) -> NamespaceType:
+def inner_objects(module: ModuleType) -> Namespace:
     module_full_name = module.__name__
     module_path = catalog.name_to_module_path(module_full_name)
 
-    return {catalog.guess_type(content)(module=module_path,
-                                        object=object_name,
-                                        type=catalog.PathType.inner): content
+    return Namespace(
+            (catalog.guess_type(content)(module=module_path,
+                                         object=object_name,
+                                         type=catalog.PathType.inner),
+             content)
             for object_name, content in vars(module).items()
             if modules.is_object_from_module(content,
-                                             module=module)}
+                                             module=module))
+
+
+def load_inner_objects(objects_paths: Iterable[ObjectPathType],
+                       *,
+                       module: ModuleType
+                       ) -> Iterator[Tuple[ObjectPathType, Any]]:
+    for object_path in objects_paths:
+        yield object_path, getattr(module, object_path.object)
 
 
 def search_name(object_: Any,
@@ -86,21 +286,80 @@ def search_name(object_: Any,
     return str(path)
 
 
+@phases.measures(phases.SEARCH)
 def search_path(object_: Any,
                 *,
-                namespace: NamespaceType) -> ObjectPathType:
+                namespace: NamespaceType,
+                max_depth: Optional[int] = MAX_SEARCH_DEPTH
+                ) -> ObjectPathType:
     object_paths = search_paths(object_,
-                                namespace=namespace)
+                                namespace=namespace,
+                                max_depth=max_depth)
     try:
         return next(object_paths)
     except StopIteration as err:
-        raise LookupError('Object "{object}" not found in namespace.'
-                          .format(object=to_name(object_))) from err
+        raise to_lookup_error(object_) from err
+
+
+@phases.measures(phases.SEARCH)
+def search_objects_paths(objects: Iterable[Any],
+                         *,
+                         namespace: NamespaceType,
+                         max_depth: Optional[int] = MAX_SEARCH_DEPTH
+                         ) -> List[ObjectPathType]:
+    """
+    Returns first found path for each of given objects
+    (same as ``search_path`` does)
+    traversing sub-modules namespaces only once for all of them.
+    """
+    objects = list(objects)
+    namespace = to_namespace(namespace)
+    paths_by_ids = {}
+    absolute_objects_by_ids = {}
+    for object_ in objects:
+        object_id = id(object_)
+        if object_id in paths_by_ids:
+            continue
+        paths = namespace.paths(object_)
+        if paths:
+            paths_by_ids[object_id] = paths[0]
+        else:
+            absolute_objects_by_ids[object_id] = object_
+    sub_namespaces = walk_sub_namespaces(namespace,
+                                         max_depth=max_depth)
+    while absolute_objects_by_ids:
+        try:
+            module_path, sub_namespace = next(sub_namespaces)
+        except StopIteration:
+            break
+        for object_id, object_ in list(absolute_objects_by_ids.items()):
+            path = next(search_absolute_objects(object_,
+                                                namespace=sub_namespace,
+                                                module_path=module_path),
+                        None)
+            if path is None:
+                continue
+            paths_by_ids[object_id] = path
+            del absolute_objects_by_ids[object_id]
+    result = []
+    for object_ in objects:
+        try:
+            result.append(paths_by_ids[id(object_)])
+        except KeyError as err:
+            raise to_lookup_error(object_) from err
+    return result
+
+
+def to_lookup_error(object_: Any) -> LookupError:
+    return LookupError('Object "{object}" not found in namespace.'
+                       .format(object=to_name(object_)))
 
 
 def search_paths(object_: Any,
                  *,
-                 namespace: NamespaceType) -> Iterator[ObjectPathType]:
+                 namespace: NamespaceType,
+                 max_depth: Optional[int] = MAX_SEARCH_DEPTH
+                 ) -> Iterator[ObjectPathType]:
     is_relative = is_object_relative(object_,
                                      namespace=namespace)
     if is_relative:
@@ -108,24 +367,49 @@ def search_paths(object_: Any,
                                            namespace=namespace)
     else:
         yield from search_absolute_paths(object_,
-                                         namespace=namespace)
+                                         namespace=namespace,
+                                         max_depth=max_depth)
 
 
 def search_absolute_paths(object_: Any,
                           *,
-                          namespace: NamespaceType
+                          namespace: NamespaceType,
+                          max_depth: Optional[int] = MAX_SEARCH_DEPTH
                           ) -> Iterator[ObjectPathType]:
-    sub_modules_by_paths = dict(namespace_modules(namespace))
-    sub_namespaces = list(map(from_module, sub_modules_by_paths.values()))
-    yield from chain.from_iterable(
-            search_absolute_objects(object_,
-                                    namespace=namespace,
-                                    module_path=module_path)
-            for module_path, namespace in zip(sub_modules_by_paths.keys(),
-                                              sub_namespaces))
-    yield from chain.from_iterable(search_absolute_paths(object_,
-                                                         namespace=namespace)
-                                   for namespace in sub_namespaces)
+    for module_path, sub_namespace in walk_sub_namespaces(
+            namespace,
+            max_depth=max_depth):
+        yield from search_absolute_objects(object_,
+                                           namespace=sub_namespace,
+                                           module_path=module_path)
+
+
+def walk_sub_namespaces(namespace: NamespaceType,
+                        *,
+                        max_depth: Optional[int] = MAX_SEARCH_DEPTH
+                        ) -> Iterator[Tuple[catalog.ModulePath, Namespace]]:
+    """
+    Walks breadth-first through namespaces of modules
+    reachable from given namespace
+    visiting each module once.
+
+    Yields paths of modules in namespaces they were found in
+    along with their namespaces.
+    """
+    visited_modules_ids = set()
+    queue = deque([(namespace, 1)])
+    while queue:
+        namespace, depth = queue.popleft()
+        if max_depth is not None and depth > max_depth:
+            break
+        for module_path, module in namespace_modules(namespace):
+            module_id = id(module)
+            if module_id in visited_modules_ids:
+                continue
+            visited_modules_ids.add(module_id)
+            sub_namespace = module_namespace(module)
+            yield module_path, sub_namespace
+            queue.append((sub_namespace, depth + 1))
 
 
 def is_object_relative(object_: Any,
@@ -140,34 +424,31 @@ def is_object_relative(object_: Any,
     if it is defined in module
     which imported in original one using ``import`` statement.
     """
-    return object_ in namespace.values()
+    return to_namespace(namespace).contains_object(object_)
 
 
 def search_relative_objects(object_: Any,
                             *,
-                            namespace: NamespaceType) -> ObjectPathType:
-    for path, content in namespace.items():
-        if content is object_:
-            yield path
+                            namespace: NamespaceType
+                            ) -> Iterator[ObjectPathType]:
+    yield from to_namespace(namespace).paths(object_)
 
 
 def search_absolute_objects(object_: Any,
                             *,
                             namespace: NamespaceType,
                             module_path: catalog.ModulePath
-                            ) -> ObjectPathType:
-    for path, content in namespace.items():
-        if content is object_:
-            yield catalog.guess_type(content)(module=module_path,
-                                              object=path.object,
-                                              type=catalog.PathType.absolute)
+                            ) -> Iterator[ObjectPathType]:
+    path_cls = catalog.guess_type(object_)
+    for path in to_namespace(namespace).paths(object_):
+        yield path_cls(module=module_path,
+                       object=path.object,
+                       type=catalog.PathType.absolute)
 
 
 def namespace_modules(namespace: NamespaceType
                       ) -> Iterator[Tuple[catalog.ModulePath, ModuleType]]:
-    for path, content in namespace.items():
-        if inspect.ismodule(content):
-            yield path, content
+    yield from to_namespace(namespace).modules()
 
 
 def functions_by_path_type(namespace: NamespaceType,
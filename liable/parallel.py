@@ -0,0 +1,124 @@
+import multiprocessing
+from functools import partial
+from typing import (Any,
+                    Callable,
+                    Optional,
+                    Iterable,
+                    Iterator,
+                    Tuple,
+                    List)
+
+from . import (caching,
+               formatting,
+               phases,
+               stubs)
+
+FORK_START_METHOD = 'fork'
+
+# set by parent process right before forking workers
+inherited = None
+
+
+def imap(function: Callable[[Any], Any],
+         arguments: Iterable[Any],
+         *,
+         jobs: int,
+         chunk_size: int = 1) -> Iterator[Any]:
+    """
+    Lazily maps given function over arguments
+    preserving their order
+    using ``jobs`` worker processes
+    which receive arguments in chunks of ``chunk_size``.
+
+    Function & arguments should be picklable.
+    """
+    if jobs == 1:
+        yield from map(function, arguments)
+        return
+    with multiprocessing.Pool(jobs,
+                              initializer=initialize_worker,
+                              initargs=to_worker_settings()) as pool:
+        results = pool.imap(partial(call, function), arguments,
+                            chunksize=chunk_size)
+        yield from map(collect, results)
+
+
+def imap_inherited(function: Callable[[Any], Any],
+                   arguments: Iterable[Any],
+                   *,
+                   jobs: int) -> Iterator[Any]:
+    """
+    Lazily maps given function over arguments
+    preserving their order
+    using ``jobs`` forked worker processes.
+
+    Function & arguments are inherited by workers instead of pickling,
+    if forking is not supported mapping is done in current process.
+    """
+    global inherited
+    if (jobs == 1
+            or FORK_START_METHOD not in
+            multiprocessing.get_all_start_methods()):
+        yield from map(function, arguments)
+        return
+    arguments = list(arguments)
+    inherited = function, arguments
+    try:
+        context = multiprocessing.get_context(FORK_START_METHOD)
+        with context.Pool(jobs,
+                          initializer=initialize_worker,
+                          initargs=to_worker_settings()) as pool:
+            results = pool.imap(call_inherited, range(len(arguments)))
+            yield from map(collect, results)
+    finally:
+        inherited = None
+
+
+def to_worker_settings() -> Tuple[Optional[str], bool, str, bool]:
+    return (caching.directory, stubs.is_enabled(), formatting.backend,
+            phases.is_enabled())
+
+
+def initialize_worker(cache_directory: Optional[str],
+                      static: bool,
+                      formatting_backend: str,
+                      measured: bool) -> None:
+    caching.set_directory(cache_directory)
+    formatting.set_backend(formatting_backend)
+    # forked workers inherit statements recorded by parent
+    del stubs.unresolved[:]
+    if static and not stubs.is_enabled():
+        stubs.enable()
+    # as well as its hooks & phases being measured
+    phases.reset()
+    if measured:
+        phases.register(phases.buffer)
+
+
+WorkerResultType = Tuple[Any,
+                         List[stubs.UnresolvedStatement],
+                         List[phases.Record]]
+
+
+def call(function: Callable[[Any], Any],
+         argument: Any) -> WorkerResultType:
+    result = function(argument)
+    unresolved_statements = stubs.unresolved[:]
+    del stubs.unresolved[:]
+    return result, unresolved_statements, phases.drain()
+
+
+def call_inherited(index: int) -> WorkerResultType:
+    function, arguments = inherited
+    return call(function, arguments[index])
+
+
+def collect(result: WorkerResultType) -> Any:
+    """
+    Passes statements & phases records made by worker
+    to current process and returns value.
+    """
+    value, unresolved_statements, records = result
+    stubs.unresolved.extend(unresolved_statements)
+    phases.replay(records)
+    return value
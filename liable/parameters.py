@@ -1,17 +1,18 @@
 import inspect
 import operator
 from collections import defaultdict
+from contextlib import suppress
+from functools import reduce
 from itertools import (chain,
-                       filterfalse,
-                       product,
-                       repeat,
-                       starmap)
+                       filterfalse)
 from types import FunctionType
 from typing import (Optional,
                     Type,
                     Iterable,
                     Iterator,
+                    NamedTuple,
                     Dict,
+                    Tuple,
                     List)
 
 from . import (annotator,
@@ -37,16 +38,26 @@ def combine(parameters: Iterable[inspect.Parameter],
             namespace: NamespaceType,
             commons_module_path: str = COMMONS_MODULE_PATH
             ) -> Dict[catalog.ModulePath, List[inspect.Parameter]]:
-    result = defaultdict(list)
-    for parameter in parameters:
+    parameters = list(parameters)
+    classes_by_indices = {}
+    for index, parameter in enumerate(parameters):
         annotation = parameter.annotation
         try:
             cls, = annotation.bases
         except ValueError:
+            continue
+        classes_by_indices[index] = cls
+    classes_paths = namespaces.search_objects_paths(
+            classes_by_indices.values(),
+            namespace=namespace)
+    paths_by_indices = dict(zip(classes_by_indices.keys(), classes_paths))
+    result = defaultdict(list)
+    for index, parameter in enumerate(parameters):
+        try:
+            path = paths_by_indices[index]
+        except KeyError:
             module_path = commons_module_path
         else:
-            path = namespaces.search_path(cls,
-                                          namespace=namespace)
             if catalog.is_built_in(path):
                 module_path = commons_module_path
             else:
@@ -67,6 +78,7 @@ def from_functions(module_functions: Iterable[FunctionType]
     signatures = map(functions.signature, module_functions)
     parameters = chain.from_iterable(map(operator.attrgetter('parameters'),
                                          signatures))
+    lattice = TypesLattice()
     result = {}
     for parameter in parameters:
         name = parameter.name
@@ -77,7 +89,8 @@ def from_functions(module_functions: Iterable[FunctionType]
             result[name] = parameter
             continue
         previous_annotation = previous_parameter.annotation
-        if not are_annotations_consistent(annotation, previous_annotation):
+        if not are_annotations_consistent(annotation, previous_annotation,
+                                          lattice=lattice):
             err_msg = ('Invalid parameter: "{parameter}", '
                        'different annotations should agree, '
                        'but found "{previous_annotation}", "{annotation}".'
@@ -85,73 +98,118 @@ def from_functions(module_functions: Iterable[FunctionType]
                                previous_annotation=previous_annotation.origin,
                                annotation=annotation.origin))
             raise ValueError(err_msg)
-        if is_annotation_more_specific(annotation, previous_annotation):
+        if is_annotation_more_specific(annotation, previous_annotation,
+                                       lattice=lattice):
             result[name] = parameter
     yield from result.values()
 
 
+class TypesSystem(NamedTuple):
+    # bitset of types identifiers
+    mask: int
+    # same types identifiers in order of iteration over their set
+    identifiers: Tuple[int, ...]
+
+
+class TypesLattice:
+    """
+    Index of types which gives each of them an integer identifier
+    with bitsets of indexed types it is related to by subclassing.
+    """
+
+    def __init__(self) -> None:
+        self._identifiers = {}
+        self._types = []
+        self._sub_classes = []
+        self._super_classes = []
+        self._systems = {}
+
+    def to_identifier(self, type_: Type) -> int:
+        with suppress(KeyError):
+            return self._identifiers[type_]
+        identifier = len(self._types)
+        bit = 1 << identifier
+        sub_classes = super_classes = bit
+        for other_identifier, other_type in enumerate(self._types):
+            other_bit = 1 << other_identifier
+            if issubclass(other_type, type_):
+                sub_classes |= other_bit
+                self._super_classes[other_identifier] |= bit
+            if issubclass(type_, other_type):
+                super_classes |= other_bit
+                self._sub_classes[other_identifier] |= bit
+        self._identifiers[type_] = identifier
+        self._types.append(type_)
+        self._sub_classes.append(sub_classes)
+        self._super_classes.append(super_classes)
+        return identifier
+
+    def to_system(self, annotation: annotator.Annotation) -> TypesSystem:
+        """Returns indexed types from annotation bases MRO except object."""
+        bases = annotation.bases
+        with suppress(KeyError):
+            return self._systems[bases]
+        types = set(bases_mro(annotation))
+        types -= {object}
+        identifiers = tuple(map(self.to_identifier, types))
+        mask = reduce(operator.or_,
+                      (1 << identifier for identifier in identifiers),
+                      0)
+        result = self._systems[bases] = TypesSystem(mask=mask,
+                                                    identifiers=identifiers)
+        return result
+
+    def related(self, identifier: int) -> int:
+        return self._sub_classes[identifier] | self._super_classes[identifier]
+
+    def is_sub_class(self, identifier: int, other_identifier: int) -> bool:
+        return bool(self._super_classes[identifier] >> other_identifier & 1)
+
+
 def is_annotation_more_specific(annotation: annotator.Annotation,
-                                other_annotation: annotator.Annotation
+                                other_annotation: annotator.Annotation,
+                                *,
+                                lattice: Optional[TypesLattice] = None
                                 ) -> bool:
-    sub_types = set(bases_mro(annotation))
-    sub_types -= {object}
-    other_sub_types = set(bases_mro(other_annotation))
-    other_sub_types -= {object}
-    for type_ in sub_types:
-        sibling = next(find_siblings(type_,
-                                     other_types=other_sub_types))
-        other_annotation_is_more_specific = issubclass(sibling, type_)
+    if lattice is None:
+        lattice = TypesLattice()
+    system = lattice.to_system(annotation)
+    other_system = lattice.to_system(other_annotation)
+    for identifier in system.identifiers:
+        related = lattice.related(identifier)
+        # the first related type of other system decides
+        sibling_identifier = next(
+                other_identifier
+                for other_identifier in other_system.identifiers
+                if related >> other_identifier & 1)
+        other_annotation_is_more_specific = lattice.is_sub_class(
+                sibling_identifier, identifier)
         if other_annotation_is_more_specific:
             return False
     return True
 
 
 def are_annotations_consistent(annotation: annotator.Annotation,
-                               previous_annotation: annotator.Annotation
+                               previous_annotation: annotator.Annotation,
+                               *,
+                               lattice: Optional[TypesLattice] = None
                                ) -> bool:
-    sub_types = set(bases_mro(annotation))
-    sub_types -= {object}
-    other_sub_types = set(bases_mro(previous_annotation))
-    other_sub_types -= {object}
-    return (are_type_systems_related(sub_types, other_sub_types) or
-            are_type_systems_related(other_sub_types, sub_types))
-
-
-def are_type_systems_related(types: Iterable[Type],
-                             other_types: Iterable[Type]) -> bool:
-    other_types = list(other_types)
-    return all(has_sibling(type_,
-                           other_types=other_types)
-               for type_ in types)
-
-
-def has_sibling(type_: Type,
-                *,
-                other_types: Iterable[Type]) -> bool:
-    siblings = find_siblings(type_,
-                             other_types=other_types)
-    sibling = next(siblings, None)
-    return sibling is not None
-
-
-def find_siblings(type_: Type,
-                  *,
-                  other_types: Iterable[Type]) -> Iterator[Type]:
-    other_types = list(other_types)
-    types_pairs = product(repeat(type_,
-                                 times=len(other_types)),
-                          other_types)
-    sup_classes = starmap(to_sup_class, types_pairs)
-    yield from filter(None, sup_classes)
-
-
-def to_sup_class(type_: Type, other_type: Type) -> Optional[Type]:
-    if issubclass(type_, other_type):
-        return other_type
-    elif issubclass(other_type, type_):
-        return type_
-    else:
-        return None
+    if lattice is None:
+        lattice = TypesLattice()
+    system = lattice.to_system(annotation)
+    other_system = lattice.to_system(previous_annotation)
+    return (are_type_systems_related(system, other_system,
+                                     lattice=lattice) or
+            are_type_systems_related(other_system, system,
+                                     lattice=lattice))
+
+
+def are_type_systems_related(system: TypesSystem,
+                             other_system: TypesSystem,
+                             *,
+                             lattice: TypesLattice) -> bool:
+    return all(lattice.related(identifier) & other_system.mask
+               for identifier in system.identifiers)
 
 
 def bases_mro(annotation: annotator.Annotation) -> Iterator[Type]:
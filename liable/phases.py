@@ -0,0 +1,198 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from typing import (Any,
+                    Callable,
+                    Optional,
+                    Iterable,
+                    Iterator,
+                    NamedTuple,
+                    Dict,
+                    List)
+
+DISCOVERY = 'discovery'
+IMPORT = 'import'
+NAMESPACE = 'namespace'
+SEARCH = 'search'
+SIGNATURES = 'signatures'
+TEMPLATES = 'templates'
+RENDERING = 'rendering'
+FORMATTING = 'formatting'
+WRITING = 'writing'
+
+
+class Record(NamedTuple):
+    phase: str
+    # full name of processed module (if any)
+    module: Optional[str]
+    # seconds spent in phase itself excluding phases nested in it
+    duration: float
+
+
+Hook = Callable[[Record], None]
+EnteringHook = Callable[[str], None]
+
+hooks = []
+entering_hooks = []
+# module which is being processed at the moment
+module = None
+# currently measured phases with time spent in phases nested in them
+frames = []
+# records made by worker process to be passed to parent one
+buffered = []
+
+
+def register(hook: Hook) -> None:
+    """Makes given hook to be called with record of each measured phase."""
+    hooks.append(hook)
+
+
+def unregister(hook: Hook) -> None:
+    hooks.remove(hook)
+
+
+def register_entering(hook: EnteringHook) -> None:
+    """
+    Makes given hook to be called with name of each measured phase
+    on its start.
+    """
+    entering_hooks.append(hook)
+
+
+def unregister_entering(hook: EnteringHook) -> None:
+    entering_hooks.remove(hook)
+
+
+def is_enabled() -> bool:
+    return bool(hooks)
+
+
+def reset() -> None:
+    global module
+    del hooks[:]
+    del entering_hooks[:]
+    del frames[:]
+    del buffered[:]
+    module = None
+
+
+@contextmanager
+def measured(phase: str) -> Iterator[None]:
+    """
+    Measures wall time of given phase if there are registered hooks.
+
+    Re-entering phase which is already measured
+    (e.g. by recursion) is counted as a part of the outer call.
+    """
+    if not hooks or any(frame[0] == phase for frame in frames):
+        yield
+        return
+    frame = [phase, 0.]
+    frames.append(frame)
+    for hook in list(entering_hooks):
+        hook(phase)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        frames.pop()
+        if frames:
+            frames[-1][1] += elapsed
+        notify(Record(phase=phase,
+                      module=module,
+                      duration=elapsed - frame[1]))
+
+
+def measures(phase: str
+             ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Returns decorator which measures calls as given phase."""
+
+    def decorate(function: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(function)
+        def measured_function(*args: Any, **kwargs: Any) -> Any:
+            if not hooks:
+                return function(*args, **kwargs)
+            with measured(phase):
+                return function(*args, **kwargs)
+
+        return measured_function
+
+    return decorate
+
+
+@contextmanager
+def processing(module_name: str) -> Iterator[None]:
+    """Attributes phases measured in the block to given module."""
+    global module
+    previous_module, module = module, module_name
+    try:
+        yield
+    finally:
+        module = previous_module
+
+
+def notify(record: Record) -> None:
+    for hook in list(hooks):
+        hook(record)
+
+
+def buffer(record: Record) -> None:
+    buffered.append(record)
+
+
+def drain() -> List[Record]:
+    result = buffered[:]
+    del buffered[:]
+    return result
+
+
+def replay(records: Iterable[Record]) -> None:
+    for record in records:
+        notify(record)
+
+
+class Timings:
+    """Hook which accumulates wall time & calls count of phases."""
+
+    def __init__(self) -> None:
+        self.phases = defaultdict(to_statistics)
+        self.modules = defaultdict(to_phases_statistics)
+
+    def __call__(self, record: Record) -> None:
+        add(self.phases[record.phase], record)
+        if record.module is not None:
+            add(self.modules[record.module][record.phase], record)
+
+    def to_report(self,
+                  *,
+                  total: float,
+                  slowest_modules_count: int) -> Dict[str, Any]:
+        modules_totals = {
+            module_name: sum(statistics['time']
+                             for statistics in phases_statistics.values())
+            for module_name, phases_statistics in self.modules.items()}
+        slowest_modules_names = sorted(modules_totals,
+                                       key=modules_totals.get,
+                                       reverse=True)[:slowest_modules_count]
+        return {'total': total,
+                'phases': dict(self.phases),
+                'slowest_modules': [
+                    {'module': module_name,
+                     'time': modules_totals[module_name],
+                     'phases': dict(self.modules[module_name])}
+                    for module_name in slowest_modules_names]}
+
+
+def to_statistics() -> Dict[str, Any]:
+    return {'time': 0., 'calls': 0}
+
+
+def to_phases_statistics() -> Dict[str, Dict[str, Any]]:
+    return defaultdict(to_statistics)
+
+
+def add(statistics: Dict[str, Any], record: Record) -> None:
+    statistics['time'] += record.duration
+    statistics['calls'] += 1
@@ -15,6 +15,8 @@ from typing import (Any,
                     Type,
                     Iterable,
                     Iterator,
+                    NamedTuple,
+                    Optional,
                     Dict,
                     Tuple,
                     List)
@@ -23,17 +25,18 @@ from hypothesis import strategies
 
 from . import (functions,
                annotator,
+               formatting,
                namespaces,
                parameters,
+               phases,
                catalog,
                strings)
 from .annotator.detectors import is_generic
 from .types import NamespaceType
-from .utils import (fix_code,
-                    merge_mappings,
-                    to_name)
+from .utils import to_name
 
 
+@phases.measures(phases.RENDERING)
 def init_module(modules_parameters: Dict[catalog.ModulePath,
                                          List[inspect.Parameter]]) -> str:
     strategies_paths = (
@@ -47,9 +50,10 @@ def init_module(modules_parameters: Dict[catalog.ModulePath,
     imports = chain.from_iterable(starmap(catalog.to_imports,
                                           strategies_paths))
     source = ''.join(imports)
-    return fix_code(source)
+    return formatting.fix_code(source)
 
 
+@phases.measures(phases.RENDERING)
 def from_parameters(module_parameters: Iterable[inspect.Parameter],
                     *,
                     namespace: NamespaceType) -> str:
@@ -58,7 +62,7 @@ def from_parameters(module_parameters: Iterable[inspect.Parameter],
                                        namespace=namespace),
                         module_strategies_definitions(module_parameters,
                                                       namespace=namespace))
-    return fix_code(''.join(code_blocks))
+    return formatting.fix_code(''.join(code_blocks))
 
 
 def name_to_module_path(full_name: str) -> catalog.ModulePath:
@@ -72,39 +76,26 @@ utilities = {name_to_module_path(strategies.__name__): strategies}
 def module_imports(module_parameters: Iterable[inspect.Parameter],
                    *,
                    namespace: NamespaceType) -> Iterator[str]:
-    namespace = merge_mappings(namespace, utilities)
+    namespace = namespaces.merge(namespace, utilities)
     annotations = map(operator.attrgetter('annotation'), module_parameters)
     objects = set(chain.from_iterable(map(dependant_types, annotations)))
-    object_path_seeker = partial(namespaces.search_path,
-                                 namespace=namespace)
-    objects_paths = map(object_path_seeker, objects)
+    objects_paths = namespaces.search_objects_paths(objects,
+                                                    namespace=namespace)
     modules_objects_paths = (catalog.modules_objects_paths(objects_paths)
                              .values())
     yield from chain.from_iterable(starmap(catalog.to_imports,
                                            modules_objects_paths))
 
 
-def dependant_types(annotation: annotator.Annotation) -> Iterator[Type]:
-    bases = annotation.bases
-    yield from chain.from_iterable(templates_dependants
-                                   .get(base, [strategies.builds, base])
-                                   for base in bases)
-    initializers_parameters = chain.from_iterable(
-            map(parameters.from_type_initializer, bases))
-    annotations = map(operator.attrgetter('annotation'),
-                      initializers_parameters)
-    yield from chain.from_iterable(map(dependant_types,
-                                       annotations))
-    if isinstance(annotation, annotator.annotations.Generic):
-        arguments = annotation.arguments
-        yield from chain.from_iterable(map(dependant_types, arguments))
+def dependant_types(annotation: annotator.Annotation) -> Iterator[Any]:
+    yield from functions.walk(to_template(annotation))
 
 
 def module_strategies_definitions(
         module_parameters: Iterable[inspect.Parameter],
         *,
         namespace: NamespaceType) -> Iterator[str]:
-    namespace = merge_mappings(namespace, utilities)
+    namespace = namespaces.merge(namespace, utilities)
     strategy_definition_factory = partial(strategy_definition,
                                           namespace=namespace)
     yield from map(strategy_definition_factory, module_parameters)
@@ -114,7 +105,8 @@ def strategy_definition(parameter: inspect.Parameter,
                         *,
                         namespace: NamespaceType) -> str:
     strategy_name = to_strategy_name(parameter)
-    template = to_template(parameter.annotation)
+    template = to_template(parameter.annotation,
+                           strategy_name=strategy_name)
     value = template.to_string(namespace)
     return strategy_name + ' = ' + value + '\n'
 
@@ -210,12 +202,35 @@ with suppress(ImportError):
                                   pandas.data_frames,
                                   module_path=pandas_module_path)))
 
-templates_dependants = {key: list(functions.walk(value))
-                        for key, value in templates.items()}
 
+class TemplatesCacheInfo(NamedTuple):
+    hits: int
+    expansions: int
+    cycles: int
 
-def to_template(annotation: annotator.Annotation
+
+# templates of types built from their initializers
+expanded_templates = {}
+# types which initializers are being expanded at the moment
+expanding_types = set()
+# names of strategies being defined by their types
+defining_strategies = {}
+templates_cache_hits = 0
+templates_expansions = 0
+templates_cycles = 0
+
+
+@phases.measures(phases.TEMPLATES)
+def to_template(annotation: annotator.Annotation,
+                *,
+                strategy_name: Optional[str] = None
                 ) -> functions.FunctionCall:
+    """
+    Returns template of strategy for given annotation.
+
+    If strategy name is specified
+    cycles on annotation type are closed by referring to the strategy.
+    """
     try:
         base, = annotation.bases
     except ValueError as err:
@@ -228,16 +243,8 @@ def to_template(annotation: annotator.Annotation
     try:
         template = templates[base]
     except KeyError:
-        initializer_parameters = parameters.from_type_initializer(base)
-        arguments = [
-            functions.Argument(name=parameter.name,
-                               value=to_template(parameter.annotation),
-                               kind=inspect._POSITIONAL_OR_KEYWORD)
-            for parameter in initializer_parameters]
-        template = functions.FunctionCall(strategies.builds,
-                                          functions.Argument(name='target',
-                                                             value=base),
-                                          *arguments)
+        template = to_expanded_template(base,
+                                        strategy_name=strategy_name)
     else:
         if isinstance(annotation, annotator.annotations.Generic):
             template = functions.FunctionCall(template.function,
@@ -246,6 +253,81 @@ def to_template(annotation: annotator.Annotation
     return template
 
 
+def to_expanded_template(type_: Type,
+                         *,
+                         strategy_name: Optional[str] = None
+                         ) -> functions.FunctionCall:
+    """
+    Returns template which builds given type
+    from strategies of its initializer parameters
+    computed once per type (until ``clear_templates_cache`` call).
+
+    Types referencing themselves (directly or through other types)
+    are resolved lazily on cycle,
+    templates with such deferrals depend on expansion they are part of,
+    so they are not cached.
+    """
+    global templates_cache_hits, templates_expansions, templates_cycles
+    with suppress(KeyError):
+        result = expanded_templates[type_]
+        templates_cache_hits += 1
+        return result
+    if type_ in expanding_types:
+        templates_cycles += 1
+        return to_deferred_template(type_)
+    expanding_types.add(type_)
+    if strategy_name is not None:
+        defining_strategies[type_] = strategy_name
+    cycles_count = templates_cycles
+    try:
+        initializer_parameters = parameters.from_type_initializer(type_)
+        arguments = [
+            functions.Argument(name=parameter.name,
+                               value=to_template(parameter.annotation),
+                               kind=inspect._POSITIONAL_OR_KEYWORD)
+            for parameter in initializer_parameters]
+    finally:
+        expanding_types.remove(type_)
+        defining_strategies.pop(type_, None)
+    templates_expansions += 1
+    result = functions.FunctionCall(strategies.builds,
+                                    functions.Argument(name='target',
+                                                       value=type_),
+                                    *arguments)
+    if templates_cycles == cycles_count:
+        expanded_templates[type_] = result
+    return result
+
+
+def to_deferred_template(type_: Type) -> functions.FunctionCall:
+    try:
+        # generated strategy is preferred to one inferred from type
+        definition = functions.Name(defining_strategies[type_])
+    except KeyError:
+        definition = functions.FunctionCall(
+                strategies.from_type,
+                functions.Argument(name='thing',
+                                   value=type_))
+    return functions.FunctionCall(
+            strategies.deferred,
+            functions.Argument(name='definition',
+                               value=functions.Lambda(definition)))
+
+
+def templates_cache_info() -> TemplatesCacheInfo:
+    return TemplatesCacheInfo(hits=templates_cache_hits,
+                              expansions=templates_expansions,
+                              cycles=templates_cycles)
+
+
+def clear_templates_cache() -> None:
+    global templates_cache_hits, templates_expansions, templates_cycles
+    expanded_templates.clear()
+    expanding_types.clear()
+    defining_strategies.clear()
+    templates_cache_hits = templates_expansions = templates_cycles = 0
+
+
 def to_strategy_name(parameter: inspect.Parameter) -> str:
     annotation = parameter.annotation
     annotation_bases = annotation.bases
@@ -1,15 +1,17 @@
 import enum
+from functools import lru_cache
 from itertools import (chain,
                        zip_longest)
 from typing import (Any,
+                    Optional,
                     Iterable,
                     Iterator,
                     Sequence)
 
-import inflect
-from nltk.corpus import wordnet
+from . import lexicon
 
 STRINGS_SEPARATOR = ',\n'
+PLURALS_CACHE_SIZE = 4096
 
 
 class Case(enum.Enum):
@@ -38,6 +40,7 @@ def wrap_with_quotes(string: str) -> Any:
     return quote_character + string + quote_character
 
 
+@lru_cache(maxsize=PLURALS_CACHE_SIZE)
 def to_plurals(string: str,
                *,
                target_case: Case = None) -> str:
@@ -108,9 +111,12 @@ def is_upper_case(string: str) -> bool:
                for character in string)
 
 
+@lru_cache(maxsize=PLURALS_CACHE_SIZE)
 def to_plural(word: str,
               *,
-              engine: inflect.engine = inflect.engine()) -> str:
+              engine: Optional[Any] = None) -> str:
+    if engine is None:
+        engine = inflect_engine()
     is_plural = engine.singular_noun
     if not is_noun(word) or is_plural(word):
         return word
@@ -143,7 +149,20 @@ to_case_converters = {
 }
 
 
+@lru_cache(maxsize=None)
+def inflect_engine() -> Any:
+    # loaded on demand since importing is slow
+    import inflect
+    return inflect.engine()
+
+
 def is_noun(word: str) -> bool:
+    nouns_tables = lexicon.nouns_tables()
+    if nouns_tables is not None:
+        return lexicon.is_noun(word,
+                               tables=nouns_tables)
+    # loaded on demand since corpus reader initialization is slow
+    from nltk.corpus import wordnet
     synsets = wordnet.synsets(word)
     return any(synset.pos() == wordnet.NOUN
                for synset in synsets)
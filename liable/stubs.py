@@ -0,0 +1,490 @@
+import ast
+import copy
+import os
+import sys
+import sysconfig
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from importlib.machinery import (PathFinder,
+                                 SourceFileLoader)
+from itertools import count
+from types import (CodeType,
+                   ModuleType)
+from typing import (Any,
+                    Optional,
+                    Iterable,
+                    Iterator,
+                    NamedTuple,
+                    Sequence,
+                    Type,
+                    List)
+
+from . import arboretum
+
+RECORDER_NAME = '__liable_record__'
+ERROR_NAME = '__liable_error__'
+ANNOTATION_NAME_TEMPLATE = '__liable_annotation_{index}__'
+# metaclasses with stubbed ``__new__`` return ``None`` instead of class
+CLASS_CHECK_TEMPLATE = ('if not isinstance({name}, type):\n'
+                        '    raise TypeError(\'Metaclass of "{name}" '
+                        'has not created class.\')\n')
+
+DESCRIPTORS_DECORATORS_NAMES = {'classmethod', 'property', 'staticmethod'}
+DESCRIPTORS_DECORATORS_ATTRIBUTES = {'deleter', 'getter', 'setter'}
+# decorators which define signatures (like ``dataclass`` initializers)
+# or keep them accessible (like ``functools`` wrappers)
+SIGNATURES_DECORATORS_NAMES = {'cache', 'dataclass', 'lru_cache',
+                               'singledispatch', 'total_ordering', 'wraps'}
+TYPES_FACTORIES_NAMES = {'NamedTuple', 'NewType', 'TypeVar', 'namedtuple'}
+SITE_DIRECTORIES_NAMES = {'dist-packages', 'site-packages'}
+
+STANDARD_LIBRARY_PATHS = tuple({os.path.normcase(sysconfig.get_path(name))
+                                for name in ('stdlib', 'platstdlib')})
+
+
+class UnresolvedStatement(NamedTuple):
+    path: str
+    line: int
+    reason: str
+
+    def __str__(self) -> str:
+        return ('{path}:{line}: {reason}'
+                .format(path=self.path,
+                        line=self.line,
+                        reason=self.reason))
+
+
+unresolved = []
+# number of times stubs were removed from ``sys.modules``,
+# so caches which refer to them can be invalidated
+purges_count = 0
+
+
+@contextmanager
+def enabled() -> Iterator[None]:
+    """
+    Makes modules which are not part of the standard library
+    to be imported as stubs built from their syntax trees.
+
+    Only imports, ``if``/``try`` statements,
+    classes (with their bases & keywords), functions
+    & type aliases definitions are executed
+    with functions bodies replaced by ``pass``,
+    non-literal defaults replaced by ``...``
+    and decorators which are neither descriptors
+    nor signatures-related dropped.
+
+    Statements which cannot be executed this way
+    & dropped decorators get recorded in ``unresolved`` list.
+
+    Stubs get removed from ``sys.modules`` on exit,
+    so modules are imported for real afterwards.
+    """
+    finder = enable()
+    try:
+        yield
+    finally:
+        sys.meta_path.remove(finder)
+        purge()
+
+
+def enable() -> 'StubsFinder':
+    finder = StubsFinder()
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def purge() -> None:
+    """Removes stubs from ``sys.modules``."""
+    global purges_count
+    stubs_names = [name
+                   for name, module in list(sys.modules.items())
+                   if is_stub(module)]
+    for name in stubs_names:
+        del sys.modules[name]
+    if stubs_names:
+        purges_count += 1
+
+
+def is_enabled() -> bool:
+    return any(isinstance(finder, StubsFinder)
+               for finder in sys.meta_path)
+
+
+def is_stub(module: ModuleType) -> bool:
+    spec = getattr(module, '__spec__', None)
+    return isinstance(getattr(spec, 'loader', None), StubLoader)
+
+
+def is_standard(path: str) -> bool:
+    path = os.path.normcase(path)
+    if not path.startswith(STANDARD_LIBRARY_PATHS):
+        return False
+    directories_names = set(os.path.dirname(path).split(os.sep))
+    return not directories_names & SITE_DIRECTORIES_NAMES
+
+
+class StubsFinder(MetaPathFinder):
+    def find_spec(self,
+                  full_name: str,
+                  path: Optional[Sequence[str]],
+                  target: Optional[ModuleType] = None):
+        spec = PathFinder.find_spec(full_name, path)
+        if (spec is None
+                or not isinstance(spec.loader, SourceFileLoader)
+                or is_standard(spec.origin)):
+            return None
+        spec.loader = StubLoader(full_name, spec.origin)
+        return spec
+
+
+class StubLoader(SourceFileLoader):
+    def exec_module(self, module: ModuleType) -> None:
+        path = self.get_filename(self.name)
+
+        def record(error: Exception, line: int) -> Any:
+            reason = ('{cls}: {error}'
+                      .format(cls=type(error).__name__,
+                              error=error))
+            unresolved.append(UnresolvedStatement(path=path,
+                                                  line=line,
+                                                  reason=reason))
+            return Any
+
+        namespace = vars(module)
+        namespace[RECORDER_NAME] = record
+        try:
+            super().exec_module(module)
+        finally:
+            namespace.pop(RECORDER_NAME, None)
+
+    def get_code(self, full_name: str) -> CodeType:
+        # compiling directly to never write stubs into bytecode cache
+        path = self.get_filename(full_name)
+        source = self.get_source(full_name)
+        tree = arboretum.from_source(source,
+                                     file_name=path)
+        stubber = to_stubber(tree)
+        stub = to_stub(tree,
+                       stubber=stubber)
+        unresolved.extend(UnresolvedStatement(path=path,
+                                              line=line,
+                                              reason=reason)
+                          for line, reason in stubber.dropped)
+        return compile(stub, path, 'exec',
+                       dont_inherit=True)
+
+
+def to_stubber(tree: ast.Module) -> 'Stubber':
+    annotations_are_postponed = any(
+            alias.name == 'annotations'
+            for statement in filter(is_future_import, tree.body)
+            for alias in statement.names)
+    return Stubber(annotations_are_postponed=annotations_are_postponed)
+
+
+def to_stub(tree: ast.Module,
+            *,
+            stubber: Optional['Stubber'] = None) -> ast.Module:
+    if stubber is None:
+        stubber = to_stubber(tree)
+    future_statements = list(filter(is_future_import, tree.body))
+    statements = [statement
+                  for statement in tree.body
+                  if not is_future_import(statement)]
+    body = future_statements + stubber.stub_statements(statements)
+    return ast.fix_missing_locations(to_node(ast.Module,
+                                             body=body,
+                                             type_ignores=[]))
+
+
+def to_node(cls: Type[ast.AST], **fields: Any) -> ast.AST:
+    """
+    Creates node of given class
+    skipping fields which current ``Python`` version does not have
+    (like ``type_params`` available since ``Python3.12``).
+    """
+    return cls(**{name: value
+                  for name, value in fields.items()
+                  if name in cls._fields})
+
+
+class Stubber:
+    def __init__(self,
+                 *,
+                 annotations_are_postponed: bool) -> None:
+        self.annotations_are_postponed = annotations_are_postponed
+        self.annotations_indices = count()
+        # lines & reasons of dropped decorators
+        self.dropped = []
+
+    def stub_statements(self, statements: Iterable[ast.stmt]
+                        ) -> List[ast.stmt]:
+        result = []
+        for statement in statements:
+            result.extend(self.stub_statement(statement))
+        return result
+
+    def stub_statement(self, statement: ast.stmt) -> List[ast.stmt]:
+        if isinstance(statement, (ast.Import, ast.ImportFrom)):
+            return [guard(statement)]
+        elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return self.stub_function(statement)
+        elif isinstance(statement, ast.ClassDef):
+            return [self.stub_class(statement)]
+        elif isinstance(statement, ast.If):
+            return [guard(ast.copy_location(
+                    ast.If(test=statement.test,
+                           body=self.stub_block(statement.body),
+                           orelse=self.stub_statements(statement.orelse)),
+                    statement))]
+        elif isinstance(statement, ast.Try):
+            handlers = [ast.copy_location(
+                    ast.ExceptHandler(type=handler.type,
+                                      name=handler.name,
+                                      body=self.stub_block(handler.body)),
+                    handler)
+                for handler in statement.handlers]
+            return [guard(ast.copy_location(
+                    ast.Try(body=self.stub_block(statement.body),
+                            handlers=handlers,
+                            orelse=self.stub_statements(statement.orelse),
+                            finalbody=self.stub_statements(
+                                    statement.finalbody)),
+                    statement))]
+        elif isinstance(statement, ast.Assign):
+            if not is_type_like(statement.value):
+                return []
+            return [guard(statement)]
+        elif isinstance(statement, ast.AnnAssign):
+            if statement.value is not None and not is_type_like(
+                    statement.value):
+                # keeping default of fields (e.g. of dataclasses)
+                statement = ast.copy_location(
+                        ast.AnnAssign(target=statement.target,
+                                      annotation=statement.annotation,
+                                      value=to_stub_default(statement.value),
+                                      simple=statement.simple),
+                        statement)
+            return [guard(statement)]
+        elif isinstance(statement, ast.AugAssign):
+            if not is_literal(statement.value):
+                return []
+            return [guard(statement)]
+        return []
+
+    def stub_block(self, statements: Iterable[ast.stmt]) -> List[ast.stmt]:
+        return self.stub_statements(statements) or [ast.Pass()]
+
+    def stub_function(self, statement: ast.FunctionDef) -> List[ast.stmt]:
+        prelude = []
+        annotations_names = []
+
+        def stub_annotation(annotation: Optional[ast.expr]
+                            ) -> Optional[ast.expr]:
+            if annotation is None or self.annotations_are_postponed:
+                return annotation
+            name = ANNOTATION_NAME_TEMPLATE.format(
+                    index=next(self.annotations_indices))
+            prelude.append(guarded_assignment(name, annotation))
+            annotations_names.append(name)
+            return ast.copy_location(ast.Name(id=name,
+                                              ctx=ast.Load()),
+                                     annotation)
+
+        arguments = copy.copy(statement.args)
+        parameters = [*getattr(arguments, 'posonlyargs', []),
+                      *arguments.args,
+                      *filter(None, [arguments.vararg]),
+                      *arguments.kwonlyargs,
+                      *filter(None, [arguments.kwarg])]
+        for parameter in parameters:
+            parameter.annotation = stub_annotation(parameter.annotation)
+        arguments.defaults = list(map(to_stub_default, arguments.defaults))
+        arguments.kw_defaults = [None if default is None
+                                 else to_stub_default(default)
+                                 for default in arguments.kw_defaults]
+        decorators = self.stub_decorators(statement.decorator_list)
+        stub = ast.copy_location(
+                to_node(type(statement),
+                        name=statement.name,
+                        args=arguments,
+                        body=[ast.Pass()],
+                        decorator_list=decorators,
+                        returns=stub_annotation(statement.returns),
+                        type_comment=None,
+                        type_params=[]),
+                statement)
+        if decorators:
+            # in case of failing decorators
+            # function gets defined without them
+            fallback = copy.copy(stub)
+            fallback.decorator_list = []
+            stub = guard(stub,
+                         fallback=[fallback])
+        result = prelude + [stub]
+        if annotations_names:
+            result.append(ast.Delete(targets=[ast.Name(id=name,
+                                                       ctx=ast.Del())
+                                              for name in annotations_names]))
+        return result
+
+    def stub_class(self, statement: ast.ClassDef) -> ast.stmt:
+        body = self.stub_block(statement.body)
+        decorators = self.stub_decorators(statement.decorator_list)
+        stub = ast.copy_location(to_node(ast.ClassDef,
+                                         name=statement.name,
+                                         bases=statement.bases,
+                                         keywords=statement.keywords,
+                                         body=body,
+                                         decorator_list=decorators,
+                                         type_params=[]),
+                                 statement)
+        # in case of unresolvable bases, failing decorators
+        # or metaclass with stubbed methods which does not create class
+        # class gets defined without them
+        fallback = ast.copy_location(to_node(ast.ClassDef,
+                                             name=statement.name,
+                                             bases=[],
+                                             keywords=[],
+                                             body=copy.deepcopy(body),
+                                             decorator_list=[],
+                                             type_params=[]),
+                                     statement)
+        return guard(stub,
+                     checks=[to_class_check(statement)],
+                     fallback=[fallback])
+
+    def stub_decorators(self, decorators: Iterable[ast.expr]
+                        ) -> List[ast.expr]:
+        result = []
+        for decorator in decorators:
+            if (is_descriptor_decorator(decorator)
+                    or is_signature_decorator(decorator)):
+                result.append(decorator)
+                continue
+            reason = ('Decorator "{name}" is not applied.'
+                      .format(name=to_decorator_name(decorator)))
+            self.dropped.append((decorator.lineno, reason))
+        return result
+
+
+def guard(statement: ast.stmt,
+          *,
+          checks: Sequence[ast.stmt] = (),
+          fallback: Sequence[ast.stmt] = ()) -> ast.stmt:
+    """
+    Records errors raised by statement
+    (or by checks of its results) instead of propagating them.
+    """
+    record = ast.Expr(value=to_record_call(statement.lineno))
+    handler = ast.ExceptHandler(type=ast.Name(id=Exception.__name__,
+                                              ctx=ast.Load()),
+                                name=ERROR_NAME,
+                                body=[record, *fallback])
+    return ast.copy_location(ast.Try(body=[statement, *checks],
+                                     handlers=[handler],
+                                     orelse=[],
+                                     finalbody=[]),
+                             statement)
+
+
+def guarded_assignment(name: str, value: ast.expr) -> ast.stmt:
+    def assign(value: ast.expr) -> ast.stmt:
+        target = ast.Name(id=name,
+                          ctx=ast.Store())
+        return ast.copy_location(to_node(ast.Assign,
+                                         targets=[target],
+                                         value=value,
+                                         type_comment=None),
+                                 value)
+
+    handler = ast.ExceptHandler(type=ast.Name(id=Exception.__name__,
+                                              ctx=ast.Load()),
+                                name=ERROR_NAME,
+                                body=[assign(to_record_call(value.lineno))])
+    return ast.copy_location(ast.Try(body=[assign(value)],
+                                     handlers=[handler],
+                                     orelse=[],
+                                     finalbody=[]),
+                             value)
+
+
+def to_class_check(statement: ast.ClassDef) -> ast.stmt:
+    source = CLASS_CHECK_TEMPLATE.format(name=statement.name)
+    result, = arboretum.from_source(source).body
+    ast.increment_lineno(result, statement.lineno - 1)
+    return result
+
+
+def to_record_call(line: int) -> ast.expr:
+    return ast.Call(func=ast.Name(id=RECORDER_NAME,
+                                  ctx=ast.Load()),
+                    args=[ast.Name(id=ERROR_NAME,
+                                   ctx=ast.Load()),
+                          to_constant(line)],
+                    keywords=[])
+
+
+def to_constant(value: int) -> ast.expr:
+    # ``ast.Constant`` is produced by parser since ``Python3.8``
+    if sys.version_info < (3, 8):
+        return ast.Num(n=value)
+    return ast.Constant(value=value)
+
+
+def to_stub_default(default: ast.expr) -> ast.expr:
+    if is_literal(default):
+        return default
+    return ast.copy_location(ast.Name(id='Ellipsis',
+                                      ctx=ast.Load()),
+                             default)
+
+
+def is_future_import(statement: ast.stmt) -> bool:
+    return (isinstance(statement, ast.ImportFrom)
+            and statement.module == '__future__')
+
+
+def is_descriptor_decorator(decorator: ast.expr) -> bool:
+    if isinstance(decorator, ast.Name):
+        return decorator.id in DESCRIPTORS_DECORATORS_NAMES
+    elif isinstance(decorator, ast.Attribute):
+        return decorator.attr in DESCRIPTORS_DECORATORS_ATTRIBUTES
+    return False
+
+
+def is_signature_decorator(decorator: ast.expr) -> bool:
+    return to_decorator_name(decorator) in SIGNATURES_DECORATORS_NAMES
+
+
+def to_decorator_name(decorator: ast.expr) -> Optional[str]:
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    elif isinstance(decorator, ast.Attribute):
+        return decorator.attr
+    return None
+
+
+def is_type_like(node: ast.expr) -> bool:
+    if isinstance(node, (ast.Name, ast.Attribute, ast.Subscript)):
+        return True
+    elif isinstance(node, ast.Call):
+        function = node.func
+        if isinstance(function, ast.Name):
+            return function.id in TYPES_FACTORIES_NAMES
+        elif isinstance(function, ast.Attribute):
+            return function.attr in TYPES_FACTORIES_NAMES
+        return False
+    return is_literal(node)
+
+
+def is_literal(node: ast.expr) -> bool:
+    try:
+        ast.literal_eval(node)
+    except (TypeError, ValueError):
+        return False
+    else:
+        return True
@@ -9,11 +9,12 @@ from typing import (Iterable,
 
 from . import (functions,
                catalog,
+               formatting,
                namespaces,
+               phases,
                strings,
                file_system)
 from .types import NamespaceType
-from .utils import fix_code
 
 PARAMETER_TEMPLATE = '{parameter}: {annotation}'
 DEFINITION_TEMPLATE = 'def test_{function}({parameters}) -> None:\n'
@@ -24,6 +25,7 @@ NONE_RETURN_TYPE_CHECK_TEMPLATE = '{result} is None'
 ASSERTION_TEMPLATE = 'assert {statement}\n'
 
 
+@phases.measures(phases.RENDERING)
 def from_functions(module_functions: Iterable[FunctionType],
                    *,
                    namespace: NamespaceType,
@@ -39,7 +41,7 @@ def from_functions(module_functions: Iterable[FunctionType],
                                 namespace=namespace)
     test_cases = map(test_case_factory, module_functions)
     code_blocks = chain(imports, test_cases)
-    return fix_code(''.join(code_blocks))
+    return formatting.fix_code(''.join(code_blocks))
 
 
 def from_function(function: FunctionType,
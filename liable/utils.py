@@ -1,15 +1,22 @@
+import io
 import operator
 import os
-from functools import partial
+import stat
+import tokenize
+from functools import lru_cache
+from importlib.machinery import SOURCE_SUFFIXES
 from itertools import chain
 from typing import (Any,
                     Hashable,
                     Mapping)
 
-import autopep8
-
 from . import arboretum
 
+SOURCE_EXTENSIONS = tuple(SOURCE_SUFFIXES)
+SHEBANG_PREFIX = b'#!'
+INTERPRETER_NAME = b'python'
+HEAD_SIZE = 8192
+
 
 def to_name(object_: Any) -> str:
     try:
@@ -21,28 +28,92 @@ def to_name(object_: Any) -> str:
             return str(object_)
 
 
-def is_python_module(path: str) -> bool:
-    if not os.path.isfile(path):
+def is_python_module(path: str,
+                     *,
+                     strict: bool = True) -> bool:
+    """
+    Checks if given file is a Python module:
+    it should have source extension or Python shebang
+    with decodable & tokenizable head,
+    in strict mode its whole source should also compile.
+
+    Results are cached by stat signature of file.
+    """
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return False
+    if not stat.S_ISREG(file_stat.st_mode):
         return False
-    with open(path) as source_file:
+    return is_python_file(os.path.abspath(path),
+                          modification_time=file_stat.st_mtime_ns,
+                          size=file_stat.st_size,
+                          strict=strict)
+
+
+@lru_cache(maxsize=None)
+def is_python_file(path: str,
+                   *,
+                   modification_time: int,
+                   size: int,
+                   strict: bool) -> bool:
+    if strict:
+        if not is_python_file(path,
+                              modification_time=modification_time,
+                              size=size,
+                              strict=False):
+            return False
         try:
-            source = source_file.read()
-        except UnicodeDecodeError:
+            arboretum.from_path(path)
+        except (UnicodeDecodeError, SyntaxError, ValueError):
+            # undecodable, invalid or containing null bytes source
             return False
+        else:
+            return True
+    try:
+        with open(path, mode='rb') as file:
+            head = file.read(HEAD_SIZE)
+    except OSError:
+        return False
+    if not (path.endswith(SOURCE_EXTENSIONS) or has_python_shebang(head)):
+        return False
+    return is_python_head(head,
+                          complete=size <= HEAD_SIZE)
+
+
+def has_python_shebang(head: bytes) -> bool:
+    first_line = head.split(b'\n', 1)[0]
+    return (first_line.startswith(SHEBANG_PREFIX)
+            and INTERPRETER_NAME in first_line)
+
+
+def is_python_head(head: bytes,
+                   *,
+                   complete: bool) -> bool:
+    if b'\0' in head:
+        return False
+    lines = head.splitlines(keepends=True)
+    if not complete:
+        # last line may be truncated
+        lines = lines[:-1]
+    try:
+        encoding, _ = tokenize.detect_encoding(iter(lines).__next__)
+        source = b''.join(lines).decode(encoding)
+    except (SyntaxError, UnicodeDecodeError):
+        return False
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
     try:
-        arboretum.from_source(source,
-                              file_name=path)
+        for _ in tokens:
+            pass
+    except tokenize.TokenError:
+        # statement or string literal is not finished,
+        # which is fine only if it continues after the head
+        return not complete
     except SyntaxError:
         return False
-    else:
-        return True
+    return True
 
 
 def merge_mappings(*mappings: Mapping[Hashable, Any]) -> dict:
     items = chain.from_iterable(map(operator.methodcaller('items'), mappings))
     return dict(items)
-
-
-fix_code = partial(autopep8.fix_code,
-                   options={'aggressive': True,
-                            'max_line_length': 79})
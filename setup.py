@@ -1,5 +1,8 @@
+import warnings
+
 from setuptools import (setup,
                         find_packages)
+from setuptools.command.build_py import build_py
 
 project_base_url = 'https://github.com/lycantropos/liable/'
 
@@ -22,8 +25,25 @@ tests_require = [
     'hypothesis>=3.38.5',
 ]
 
+
+class BuildWithLexicon(build_py):
+    """Builds nouns lexicon to ship it instead of WordNet lookups."""
+
+    def run(self):
+        from liable import lexicon
+
+        try:
+            lexicon.build()
+        except (ImportError, LookupError) as err:
+            # WordNet will be used at runtime instead
+            warnings.warn('Nouns lexicon was not built: {error}'
+                          .format(error=err))
+        super().run()
+
+
 setup(name='liable',
       packages=find_packages(exclude=('tests',)),
+      package_data={'liable': ['data/*.txt']},
       version='0.0.3',
       description='Auto-tests generator.',
       long_description=open('README.rst').read(),
@@ -34,4 +54,5 @@ setup(name='liable',
       setup_requires=setup_requires,
       install_requires=install_requires,
       tests_require=tests_require,
+      cmdclass={'build_py': BuildWithLexicon},
       entry_points={'console_scripts': ['liable = liable.liable:main']})
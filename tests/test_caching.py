@@ -0,0 +1,116 @@
+import os
+import sys
+from types import ModuleType
+
+from click.testing import CliRunner
+
+from liable import (caching,
+                    catalog)
+from liable.liable import main
+
+MODULE_SOURCE = '''
+def to_square(base: int) -> int:
+    return base * base
+
+
+def make_shifter():
+    def shift(value: int) -> int:
+        return value + 1
+
+    return shift
+
+
+shift = make_shifter()
+'''
+
+
+def test_static_entries_are_not_used_in_import_mode(tmpdir) -> None:
+    directory = str(tmpdir)
+    module_name = 'cached_' + os.path.basename(directory).replace('-', '_')
+    module_path = os.path.join(directory, module_name + '.py')
+    with open(module_path, mode='w') as module_file:
+        module_file.write(MODULE_SOURCE)
+    cache_directory = os.path.join(directory, 'cache')
+    sys.path.append(directory)
+    try:
+        static_source = generate_test_cases(module_path,
+                                            '--static',
+                                            '--cache-dir', cache_directory,
+                                            directory=directory)
+        imported_source = generate_test_cases(module_path,
+                                              '--cache-dir', cache_directory,
+                                              directory=directory)
+        uncached_source = generate_test_cases(module_path,
+                                              '--no-cache',
+                                              directory=directory)
+    finally:
+        sys.path.remove(directory)
+        sys.modules.pop(module_name, None)
+
+    # stubs do not execute assignments of calls results
+    assert 'test_shift' not in static_source
+    assert imported_source == uncached_source
+    assert 'test_shift' in imported_source
+
+
+def generate_test_cases(module_path: str,
+                        *options: str,
+                        directory: str) -> str:
+    target_directory = os.path.join(directory, 'target')
+    os.makedirs(target_directory,
+                exist_ok=True)
+    arguments = ['tests',
+                 '--target-directory', target_directory,
+                 '--overwrite',
+                 '--formatter', 'none',
+                 *options,
+                 module_path]
+    result = CliRunner().invoke(main, arguments,
+                                catch_exceptions=False)
+    assert result.exit_code == 0, result.output
+    return read_sources(target_directory)
+
+
+def read_sources(directory: str) -> str:
+    sources = []
+    for root, _, files_names in sorted(os.walk(directory)):
+        for file_name in sorted(files_names):
+            if file_name.startswith('test_'):
+                with open(os.path.join(root, file_name)) as file:
+                    sources.append(file.read())
+    return ''.join(sources)
+
+
+def test_entries_are_not_used_on_module_roots_change(tmpdir) -> None:
+    directory = str(tmpdir)
+    package_path = os.path.join(directory, 'package')
+    os.makedirs(package_path)
+    module_path = os.path.join(package_path, 'shifts.py')
+    with open(module_path, mode='w') as module_file:
+        module_file.write(MODULE_SOURCE)
+    module = ModuleType('package.shifts')
+    module.__file__ = module_path
+    objects_paths = [catalog.ContentPath(
+            module=catalog.name_to_module_path(module.__name__),
+            object='to_square',
+            type=catalog.PathType.inner)]
+    previous_directory = caching.directory
+    caching.set_directory(os.path.join(directory, 'cache'))
+    sys.path.append(directory)
+    try:
+        caching.save(module,
+                     dependent_objects_paths=[],
+                     inner_objects_paths=objects_paths)
+        cached = caching.load(module)
+        # module becomes top-level one
+        sys.path.append(package_path)
+        try:
+            rooted = caching.load(module)
+        finally:
+            sys.path.remove(package_path)
+    finally:
+        sys.path.remove(directory)
+        caching.set_directory(previous_directory)
+
+    assert cached == ([], objects_paths)
+    assert rooted is None
@@ -0,0 +1,91 @@
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import closing
+
+from liable import daemon
+
+STOP_COMMAND = 'stop'
+STARTUP_TIMEOUT = 5.
+
+
+class Stopped(Exception):
+    pass
+
+
+def test_malformed_requests_do_not_stop_daemon(tmpdir) -> None:
+    socket_path = os.path.join(str(tmpdir), 'daemon.sock')
+    server = threading.Thread(target=serve,
+                              args=(socket_path,),
+                              daemon=True)
+    server.start()
+    wait_socket(socket_path)
+    try:
+        send_raw(socket_path, b'',
+                 expects_response=False)
+        garbage_response = send_raw(socket_path, b'garbage\n')
+        incomplete_response = daemon.request(socket_path,
+                                             {'directory': '.'})
+        response = daemon.request(socket_path,
+                                  {'arguments': ['tests'],
+                                   'directory': '.'})
+    finally:
+        stop_request = json.dumps({'arguments': [STOP_COMMAND],
+                                   'directory': '.'}) + '\n'
+        send_raw(socket_path, stop_request.encode(),
+                 expects_response=False)
+        server.join()
+
+    assert garbage_response['status'] == daemon.INVALID_REQUEST_STATUS
+    assert incomplete_response['status'] == daemon.INVALID_REQUEST_STATUS
+    assert response == {'status': 0,
+                        'output': 'tests'}
+
+
+def serve(socket_path: str) -> None:
+    try:
+        daemon.serve(socket_path,
+                     handle=handle,
+                     report=report)
+    except Stopped:
+        return
+
+
+def handle(request: daemon.RequestType) -> daemon.ResponseType:
+    arguments = request['arguments']
+    if arguments == [STOP_COMMAND]:
+        raise Stopped()
+    return {'status': 0,
+            'output': ' '.join(arguments)}
+
+
+def report(response: daemon.ResponseType) -> None:
+    return
+
+
+def wait_socket(path: str) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while True:
+        try:
+            send_raw(path, b'',
+                     expects_response=False)
+        except OSError:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        else:
+            return
+
+
+def send_raw(socket_path: str,
+             payload: bytes,
+             *,
+             expects_response: bool = True) -> daemon.ResponseType:
+    with closing(socket.socket(socket.AF_UNIX,
+                               socket.SOCK_STREAM)) as client:
+        client.connect(socket_path)
+        client.sendall(payload)
+        if not expects_response:
+            return {}
+        return daemon.receive(client)
@@ -0,0 +1,93 @@
+import os
+import sys
+
+from click.testing import CliRunner
+
+from liable import manifests
+from liable.liable import main
+
+
+def test_utilities_are_regenerated_on_module_removal(tmpdir) -> None:
+    directory = str(tmpdir)
+    prefix = os.path.basename(directory).replace('-', '_')
+    kept_module_path = write_module(directory, prefix + '_kept',
+                                    'def kept(alpha: int) -> int:\n'
+                                    '    return alpha\n')
+    removed_module_path = write_module(directory, prefix + '_removed',
+                                       'def removed(beta: str) -> str:\n'
+                                       '    return beta\n')
+    target_directory = os.path.join(directory, 'target')
+    os.makedirs(target_directory)
+    sys.path.append(directory)
+    try:
+        initial_source = generate_utilities(kept_module_path,
+                                            removed_module_path,
+                                            directory=target_directory)
+        source = generate_utilities(kept_module_path,
+                                    directory=target_directory)
+    finally:
+        sys.path.remove(directory)
+        sys.modules.pop(prefix + '_kept', None)
+        sys.modules.pop(prefix + '_removed', None)
+
+    assert 'beta' in initial_source
+    assert 'alpha' in source
+    assert 'beta' not in source
+
+
+def write_module(directory: str, name: str, source: str) -> str:
+    result = os.path.join(directory, name + '.py')
+    with open(result, mode='w') as module_file:
+        module_file.write(source)
+    return result
+
+
+def generate_utilities(*modules_paths: str,
+                       directory: str) -> str:
+    arguments = ['utilities',
+                 '--target-directory', directory,
+                 '--overwrite',
+                 '--incremental',
+                 '--no-cache',
+                 '--formatter', 'none',
+                 *modules_paths]
+    result = CliRunner().invoke(main, arguments,
+                                catch_exceptions=False)
+    assert result.exit_code == 0, result.output
+    sources = []
+    for root, _, files_names in sorted(os.walk(directory)):
+        for file_name in sorted(files_names):
+            if file_name.endswith('.py'):
+                with open(os.path.join(root, file_name)) as file:
+                    sources.append(file.read())
+    return ''.join(sources)
+
+
+def test_modules_are_stale_on_not_given_dependency_change(tmpdir) -> None:
+    directory = str(tmpdir)
+    prefix = os.path.basename(directory).replace('-', '_')
+    base_module_path = write_module(directory, prefix + '_base',
+                                    'BASE = 1\n')
+    write_module(directory, prefix + '_middle',
+                 'from {base} import BASE\n'.format(base=prefix + '_base'))
+    module_path = write_module(directory, prefix + '_top',
+                               'import {middle}\n'
+                               .format(middle=prefix + '_middle'))
+    sys.path.append(directory)
+    try:
+        recorded = manifests.to_entries([module_path],
+                                        recorded={})
+        unchanged = manifests.to_entries([module_path],
+                                         recorded=recorded)
+        write_module(directory, prefix + '_base',
+                     'BASE = 2\n')
+        changed = manifests.to_entries([module_path],
+                                       recorded=recorded)
+    finally:
+        sys.path.remove(directory)
+
+    assert base_module_path in recorded[module_path]['dependencies']
+    assert not manifests.stale_modules_paths(unchanged,
+                                             recorded=recorded)
+    assert manifests.stale_modules_paths(changed,
+                                         recorded=recorded) == {module_path}
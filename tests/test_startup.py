@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+from typing import (List,
+                    Tuple)
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(__file__))
+# modules which are needed only for generation
+HEAVY_MODULES_NAMES = {'autopep8', 'hypothesis', 'inflect',
+                       'nltk', 'pathspec', 'pytest', '_pytest'}
+# seconds to import modules needed by command which does not generate code
+STARTUP_TIME_BUDGET = 0.15
+IMPORT_TIME_PREFIX = 'import time:'
+MICROSECONDS_IN_SECOND = 10 ** 6
+
+
+def test_heavy_modules_are_not_imported() -> None:
+    imports_times = run_modules_help()
+
+    top_modules_names = {name.split('.')[0]
+                         for name, _, _ in imports_times}
+    assert not top_modules_names & HEAVY_MODULES_NAMES
+
+
+def test_startup_time() -> None:
+    imports_times = run_modules_help()
+
+    # nested imports are included in cumulative times of top-level ones
+    assert sum(cumulative_time
+               for _, cumulative_time, depth in imports_times
+               if not depth) < STARTUP_TIME_BUDGET
+
+
+def run_modules_help() -> List[Tuple[str, float, int]]:
+    """
+    Returns names, cumulative import times in seconds & nesting depths
+    of modules imported by ``modules --help`` command
+    reported by ``-X importtime``.
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime',
+                              '-m', 'liable.liable', 'modules', '--help'],
+                             cwd=PROJECT_DIRECTORY,
+                             stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE,
+                             universal_newlines=True)
+    assert process.returncode == 0, process.stderr
+    result = []
+    for line in process.stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        _, cumulative, name = line[len(IMPORT_TIME_PREFIX):].split('|')
+        if not cumulative.strip().isdigit():
+            # header
+            continue
+        # nested imports are indented by two spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        result.append((name.strip(),
+                       int(cumulative) / MICROSECONDS_IN_SECOND,
+                       depth))
+    return result
@@ -0,0 +1,58 @@
+import importlib
+import os
+import sys
+
+from liable import (annotator,
+                    namespaces,
+                    strategies)
+
+MODULE_SOURCE = '''
+class Parent:
+    def __init__(self, child: 'Child' = None) -> None:
+        self.child = child
+
+
+class Child:
+    def __init__(self, parent: Parent) -> None:
+        self.parent = parent
+
+
+Parent.__init__.__annotations__['child'] = Child
+'''
+
+
+def test_templates_do_not_depend_on_expansion_order(tmpdir) -> None:
+    directory = str(tmpdir)
+    suffix = os.path.basename(directory).replace('-', '_')
+    module_name = 'cyclic_' + suffix
+    with open(os.path.join(directory, module_name + '.py'),
+              mode='w') as module_file:
+        module_file.write(MODULE_SOURCE)
+    sys.path.append(directory)
+    try:
+        module = importlib.import_module(module_name)
+    finally:
+        sys.path.remove(directory)
+    namespace = namespaces.merge(namespaces.from_module(module),
+                                 strategies.utilities)
+
+    def to_definitions(*types_names: str) -> dict:
+        strategies.clear_templates_cache()
+        result = {}
+        for type_name in types_names:
+            strategy_name = type_name.lower() + 's'
+            annotation = annotator.normalize(getattr(module, type_name))
+            template = strategies.to_template(annotation,
+                                              strategy_name=strategy_name)
+            result[strategy_name] = template.to_string(namespace)
+        return result
+
+    try:
+        parent_first = to_definitions('Parent', 'Child')
+        child_first = to_definitions('Child', 'Parent')
+    finally:
+        strategies.clear_templates_cache()
+
+    assert parent_first == child_first
+    assert 'lambda: parents' in parent_first['parents']
+    assert 'lambda: childs' in parent_first['childs']
@@ -0,0 +1,36 @@
+import importlib
+import os
+import sys
+
+from liable import stubs
+
+MODULE_SOURCE = '''
+class Meta(type):
+    def __new__(mcs, name, bases, namespace):
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class Base(metaclass=Meta):
+    def method(self, value: int) -> int:
+        return value
+'''
+
+
+def test_classes_of_stubbed_metaclasses_are_reported(tmpdir) -> None:
+    directory = str(tmpdir)
+    suffix = os.path.basename(directory).replace('-', '_')
+    module_name = 'metaclassed_' + suffix
+    with open(os.path.join(directory, module_name + '.py'),
+              mode='w') as module_file:
+        module_file.write(MODULE_SOURCE)
+    del stubs.unresolved[:]
+    sys.path.append(directory)
+    try:
+        with stubs.enabled():
+            module = importlib.import_module(module_name)
+    finally:
+        sys.path.remove(directory)
+
+    assert isinstance(module.Base, type)
+    assert hasattr(module.Base, 'method')
+    assert [statement.line for statement in stubs.unresolved] == [7]